@@ -0,0 +1,63 @@
+import argparse
+import logging
+import sys
+import traceback
+
+from simulation.world import World
+from simulation.climate import TRANSPORT_SUBSTEPS
+from simulation.utils.logging_config import get_logger, setup_logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Time the whole-globe climate transport step and update against the tick budget."
+    )
+    parser.add_argument("--repeats", type=int, default=100, help="Timed calls per measurement")
+    parser.add_argument("--substeps", type=int, default=TRANSPORT_SUBSTEPS, help="Transport substeps per update")
+    parser.add_argument("--time-delta", type=float, default=60.0,
+                        help="Climate time per update (the scheduled climate dt)")
+    parser.add_argument("--seed", type=int, default=0, help="World seed; seeded worlds reuse cached generation")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    setup_logging()
+    logging.disable(logging.INFO)
+    logger = get_logger(__name__)
+
+    try:
+        world = World(logger, use_redis=False, seed=args.seed)
+    except Exception as e:
+        logger.error(f"Error creating world: {e}")
+        logger.error(traceback.format_exc())
+        return 1
+
+    climate = world.climate
+    climate.transport_substeps = args.substeps
+    profiler = world.profiler
+    for _ in range(args.repeats):
+        with profiler.section('climate_transport'):
+            climate.transport(climate.temperature_map, climate.precipitation_map,
+                              climate.wind_speed_map, climate.wind_direction_map, args.time_delta)
+    for _ in range(args.repeats):
+        with profiler.section('climate_update'):
+            climate.update(args.time_delta)
+
+    budget_ms = profiler.budget * 1000.0
+    print(f"Grid: {climate.grid.shape[0]}x{climate.grid.shape[1]} cells at "
+          f"{climate.grid.longitude_resolution:g}°, {args.substeps} substeps")
+    print(f"{'section':<20}{'calls':>8}{'p50_ms':>10}{'p95_ms':>10}{'max_ms':>10}{'budget_ms':>11}")
+    sections = profiler.get_stats()["sections"]
+    within = True
+    for name in ('climate_transport', 'climate_update'):
+        stats = sections[name]
+        within = within and stats['p95_ms'] <= budget_ms
+        print(f"{name:<20}{stats['calls']:>8}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+              f"{stats['max_ms']:>10.2f}{budget_ms:>11.2f}")
+    print("Within tick budget" if within else "Over tick budget")
+    return 0 if within else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import argparse
+import logging
+import sys
+import time
+import traceback
+
+from simulation.world import World
+from simulation.lod import LODConfig
+from simulation.keyframes import KeyframeConfig
+from simulation.utils.logging_config import get_logger, setup_logging
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Run the simulation headless as fast as possible (no web server, no Redis, no sleeping)."
+    )
+    span = parser.add_mutually_exclusive_group(required=True)
+    span.add_argument("--ticks", type=int, help="Number of ticks (game seconds) to run")
+    span.add_argument("--hours", type=float, help="Game hours to run")
+    span.add_argument("--days", type=float, help="Game days to run")
+    parser.add_argument("--seed", type=int, help="Seed all random streams for a reproducible run")
+    parser.add_argument("--resolution", type=float,
+                        help="Grid resolution in degrees for a new world (default 1; finer grids are memory-mapped)")
+    parser.add_argument("--lod", action="store_true",
+                        help="Refine terrain around agents and settlements with level-of-detail tiles")
+    parser.add_argument("--climate-keyframes", action="store_true",
+                        help="Compute climate hourly on a worker thread and interpolate between keyframes")
+    parser.add_argument("--load", action="store_true", help="Continue from the current saved world instead of a new one")
+    parser.add_argument("--save", action="store_true", help="Save the world when the run finishes (for pre-aging)")
+    parser.add_argument("--report-every", type=int, default=0, help="Log progress every N ticks (0 disables)")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest systems to list in the summary")
+    parser.add_argument("--verbose", action="store_true", help="Keep per-tick INFO logging enabled")
+    return parser.parse_args()
+
+
+def get_tick_count(args) -> int:
+    """Convert the requested span into ticks; one tick is one game second."""
+    if args.ticks is not None:
+        return args.ticks
+    if args.hours is not None:
+        return int(args.hours * 3600)
+    return int(args.days * 86400)
+
+
+def print_summary(world: World, ticks: int, elapsed: float, top: int):
+    """Print throughput and the slowest systems."""
+    ticks_per_second = ticks / elapsed if elapsed > 0 else float("inf")
+    print(f"Seed: {world.rng.seed} (world seed {world.rng.world_seed})")
+    print(f"Ran {ticks} ticks ({ticks / 86400:.3f} game days) in {elapsed:.2f}s")
+    print(f"Throughput: {ticks_per_second:.2f} ticks/s ({ticks_per_second / world.time_scale:.2f}x real-time speed)")
+
+    sections = world.profiler.get_stats()["sections"]
+    sections.pop("tick", None)
+    slowest = sorted(sections.items(), key=lambda item: item[1]["total_s"], reverse=True)[:top]
+    if slowest:
+        print(f"{'system':<16}{'calls':>8}{'total_s':>10}{'mean_ms':>10}{'p95_ms':>10}")
+        for name, stats in slowest:
+            print(f"{name:<16}{stats['calls']:>8}{stats['total_s']:>10.2f}{stats['mean_ms']:>10.2f}{stats['p95_ms']:>10.2f}")
+
+
+def main():
+    args = parse_args()
+    setup_logging()
+    if not args.verbose:
+        # World.update logs every tick; that alone would dominate a fast run
+        logging.disable(logging.INFO)
+    logger = get_logger(__name__)
+
+    ticks = get_tick_count(args)
+    try:
+        lod = LODConfig() if args.lod else None
+        keyframes = KeyframeConfig() if args.climate_keyframes else None
+        world = World.load_from_save(logger, use_redis=False, seed=args.seed, resolution=args.resolution,
+                                     lod=lod, climate_keyframes=keyframes) if args.load else None
+        if world is None:
+            world = World(logger, use_redis=False, seed=args.seed, resolution=args.resolution or 1.0, lod=lod,
+                          climate_keyframes=keyframes)
+            world.spawn_initial_agents()
+    except Exception as e:
+        logger.error(f"Error creating world: {e}")
+        logger.error(traceback.format_exc())
+        return 1
+
+    completed = 0
+    start = time.perf_counter()
+    try:
+        for completed in range(1, ticks + 1):
+            world.update(1)
+            if args.report_every and completed % args.report_every == 0:
+                rate = completed / (time.perf_counter() - start)
+                logger.warning(f"Tick {completed}/{ticks} ({rate:.2f} ticks/s)")
+    except KeyboardInterrupt:
+        # Stop early but still report and save what was simulated
+        completed = max(0, completed - 1)
+        logger.warning(f"Interrupted after {completed} ticks")
+    elapsed = time.perf_counter() - start
+
+    if args.save:
+        # Run systems on longer periods for their leftover time, so the save is up to date
+        world.scheduler.flush()
+        world._save_state()
+        logger.warning(f"Saved world at tick {world.current_tick}")
+
+    print_summary(world, completed, elapsed, args.top)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -22,9 +22,10 @@ from .memory import Memory
 from .moral_alignment import MoralAlignment
 from .social_state import SocialState
 from .crisis_state import CrisisState
-from .identification import IdentificationSystem
+from .identification import IDENTIFY_RADIUS_KM, IdentificationSystem
 from .utils.logging_config import get_logger
 from .cooking import FoodType
+from .recipes import Inventory
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -538,7 +539,7 @@ class Agent:
     philosophy: Philosophy = field(default_factory=Philosophy)
     longitude: float = 0.0
     latitude: float = 0.0
-    inventory: Dict[str, float] = field(default_factory=dict)
+    inventory: Dict[str, float] = field(default_factory=Inventory)
     skills: Dict[str, float] = field(default_factory=dict)
     relationships: Dict[str, Relationship] = field(default_factory=dict)
     tribe_id: Optional[str] = None
@@ -565,7 +566,7 @@ class Agent:
         self.philosophy = philosophy or Philosophy()
         self.longitude = longitude
         self.latitude = latitude
-        self.inventory = {}
+        self.inventory = Inventory()
         self.skills = {}
         self.relationships = {}
         self.tribe_id = None
@@ -578,15 +579,15 @@ class Agent:
     def update(self, time_delta: float, world_state: Dict):
         """Update agent state."""
         # Update identification system
-        self.identification.update_identifiers(world_state)
-        
-        # Update known identifiers from interactions
-        nearby_agents = world_state.get("agents", {})
-        for agent_id, agent in nearby_agents.items():
-            if agent_id != self.id:
-                identifier = agent.identification.get_identifier(self.id)
-                if identifier:
-                    self.known_identifiers[agent_id] = identifier
+        self.identification.update_identifiers(world_state, self.world.agents)
+        
+        # Update known identifiers from interactions with agents in sight; the
+        # state dicts in world_state carry no identification, so use the agents
+        for agent in self._get_nearby_agents(IDENTIFY_RADIUS_KM):
+            identification = getattr(agent, "identification", None)
+            identifier = identification.get_identifier(self.id) if identification else None
+            if identifier:
+                self.known_identifiers[agent.id] = identifier
 
         # Continue with existing update logic
         self.age += time_delta / (365 * 24 * 3600)  # Convert seconds to years
@@ -847,15 +848,15 @@ class Agent:
         if not resource_system:
             return nearby_resources
             
-        # Get all resources from the resource system
-        resources = resource_system.get_all_resources()
-        
-        for resource in resources:
-            # Calculate distance to resource
-            distance = self._calculate_distance(self.position, resource["position"])
-            
-            if distance <= max_distance:
-                nearby_resources.append(resource)
+        # Ask the resource system's deposit index for everything in range
+        for resource in resource_system.find_resources(self.longitude, self.latitude, max_distance):
+            nearby_resources.append({
+                "type": resource.type.value,
+                "amount": resource.amount,
+                "longitude": resource.longitude,
+                "latitude": resource.latitude,
+                "position": (resource.longitude, resource.latitude)
+            })
                 
         return nearby_resources
 
@@ -1807,15 +1808,11 @@ class Agent:
 
     def _get_nearby_agents(self, world_state: Dict, max_distance: float = 50.0) -> List[Dict]:
         """Get all agents within max_distance of this agent's position."""
-        nearby_agents = []
+        agents = world_state.get("agents", {})
         
-        for agent_id, agent in world_state.get("agents", {}).items():
-            if agent_id != self.id:  # Don't include self
-                distance = self._calculate_distance(agent["longitude"], agent["latitude"])
-                if distance <= max_distance:
-                    nearby_agents.append(agent)
-                    
-        return nearby_agents
+        # Ask the agent system's spatial hash for everyone in range, nearest first
+        nearby = self.world.agents.find_agents(self.longitude, self.latitude, max_distance, exclude=self.id)
+        return [agents[agent.id] for agent in nearby if agent.id in agents]
         
     def _calculate_distance(self, other_longitude: float, other_latitude: float) -> float:
         """Calculate distance between two points using the Haversine formula."""
@@ -1858,15 +1855,15 @@ class Agent:
         if not resource_system:
             return nearby_resources
             
-        # Get all resources from the resource system
-        resources = resource_system.get_all_resources()
-        
-        for resource in resources:
-            # Calculate distance to resource
-            distance = self._calculate_distance(resource["longitude"], resource["latitude"])
-            
-            if distance <= max_distance:
-                nearby_resources.append(resource)
+        # Ask the resource system's deposit index for everything in range
+        for resource in resource_system.find_resources(self.longitude, self.latitude, max_distance):
+            nearby_resources.append({
+                "type": resource.type.value,
+                "amount": resource.amount,
+                "longitude": resource.longitude,
+                "latitude": resource.latitude,
+                "position": (resource.longitude, resource.latitude)
+            })
                 
         return nearby_resources
 
@@ -2720,22 +2717,8 @@ class Agent:
 
     def _get_nearby_agents(self, radius: float) -> List['Agent']:
         """Get all agents within radius"""
-        nearby = []
-        for agent in self.world.agents.values():
-            if agent.id != self.id:
-                distance = self._calculate_distance(agent)
-                if distance <= radius:
-                    nearby.append(agent)
-        return nearby
+        return self.world.agents.find_agents(self.longitude, self.latitude, radius, exclude=self.id)
 
     def _get_nearby_resources(self, radius: float) -> List[Resource]:
         """Get all resources within radius"""
-        nearby = []
-        for resource in self.world.resources.get_resources():
-            distance = self.world.get_distance(
-                self.longitude, self.latitude,
-                resource.longitude, resource.latitude
-            )
-            if distance <= radius:
-                nearby.append(resource)
-        return nearby
+        return self.world.resources.find_resources(self.longitude, self.latitude, radius)
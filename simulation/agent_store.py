@@ -0,0 +1,132 @@
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Mapping
+import numpy as np
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Numeric per-agent state kept as float64 columns
+COLUMNS = ('health', 'energy', 'hunger', 'thirst', 'longitude', 'latitude')
+INITIAL_CAPACITY = 64
+
+
+class AgentStore:
+    """Core agent state in columns indexed by a dense slot.
+
+    Slots ``0..count-1`` are live; removing an agent moves the last row into its
+    slot, so whole-population rules are plain operations on ``column[:count]``.
+    Skills are a (slots, skills) matrix with NaN where an agent lacks a skill.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY):
+        capacity = max(1, capacity)
+        self.count = 0
+        for name in COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype=np.float64))
+        self.last_action = np.full(capacity, None, dtype=object)
+        self.skill_names: List[str] = []
+        self.skill_index: Dict[str, int] = {}
+        self.skills = np.full((capacity, 0), np.nan, dtype=np.float64)
+        self.owners: List[Any] = []  # Object viewing each live slot; it must have a ``_slot`` attribute
+
+    @property
+    def capacity(self) -> int:
+        return len(self.health)
+
+    def add(self, owner: Any, values: Mapping[str, Any], skills: Mapping[str, float]) -> int:
+        """Append a row for ``owner`` and return its slot."""
+        if self.count == self.capacity:
+            self._grow(2 * self.capacity)
+        slot = self.count
+        for name in COLUMNS:
+            getattr(self, name)[slot] = values[name]
+        self.last_action[slot] = values.get('last_action')
+        self.skills[slot] = np.nan
+        for name, level in skills.items():
+            k = self.skill_column(name)
+            self.skills[slot, k] = level
+        self.owners.append(owner)
+        self.count += 1
+        return slot
+
+    def remove(self, slot: int) -> None:
+        """Free a slot, moving the last live row into it."""
+        last = self.count - 1
+        if slot != last:
+            for name in COLUMNS:
+                column = getattr(self, name)
+                column[slot] = column[last]
+            self.last_action[slot] = self.last_action[last]
+            self.skills[slot] = self.skills[last]
+            self.owners[slot] = self.owners[last]
+            self.owners[slot]._slot = slot
+        self.owners.pop()
+        self.last_action[last] = None
+        self.count = last
+
+    def row(self, slot: int) -> Dict[str, Any]:
+        """Values of one slot keyed by column name."""
+        values = {name: float(getattr(self, name)[slot]) for name in COLUMNS}
+        values['last_action'] = self.last_action[slot]
+        return values
+
+    def skill_row(self, slot: int) -> Dict[str, float]:
+        """Skills an agent has, by name."""
+        levels = self.skills[slot]
+        return {name: float(levels[k]) for k, name in enumerate(self.skill_names) if not np.isnan(levels[k])}
+
+    def skill_column(self, name: str) -> int:
+        """Column of a skill, adding one (NaN for every agent) the first time a name is seen."""
+        k = self.skill_index.get(name)
+        if k is None:
+            k = len(self.skill_names)
+            self.skill_names.append(name)
+            self.skill_index[name] = k
+            self.skills = np.hstack([self.skills, np.full((self.capacity, 1), np.nan)])
+        return k
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate every column with room for ``capacity`` slots."""
+        for name in COLUMNS:
+            column = np.zeros(capacity, dtype=np.float64)
+            column[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, column)
+        last_action = np.full(capacity, None, dtype=object)
+        last_action[:self.count] = self.last_action[:self.count]
+        self.last_action = last_action
+        skills = np.full((capacity, len(self.skill_names)), np.nan)
+        skills[:self.count] = self.skills[:self.count]
+        self.skills = skills
+
+
+class SkillView(MutableMapping):
+    """Dict-like view of one agent's row of the skill matrix."""
+
+    def __init__(self, owner: Any):
+        self._owner = owner
+
+    def __getitem__(self, name: str) -> float:
+        store, slot = self._owner._store, self._owner._slot
+        k = store.skill_index.get(name)
+        if k is None or np.isnan(store.skills[slot, k]):
+            raise KeyError(name)
+        return float(store.skills[slot, k])
+
+    def __setitem__(self, name: str, level: float) -> None:
+        store = self._owner._store
+        k = store.skill_column(name)
+        store.skills[self._owner._slot, k] = level
+
+    def __delitem__(self, name: str) -> None:
+        self[name]  # Raise KeyError for a missing skill
+        store = self._owner._store
+        store.skills[self._owner._slot, store.skill_index[name]] = np.nan
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._owner._store.skill_row(self._owner._slot))
+
+    def __len__(self) -> int:
+        return len(self._owner._store.skill_row(self._owner._slot))
+
+    def __repr__(self) -> str:
+        return repr(self._owner._store.skill_row(self._owner._slot))
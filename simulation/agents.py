@@ -5,28 +5,116 @@ from datetime import datetime
 from .utils.logging_config import get_logger
 import math
 from .cooking import CookingSystem, FoodType
+from .recipes import Inventory
+from .agent_store import AgentStore, SkillView
+from .spatial import HALF_CIRCUMFERENCE_KM, SpatialHash, haversine_km
+from .terrain import OCEAN_TERRAIN, TERRAIN_TYPES, TerrainType
 import random
-from dataclasses import dataclass
+import numpy as np
+
+# Movement cost multiplier (default 1.0) and swimming terrain, keyed by TerrainType
+TERRAIN_MOVE_COSTS = {
+    TerrainType.GRASSLAND: 1.0,
+    TerrainType.FOREST: 1.5,
+    TerrainType.MOUNTAIN: 2.0,
+    TerrainType.DESERT: 1.2,
+    TerrainType.LAKE: 2.0,
+    TerrainType.RIVER: 1.8,
+    **{terrain: 2.5 for terrain in OCEAN_TERRAIN}  # Swimming is more energy intensive
+}
+SWIM_TERRAIN = OCEAN_TERRAIN | {TerrainType.LAKE, TerrainType.RIVER}
+# The same tables indexed by terrain code, for batch moves
+MOVE_COSTS = np.array([TERRAIN_MOVE_COSTS.get(t, 1.0) for t in TERRAIN_TYPES])
+SWIM_CODES = np.array([t in SWIM_TERRAIN for t in TERRAIN_TYPES])
+
+# Side of the spatial hash cells agents are bucketed in; matches the usual social radius
+AGENT_CELL_KM = 50.0
+
 
-@dataclass
 class Agent:
-    """Represents an agent in the simulation."""
-    id: str
-    position: Tuple[float, float]
-    health: float
-    energy: float
-    hunger: float
-    thirst: float
-    age: int
-    skills: Dict[str, float]
-    inventory: Dict[str, Any]
-    last_action: Optional[str]
-    name: Optional[str] = None
-    world: Optional[Any] = None  # Reference to world for movement validation
-    logger: Optional[Any] = None  # Logger for agent-specific logging
-    gender: str = 'unknown'
-    velocity: Tuple[float, float] = (0.0, 0.0)
-    mass: float = 70.0
+    """Represents an agent in the simulation.
+
+    Health, energy, hunger, thirst, position, skills and the last action live in a
+    row of an :class:`AgentStore`; these attributes read and write that row. An
+    agent built on its own gets a one-row store until a system adopts it.
+    """
+
+    def __init__(self, id: str, position: Tuple[float, float], health: float, energy: float,
+                 hunger: float, thirst: float, age: int, skills: Dict[str, float],
+                 inventory: Dict[str, Any], last_action: Optional[str], name: Optional[str] = None,
+                 world: Optional[Any] = None, logger: Optional[Any] = None, gender: str = 'unknown',
+                 velocity: Tuple[float, float] = (0.0, 0.0), mass: float = 70.0):
+        self.id = id
+        self.age = age
+        self.name = name
+        self.world = world  # Reference to world for movement validation
+        self.logger = logger  # Logger for agent-specific logging
+        self.gender = gender
+        self.velocity = velocity
+        self.mass = mass
+        # Versioned so crafting queries can reuse results until the inventory changes
+        self.inventory = inventory if isinstance(inventory, Inventory) else Inventory(inventory or {})
+        self._grid: Optional[SpatialHash] = None  # Kept current as the agent moves, once a system adopts it
+        self._store = AgentStore(1)
+        self._slot = self._store.add(self, {'health': health, 'energy': energy, 'hunger': hunger,
+                                            'thirst': thirst, 'longitude': position[0],
+                                            'latitude': position[1], 'last_action': last_action}, skills)
+        self._skills = SkillView(self)
+
+    def attach(self, store: AgentStore) -> None:
+        """Move this agent's row into another store."""
+        if store is self._store:
+            return
+        values, skills = self._store.row(self._slot), self._store.skill_row(self._slot)
+        self._store.remove(self._slot)
+        self._store = store
+        self._slot = store.add(self, values, skills)
+
+    def detach(self) -> None:
+        """Move this agent's row out of a shared store into one of its own."""
+        self.attach(AgentStore(1))
+
+    def _column(name: str):
+        def get(self) -> float:
+            return float(getattr(self._store, name)[self._slot])
+
+        def set(self, value: float) -> None:
+            getattr(self._store, name)[self._slot] = value
+        return property(get, set)
+
+    health = _column('health')
+    energy = _column('energy')
+    hunger = _column('hunger')
+    thirst = _column('thirst')
+    del _column
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        return float(self._store.longitude[self._slot]), float(self._store.latitude[self._slot])
+
+    @position.setter
+    def position(self, value: Tuple[float, float]) -> None:
+        self._store.longitude[self._slot], self._store.latitude[self._slot] = value
+        if self._grid is not None:
+            self._grid.move(self.id, *self.position)
+
+    @property
+    def skills(self) -> SkillView:
+        return self._skills
+
+    @skills.setter
+    def skills(self, value: Dict[str, float]) -> None:
+        self._store.skills[self._slot] = np.nan
+        for name, level in value.items():
+            self._skills[name] = level
+
+    @property
+    def last_action(self) -> Optional[str]:
+        return self._store.last_action[self._slot]
+
+    @last_action.setter
+    def last_action(self, value: Optional[str]) -> None:
+        self._store.last_action[self._slot] = value
 
     def get_state(self) -> Dict:
         """Get current agent state for serialization."""
@@ -39,7 +127,7 @@ class Agent:
             "hunger": self.hunger,
             "thirst": self.thirst,
             "age": self.age,
-            "skills": self.skills,
+            "skills": dict(self.skills),
             "inventory": self.inventory,
             "last_action": self.last_action,
             "velocity": self.velocity,
@@ -65,20 +153,11 @@ class Agent:
         )
         
         # Get terrain type at target
-        terrain_info = self.world.terrain.get_terrain_info_at(target_longitude, target_latitude)
-        terrain_type = terrain_info.get('type', 'UNKNOWN')
+        terrain_type = self.world.terrain.get_terrain_type_at(target_longitude, target_latitude)
         
         # Calculate movement cost based on terrain and slope
         base_cost = distance * 10  # Base cost per unit distance
-        terrain_cost = {
-            "PLAINS": 1.0,
-            "FOREST": 1.5,
-            "MOUNTAINS": 2.0,
-            "DESERT": 1.2,
-            "OCEAN": 2.5,  # Swimming is more energy intensive
-            "LAKE": 2.0,
-            "RIVER": 1.8
-        }.get(terrain_type, 1.0)
+        terrain_cost = TERRAIN_MOVE_COSTS.get(terrain_type, 1.0)
         
         slope = self.world.terrain.get_slope_at(target_longitude, target_latitude)
         slope_cost = 1.0 + abs(slope) * 0.5
@@ -91,7 +170,7 @@ class Agent:
             return False
             
         # Handle water movement
-        if terrain_type in ["OCEAN", "LAKE", "RIVER"]:
+        if terrain_type in SWIM_TERRAIN:
             # Check if agent can swim (based on skills or equipment)
             can_swim = self.skills.get("swimming", 0) > 0.3 or "swimming_gear" in self.inventory
             
@@ -99,18 +178,18 @@ class Agent:
                 # Risk of drowning
                 if random.random() < 0.3:  # 30% chance of drowning
                     self.health -= 20
-                    self.logger.info(f"Agent {self.name} is drowning in {terrain_type}!")
+                    self.logger.info(f"Agent {self.name} is drowning in {terrain_type.value}!")
                     if self.health <= 0:
                         self.logger.info(f"Agent {self.name} has drowned!")
                         return False
                 else:
                     # Struggle to stay afloat
                     self.energy -= total_cost * 1.5
-                    self.logger.info(f"Agent {self.name} is struggling in {terrain_type}")
+                    self.logger.info(f"Agent {self.name} is struggling in {terrain_type.value}")
             else:
                 # Swimming is more energy intensive
                 self.energy -= total_cost * 1.2
-                self.logger.info(f"Agent {self.name} is swimming in {terrain_type}")
+                self.logger.info(f"Agent {self.name} is swimming in {terrain_type.value}")
         else:
             # Normal movement
             self.energy -= total_cost
@@ -128,9 +207,12 @@ class AgentSystem:
         self.logger = get_logger(__name__)
         
         # Initialize agent storage
+        self.store = AgentStore()  # Numeric state of every agent, one slot each
         self.agents = {}  # agent_id -> Agent
-        self.agent_positions = {}  # (lon, lat) -> Set[agent_id]
+        self.agent_grid = SpatialHash(AGENT_CELL_KM)  # Buckets of agent ids for nearby-agent queries
         self.agent_groups = {}  # agent_id -> group_id
+        self.rng = world.rng.stream('agents')
+        self.cooking = CookingSystem()
         
         self.logger.info("Agent system initialized")
     
@@ -162,11 +244,11 @@ class AgentSystem:
                 "crafting": 0.2,
                 "swimming": 0.1
             },
-            inventory={},
+            inventory=Inventory(),
             last_action=None,
             world=self.world  # Pass world reference
         )
-        self.agents[agent1.id] = agent1
+        self.add_agent(agent1)
         self.logger.info(f"Created agent {agent1.name} at position {agent1.position}")
         
         # Create second agent
@@ -185,11 +267,11 @@ class AgentSystem:
                 "crafting": 0.2,
                 "swimming": 0.1
             },
-            inventory={},
+            inventory=Inventory(),
             last_action=None,
             world=self.world  # Pass world reference
         )
-        self.agents[agent2.id] = agent2
+        self.add_agent(agent2)
         self.logger.info(f"Created agent {agent2.name} at position {agent2.position}")
 
     def create_agent(self, longitude: float, latitude: float, name: Optional[str] = None,
@@ -212,7 +294,7 @@ class AgentSystem:
                 "crafting": 0.2,
                 "swimming": 0.1
             },
-            inventory={},
+            inventory=Inventory(),
             last_action=None,
             world=self.world,  # Pass world reference
             logger=self.logger,  # Pass logger reference
@@ -221,10 +303,7 @@ class AgentSystem:
             mass=70.0
         )
 
-        self.agents[agent_id] = agent
-        if (longitude, latitude) not in self.agent_positions:
-            self.agent_positions[(longitude, latitude)] = set()
-        self.agent_positions[(longitude, latitude)].add(agent_id)
+        self.add_agent(agent)
 
         # Register the new agent with the physics system if available
         if hasattr(self.world, "physics") and self.world.physics:
@@ -240,150 +319,126 @@ class AgentSystem:
         """Retrieve an agent by ID."""
         return self.agents.get(agent_id)
     
+    def add_agent(self, agent: Agent) -> None:
+        """Take an agent into the system, moving its state into the shared columns."""
+        agent.attach(self.store)
+        self.agents[agent.id] = agent
+        agent._grid = self.agent_grid
+        self.agent_grid.move(agent.id, *agent.position)
+
+    def remove_agent(self, agent_id: str) -> Optional[Agent]:
+        """Drop an agent from the system; it keeps its last state in a store of its own."""
+        agent = self.agents.pop(agent_id, None)
+        if agent is None:
+            return None
+        self.agent_grid.remove(agent_id)
+        agent._grid = None
+        agent.detach()
+        return agent
+
+    def find_agents(self, longitude: float, latitude: float, radius_km: float,
+                    exclude: Optional[str] = None) -> List[Agent]:
+        """Agents within ``radius_km`` of a point, nearest first."""
+        return [self.agents[agent_id] for agent_id, _ in
+                self.agent_grid.query(longitude, latitude, radius_km, exclude)]
+
+    def nearest_agents(self, longitude: float, latitude: float, count: int,
+                       max_distance: float = HALF_CIRCUMFERENCE_KM, exclude: Optional[str] = None) -> List[Agent]:
+        """The ``count`` agents nearest a point, within ``max_distance`` km."""
+        return [self.agents[agent_id] for agent_id, _ in
+                self.agent_grid.nearest(longitude, latitude, count, max_distance, exclude)]
+    
     def update(self, time_delta: float):
         """Update agent states."""
-        self.logger.info(f"Updating {len(self.agents)} agents with time delta: {time_delta}")
+        if not self.store.count:
+            return
+        self._update_needs(time_delta)
+        self._update_positions(time_delta)
+        self._update_skills(time_delta)
         
-        for agent_id, agent in self.agents.items():
-            # Log initial state
-            self.logger.info(f"Agent {agent.name} ({agent_id}) - Initial state: "
-                           f"Health: {agent.health:.1f}, Energy: {agent.energy:.1f}, "
-                           f"Hunger: {agent.hunger:.1f}, Thirst: {agent.thirst:.1f}")
-            
-            # Update basic needs
-            self._update_agent_needs(agent, time_delta)
-            
-            # Update agent position
-            self._update_agent_position(agent, time_delta)
-            
-            # Update agent skills
-            self._update_agent_skills(agent, time_delta)
-            
-            # Update agent inventory
+        # Only hungry or thirsty agents eat or drink
+        n = self.store.count
+        eating = np.flatnonzero((self.store.hunger[:n] > 50.0) | (self.store.thirst[:n] > 50.0))
+        for agent in [self.store.owners[slot] for slot in eating]:
             self._update_agent_inventory(agent, time_delta)
-            
-            # Log final state
-            self.logger.info(f"Agent {agent.name} ({agent_id}) - Final state: "
-                           f"Health: {agent.health:.1f}, Energy: {agent.energy:.1f}, "
-                           f"Hunger: {agent.hunger:.1f}, Thirst: {agent.thirst:.1f}, "
-                           f"Action: {agent.last_action}")
     
-    def _update_agent_needs(self, agent: Agent, time_delta: float):
-        """Update agent's basic needs."""
-        old_hunger = agent.hunger
-        old_thirst = agent.thirst
-        old_energy = agent.energy
-        old_health = agent.health
+    def _update_needs(self, time_delta: float):
+        """Update every agent's basic needs."""
+        n = self.store.count
+        hunger, thirst = self.store.hunger[:n], self.store.thirst[:n]
+        energy, health = self.store.energy[:n], self.store.health[:n]
         
         # Increase hunger and thirst over time
-        agent.hunger = min(100.0, agent.hunger + 0.1 * time_delta)
-        agent.thirst = min(100.0, agent.thirst + 0.15 * time_delta)
+        np.minimum(100.0, hunger + 0.1 * time_delta, out=hunger)
+        np.minimum(100.0, thirst + 0.15 * time_delta, out=thirst)
         
         # Decrease energy based on hunger and thirst
-        energy_loss = (agent.hunger + agent.thirst) * 0.01 * time_delta
-        agent.energy = max(0.0, agent.energy - energy_loss)
+        np.maximum(0.0, energy - (hunger + thirst) * 0.01 * time_delta, out=energy)
         
         # Decrease health if energy is too low
-        if agent.energy < 20.0:
-            agent.health = max(0.0, agent.health - 0.1 * time_delta)
-        
-        # Log significant changes
-        if abs(agent.hunger - old_hunger) > 5 or abs(agent.thirst - old_thirst) > 5:
-            self.logger.info(f"Agent {agent.name} needs changed - "
-                           f"Hunger: {old_hunger:.1f} -> {agent.hunger:.1f}, "
-                           f"Thirst: {old_thirst:.1f} -> {agent.thirst:.1f}")
-        
-        if abs(agent.energy - old_energy) > 10 or abs(agent.health - old_health) > 5:
-            self.logger.info(f"Agent {agent.name} status changed - "
-                           f"Energy: {old_energy:.1f} -> {agent.energy:.1f}, "
-                           f"Health: {old_health:.1f} -> {agent.health:.1f}")
+        exhausted = energy < 20.0
+        health[exhausted] = np.maximum(0.0, health[exhausted] - 0.1 * time_delta)
     
-    def _update_agent_position(self, agent: Agent, time_delta: float):
-        """Update agent's position considering terrain and energy costs."""
-        old_position = agent.position
+    def _update_positions(self, time_delta: float):
+        """Move every agent a random step, considering terrain and energy costs."""
+        n = self.store.count
+        lon, lat = self.store.longitude[:n], self.store.latitude[:n]
+        energy = self.store.energy[:n]
         
-        # Get current terrain info
-        current_terrain = self.world.terrain.get_terrain_info_at(*agent.position)
-        current_elevation = self.world.terrain.get_elevation_at(*agent.position)
-        current_slope = self.world.terrain.get_slope_at(*agent.position)
-        
-        # Calculate movement cost based on terrain
-        movement_cost = self._calculate_movement_cost(current_terrain, current_slope)
+        # Calculate movement cost based on terrain and slope
+        movement_cost = self.world.terrain.get_movement_costs_at(lon, lat, 'human')
         
-        # Check if agent has enough energy to move
-        if agent.energy < movement_cost:
-            # Agent is too tired to move
-            agent.last_action = "resting"
-            agent.energy = min(100.0, agent.energy + 0.5 * time_delta)  # Rest and recover energy
-            self.logger.info(f"Agent {agent.name} is resting to recover energy. "
-                           f"Current energy: {agent.energy:.1f}")
-            return
+        # Agents too tired to move rest and recover energy
+        resting = energy < movement_cost
+        energy[resting] = np.minimum(100.0, energy[resting] + 0.5 * time_delta)
+        self.store.last_action[:n][resting] = "resting"
         
-        # Calculate possible movement range based on energy
-        # Use smaller base distance (0.001 instead of 0.01)
-        max_distance = min(0.001 * time_delta, agent.energy / movement_cost)
+        # Random movement within energy constraints
+        movers = np.flatnonzero(~resting)
+        max_distance = np.minimum(0.001 * time_delta, energy[movers] / movement_cost[movers])
+        angle = self.rng.uniform(0, 2 * math.pi, size=len(movers))
+        distance = self.rng.uniform(0, 1, size=len(movers)) * max_distance
+        self.move_agents(movers, lon[movers] + distance * np.cos(angle), lat[movers] + distance * np.sin(angle))
+    
+    def move_agents(self, slots: np.ndarray, longitudes: np.ndarray, latitudes: np.ndarray) -> np.ndarray:
+        """Batch :meth:`Agent.move` for store slots; returns which of them moved."""
+        store = self.store
+        old_lon, old_lat = store.longitude[slots], store.latitude[slots]
         
-        # Generate random movement within energy constraints
-        angle = random.uniform(0, 2 * math.pi)
-        distance = random.uniform(0, max_distance)
+        # Calculate movement cost based on terrain and slope
+        codes = self.world.terrain.get_terrain_codes_at(longitudes, latitudes)
+        slopes = self.world.terrain.get_slopes_at(longitudes, latitudes)
+        cost = (haversine_km(old_lon, old_lat, longitudes, latitudes) * 10 * MOVE_COSTS[codes]
+                * (1.0 + np.abs(slopes) * 0.5))
         
-        # Calculate new position
-        lon, lat = agent.position
-        new_lon = lon + distance * math.cos(angle)
-        new_lat = lat + distance * math.sin(angle)
+        # Water carries drowning and swimming rules; those few go through the agent itself
+        moved = store.energy[slots] >= cost
+        swimming = SWIM_CODES[codes]
+        for k in np.flatnonzero(swimming):
+            moved[k] = store.owners[slots[k]].move(float(longitudes[k]), float(latitudes[k]))
+        walking = moved & ~swimming
         
-        # Try to move to new position
-        if agent.move(new_lon, new_lat):
-            # Update agent positions tracking
-            if old_position in self.agent_positions:
-                self.agent_positions[old_position].remove(agent.id)
-                if not self.agent_positions[old_position]:
-                    del self.agent_positions[old_position]
-            
-            if agent.position not in self.agent_positions:
-                self.agent_positions[agent.position] = set()
-            self.agent_positions[agent.position].add(agent.id)
-            
-            # Log movement
-            self.logger.info(f"Agent {agent.name} moved from {old_position} to {agent.position}")
+        walkers = slots[walking]
+        store.energy[walkers] -= cost[walking]
+        store.longitude[walkers] = longitudes[walking]
+        store.latitude[walkers] = latitudes[walking]
+        store.last_action[walkers] = "move"
+        self.agent_grid.move_many([store.owners[slot].id for slot in walkers],
+                                  longitudes[walking], latitudes[walking])
+        return moved
     
-    def _calculate_movement_cost(self, terrain_info: Dict, slope: float) -> float:
+    def _calculate_movement_cost(self, longitude: float, latitude: float) -> float:
         """Calculate the energy cost of movement based on terrain and slope."""
-        base_cost = 1.0
-        
-        # Terrain-specific costs
-        terrain_costs = {
-            "MOUNTAIN": 5.0,
-            "HILLS": 3.0,
-            "FOREST": 2.0,
-            "SWAMP": 4.0,
-            "RIVER": 3.0,
-            "LAKE": 5.0,  # Can't move through lakes
-            "OCEAN": 10.0,  # Can't move through oceans
-            "GLACIER": 6.0,
-            "DESERT": 2.0,
-            "GRASSLAND": 1.0,
-            "PLAINS": 1.0
-        }
-        
-        terrain_type = terrain_info.get("type", "PLAINS")
-        terrain_cost = terrain_costs.get(terrain_type, 1.0)
-        
-        # Slope cost (0-1 scale)
-        slope_cost = 1.0 + (slope * 0.1)  # Reduce slope impact to allow movement
-        
-        return base_cost * terrain_cost * slope_cost
+        return self.world.terrain.get_movement_cost_at(longitude, latitude, 'human')
     
-    def _update_agent_skills(self, agent: Agent, time_delta: float):
-        """Update agent's skills."""
-        # Skills improve slightly over time
-        for skill in agent.skills:
-            improvement = 0.001 * time_delta
-            agent.skills[skill] = min(1.0, agent.skills[skill] + improvement)
+    def _update_skills(self, time_delta: float):
+        """Improve every agent's skills slightly over time."""
+        skills = self.store.skills[:self.store.count]
+        np.minimum(1.0, skills + 0.001 * time_delta, out=skills)
     
     def _update_agent_inventory(self, agent: Agent, time_delta: float):
         """Update agent's inventory and handle food consumption using CookingSystem."""
-        cooking_system = CookingSystem()
+        cooking_system = self.cooking
         food_items = [item for item in agent.inventory if item in FoodType._value2member_map_]
         ate_food = False
         for food_item in food_items:
@@ -421,7 +476,7 @@ class AgentSystem:
                     'hunger': agent.hunger,
                     'thirst': agent.thirst,
                     'age': agent.age,
-                    'skills': agent.skills,
+                    'skills': dict(agent.skills),
                     'inventory': agent.inventory,
                     'created_at': agent.created_at,
                     'last_update': agent.last_update,
@@ -429,8 +484,8 @@ class AgentSystem:
                 }
                 for agent_id, agent in self.agents.items()
             },
-            'agent_positions': {
-                f"{pos[0]},{pos[1]}": list(agent_ids)
-                for pos, agent_ids in self.agent_positions.items()
+            'agent_cells': {
+                f"{column},{row}": list(agent_ids)
+                for (column, row), agent_ids in self.agent_grid.buckets.items()
             }
         } 
\ No newline at end of file
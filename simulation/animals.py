@@ -8,6 +8,7 @@ from datetime import datetime
 import numpy as np
 from .utils.logging_config import get_logger
 from .cooking import CookingSystem, FoodType
+from .terrain import TERRAIN_TYPES, OCEAN_TERRAIN
 import traceback
 
 logger = get_logger(__name__)
@@ -148,11 +149,53 @@ class Animal:
             self.territory.center_latitude = (self.territory.center_latitude + new_latitude) / 2
             self.territory.radius = max(self.territory.radius, new_radius)
 
+# Animal-specific terrain movement cost modifiers, keyed by AnimalType and TerrainType names
+ANIMAL_TERRAIN_MODIFIERS = {
+    "HORSE": {"PLAINS": 0.5, "GRASSLAND": 0.5, "HILLS": 1.5},  # Horses are fast on plains
+    "WOLF": {"FOREST": 0.7, "HILLS": 0.8},  # Wolves are good in forests and hills
+    "DEER": {"FOREST": 0.6, "GRASSLAND": 0.8},  # Deer are good in forests
+    "BEAR": {"MOUNTAIN": 0.8, "FOREST": 0.7},  # Bears are good in mountains and forests
+    "RABBIT": {"GRASSLAND": 0.5, "FOREST": 0.7},  # Rabbits are fast on grasslands
+    "SHEEP": {"HILLS": 0.7, "GRASSLAND": 0.8},  # Sheep are good on hills
+    "COW": {"PLAINS": 0.6, "GRASSLAND": 0.7},  # Cows are good on plains
+    "GOAT": {"MOUNTAIN": 0.6, "HILLS": 0.7}  # Goats are good in mountains
+}
+
+# Impassable terrain per animal type; "OCEAN" covers every ocean terrain type
+IMPASSABLE_TERRAIN = {
+    "HORSE": {"OCEAN", "LAKE", "RIVER", "GLACIER", "MOUNTAIN"},
+    "WOLF": {"OCEAN", "LAKE", "RIVER"},
+    "DEER": {"OCEAN", "LAKE", "RIVER"},
+    "BEAR": {"OCEAN", "LAKE"},
+    "RABBIT": {"OCEAN", "LAKE", "RIVER", "MOUNTAIN"},
+    "SHEEP": {"OCEAN", "LAKE", "RIVER", "MOUNTAIN"},
+    "COW": {"OCEAN", "LAKE", "RIVER", "MOUNTAIN", "HILLS"},
+    "GOAT": {"OCEAN", "LAKE", "RIVER"}
+}
+DEFAULT_IMPASSABLE_TERRAIN = {"OCEAN", "LAKE"}
+
+
+def _impassable_by_code(names) -> np.ndarray:
+    """Boolean lookup over terrain codes for a set of impassable terrain names."""
+    return np.array([terrain.name in names or ("OCEAN" in names and terrain in OCEAN_TERRAIN)
+                     for terrain in TERRAIN_TYPES], dtype=bool)
+
+
+# Per-terrain-code lookup tables so whole populations can be evaluated at once
+_TERRAIN_MODIFIERS_BY_CODE = {
+    species: np.array([modifiers.get(terrain.name, 1.0) for terrain in TERRAIN_TYPES])
+    for species, modifiers in ANIMAL_TERRAIN_MODIFIERS.items()
+}
+_NO_TERRAIN_MODIFIERS = np.ones(len(TERRAIN_TYPES))
+_IMPASSABLE_BY_CODE = {species: _impassable_by_code(names) for species, names in IMPASSABLE_TERRAIN.items()}
+_DEFAULT_IMPASSABLE_BY_CODE = _impassable_by_code(DEFAULT_IMPASSABLE_TERRAIN)
+
 class AnimalSystem:
     def __init__(self, world):
         """Initialize the animal system."""
         self.world = world
         self.logger = get_logger(__name__)
+        self.rng = world.rng.stream('animals')
         
         # Initialize animal components
         self.animals = {}  # animal_id -> animal_data
@@ -516,6 +559,7 @@ class AnimalSystem:
     
     def _update_herbivores(self, time_delta: float, environment: Dict):
         """Update herbivore population"""
+        movers = []
         for animal_id, animal in self.herbivores.items():
             # Animal eats
             self._update_animal_food(animal)
@@ -526,8 +570,11 @@ class AnimalSystem:
             
             # Update position based on behavior
             if animal["health"] > 0.3:
-                self._move_animal(animal_id, animal, "herbivore")
-            
+                movers.append(animal)
+        
+        self._move_animals(movers, "herbivore")
+        
+        for animal_id, animal in list(self.herbivores.items()):
             # Check for reproduction
             if animal["health"] > 0.7 and animal["age"] > 2.0:
                 self._reproduce_animal(animal_id, animal, "herbivore")
@@ -538,6 +585,7 @@ class AnimalSystem:
     
     def _update_carnivores(self, time_delta: float, environment: Dict):
         """Update carnivore population"""
+        movers = []
         for animal_id, animal in self.carnivores.items():
             # Animal eats
             self._update_animal_food(animal)
@@ -548,8 +596,11 @@ class AnimalSystem:
             
             # Update position based on behavior
             if animal["health"] > 0.3:
-                self._move_animal(animal_id, animal, "carnivore")
-            
+                movers.append(animal)
+        
+        self._move_animals(movers, "carnivore")
+        
+        for animal_id, animal in list(self.carnivores.items()):
             # Check for reproduction
             if animal["health"] > 0.7 and animal["age"] > 3.0:
                 self._reproduce_animal(animal_id, animal, "carnivore")
@@ -560,6 +611,7 @@ class AnimalSystem:
     
     def _update_omnivores(self, time_delta: float, environment: Dict):
         """Update omnivore population"""
+        movers = []
         for animal_id, animal in self.omnivores.items():
             # Animal eats
             self._update_animal_food(animal)
@@ -571,8 +623,11 @@ class AnimalSystem:
             
             # Update position based on behavior
             if animal["health"] > 0.3:
-                self._move_animal(animal_id, animal, "omnivore")
-            
+                movers.append(animal)
+        
+        self._move_animals(movers, "omnivore")
+        
+        for animal_id, animal in list(self.omnivores.items()):
             # Check for reproduction
             if animal["health"] > 0.7 and animal["age"] > 2.5:
                 self._reproduce_animal(animal_id, animal, "omnivore")
@@ -583,6 +638,7 @@ class AnimalSystem:
     
     def _update_domesticated(self, time_delta: float, environment: Dict):
         """Update domesticated animal population"""
+        movers = []
         for animal_id, animal in self.domesticated.items():
             # Animal eats
             self._update_animal_food(animal)
@@ -593,8 +649,11 @@ class AnimalSystem:
             
             # Update position based on behavior
             if animal["health"] > 0.3:
-                self._move_animal(animal_id, animal, "domesticated")
-            
+                movers.append(animal)
+        
+        self._move_animals(movers, "domesticated")
+        
+        for animal_id, animal in list(self.domesticated.items()):
             # Check for reproduction
             if animal["health"] > 0.7 and animal["age"] > 2.0:
                 self._reproduce_animal(animal_id, animal, "domesticated")
@@ -603,139 +662,98 @@ class AnimalSystem:
             if animal["health"] < 0.1 or animal["age"] > 12.0:
                 self._remove_animal(animal_id, "domesticated")
     
-    def _move_animal(self, animal_id: str, animal: Dict, animal_type: str):
-        """Move an animal considering terrain, water type, and energy costs."""
+    def _move_animals(self, animals: List[Dict], animal_type: str):
+        """Move a population considering terrain, water type, and energy costs, evaluating all candidate moves at once."""
+        if not animals:
+            return
+        terrain = self.world.terrain
+        lons = np.array([animal['longitude'] for animal in animals])
+        lats = np.array([animal['latitude'] for animal in animals])
+        energy = np.array([animal['needs']['energy'] for animal in animals])
+        sizes = np.array([animal['size'] for animal in animals])
+        speeds = np.array([animal['speed'] for animal in animals])
+        
         # Get current terrain info
-        current_terrain = self.world.terrain.get_terrain_info_at(animal['longitude'], animal['latitude'])
-        current_elevation = self.world.terrain.get_elevation_at(animal['longitude'], animal['latitude'])
-        current_slope = self.world.terrain.get_slope_at(animal['longitude'], animal['latitude'])
+        current_elevation = terrain.get_elevations_at(lons, lats)
         
         # Calculate movement cost based on terrain and animal type
-        movement_cost = self._calculate_movement_cost(animal, current_terrain, current_slope)
+        movement_cost = self._calculate_movement_costs(animals, lons, lats, animal_type)
         
-        # Check if animal has enough energy to move
-        if animal['needs']['energy'] < movement_cost:
-            # Animal is too tired to move
-            animal['last_action'] = "resting"
-            animal['needs']['energy'] = min(100.0, animal['needs']['energy'] + 0.3)
-            return
+        # Animals without enough energy to move rest instead
+        tired = energy < movement_cost
+        for k in np.flatnonzero(tired):
+            animals[k]['last_action'] = "resting"
+            animals[k]['needs']['energy'] = min(100.0, animals[k]['needs']['energy'] + 0.3)
         
         # Calculate possible movement range based on energy and animal speed
-        max_distance = min(0.01 * animal['speed'], animal['needs']['energy'] / movement_cost)
+        max_distance = np.minimum(0.01 * speeds, energy / movement_cost)
         
         # Generate random movement within energy constraints
-        angle = random.uniform(0, 2 * math.pi)
-        distance = random.uniform(0, max_distance)
-        
-        # Calculate new position
-        new_lon = animal['longitude'] + distance * math.cos(angle)
-        new_lat = animal['latitude'] + distance * math.sin(angle)
-        
-        # Check if new position is valid for this animal type
-        if not self._is_valid_position(new_lon, new_lat, animal):
-            return
-        
-        # Get terrain at new position
-        new_terrain = self.world.terrain.get_terrain_info_at(new_lon, new_lat)
-        new_elevation = self.world.terrain.get_elevation_at(new_lon, new_lat)
-        new_slope = self.world.terrain.get_slope_at(new_lon, new_lat)
-        
-        # Calculate elevation change cost
-        elevation_change = abs(new_elevation - current_elevation)
-        elevation_cost = elevation_change * (2.0 / animal['size'])
-        
-        # Check if animal has enough energy for the elevation change
-        if animal['needs']['energy'] < (movement_cost + elevation_cost):
-            return
-        
-        # Update position
-        animal['longitude'] = new_lon
-        animal['latitude'] = new_lat
-        
-        # Update energy based on movement and terrain
-        animal['needs']['energy'] = max(0.0, animal['needs']['energy'] - (movement_cost + elevation_cost))
-        
-        # Update last action
-        if elevation_change > 0:
-            animal['last_action'] = "climbing" if new_elevation > current_elevation else "descending"
-        else:
-            animal['last_action'] = "moving"
+        count = len(animals)
+        angle = self.rng.uniform(0, 2 * math.pi, count)
+        distance = self.rng.uniform(0, 1, count) * max_distance
+        
+        # Calculate new positions
+        new_lons = lons + distance * np.cos(angle)
+        new_lats = lats + distance * np.sin(angle)
+        
+        # Calculate elevation change cost at the new positions
+        new_elevation = terrain.get_elevations_at(new_lons, new_lats)
+        elevation_change = np.abs(new_elevation - current_elevation)
+        elevation_cost = elevation_change * (2.0 / sizes)
+        
+        # Move only animals with a valid destination and enough energy for the elevation change
+        moves = ~tired & self._is_valid_position(new_lons, new_lats, animals) & (energy >= movement_cost + elevation_cost)
+        for k in np.flatnonzero(moves):
+            animal = animals[k]
+            animal['longitude'] = float(new_lons[k])
+            animal['latitude'] = float(new_lats[k])
+            
+            # Update energy based on movement and terrain
+            animal['needs']['energy'] = max(0.0, animal['needs']['energy'] - (movement_cost[k] + elevation_cost[k]))
+            
+            # Update last action
+            if elevation_change[k] > 0:
+                animal['last_action'] = "climbing" if new_elevation[k] > current_elevation[k] else "descending"
+            else:
+                animal['last_action'] = "moving"
     
-    def _calculate_movement_cost(self, animal: Dict, terrain_info: Dict, slope: float) -> float:
+    def _calculate_movement_costs(self, animals: List[Dict], lons: np.ndarray, lats: np.ndarray,
+                                  animal_type: str) -> np.ndarray:
         """Calculate the energy cost of movement based on terrain, slope, and animal type."""
-        base_cost = 1.0
-        
-        # Terrain-specific costs
-        terrain_costs = {
-            "MOUNTAIN": 5.0,
-            "HILLS": 3.0,
-            "FOREST": 2.0,
-            "SWAMP": 4.0,
-            "RIVER": 3.0,
-            "LAKE": 5.0,  # Can't move through lakes
-            "OCEAN": 10.0,  # Can't move through oceans
-            "GLACIER": 6.0,
-            "DESERT": 2.0,
-            "GRASSLAND": 1.0,
-            "PLAINS": 1.0
-        }
-        
-        # Animal-specific terrain modifiers
-        animal_terrain_modifiers = {
-            "HORSE": {"PLAINS": 0.5, "GRASSLAND": 0.5, "HILLS": 1.5},  # Horses are fast on plains
-            "WOLF": {"FOREST": 0.7, "HILLS": 0.8},  # Wolves are good in forests and hills
-            "DEER": {"FOREST": 0.6, "GRASSLAND": 0.8},  # Deer are good in forests
-            "BEAR": {"MOUNTAIN": 0.8, "FOREST": 0.7},  # Bears are good in mountains and forests
-            "RABBIT": {"GRASSLAND": 0.5, "FOREST": 0.7},  # Rabbits are fast on grasslands
-            "SHEEP": {"HILLS": 0.7, "GRASSLAND": 0.8},  # Sheep are good on hills
-            "COW": {"PLAINS": 0.6, "GRASSLAND": 0.7},  # Cows are good on plains
-            "GOAT": {"MOUNTAIN": 0.6, "HILLS": 0.7}  # Goats are good in mountains
-        }
-        
-        terrain_type = terrain_info.get("type", "PLAINS")
-        terrain_cost = terrain_costs.get(terrain_type, 1.0)
+        # Terrain and slope cost from the precomputed raster for the animal's locomotion class
+        locomotion = 'carnivore' if animal_type == 'carnivore' else 'herbivore'
+        terrain_cost = self.world.terrain.get_movement_costs_at(lons, lats, locomotion)
         
         # Apply animal-specific terrain modifier
-        animal_type = animal['type'].value
-        terrain_modifier = animal_terrain_modifiers.get(animal_type, {}).get(terrain_type, 1.0)
-        
-        # Slope cost (0-1 scale)
-        slope_cost = 1.0 + (slope * 4.0)  # Steeper slopes cost more energy
+        codes = self.world.terrain.get_terrain_codes_at(lons, lats)
+        terrain_modifier = np.array([
+            _TERRAIN_MODIFIERS_BY_CODE.get(animal['type'].name, _NO_TERRAIN_MODIFIERS)[code]
+            for animal, code in zip(animals, codes)
+        ])
         
         # Size modifier (smaller animals pay more for movement)
-        size_modifier = 1.0 / animal['size']
+        size_modifier = 1.0 / np.array([animal['size'] for animal in animals])
         
-        return base_cost * terrain_cost * terrain_modifier * slope_cost * size_modifier
+        return terrain_cost * terrain_modifier * size_modifier
     
-    def _is_valid_position(self, lon: float, lat: float, animal: Dict) -> bool:
-        """Check if a position is valid for movement for this animal type."""
+    def _is_valid_position(self, lons: np.ndarray, lats: np.ndarray, animals: List[Dict]) -> np.ndarray:
+        """Check which candidate positions are valid for movement for the matching animals."""
         # Check world bounds
-        if not (self.world.min_longitude <= lon <= self.world.max_longitude and
-                self.world.min_latitude <= lat <= self.world.max_latitude):
-            return False
-        
-        # Check if position is in impassable terrain
-        terrain_info = self.world.terrain.get_terrain_info_at(lon, lat)
-        terrain_type = terrain_info.get("type", "PLAINS")
-        
-        # Define impassable terrain for different animal types
-        impassable_terrain = {
-            "HORSE": {"OCEAN", "LAKE", "RIVER", "GLACIER", "MOUNTAIN"},
-            "WOLF": {"OCEAN", "LAKE", "RIVER"},
-            "DEER": {"OCEAN", "LAKE", "RIVER"},
-            "BEAR": {"OCEAN", "LAKE"},
-            "RABBIT": {"OCEAN", "LAKE", "RIVER", "MOUNTAIN"},
-            "SHEEP": {"OCEAN", "LAKE", "RIVER", "MOUNTAIN"},
-            "COW": {"OCEAN", "LAKE", "RIVER", "MOUNTAIN", "HILLS"},
-            "GOAT": {"OCEAN", "LAKE", "RIVER"}
-        }
-        
-        animal_type = animal['type'].value
-        return terrain_type not in impassable_terrain.get(animal_type, {"OCEAN", "LAKE"})
+        in_bounds = ((lons >= self.world.min_longitude) & (lons <= self.world.max_longitude) &
+                     (lats >= self.world.min_latitude) & (lats <= self.world.max_latitude))
+        
+        # Check if positions are in impassable terrain
+        codes = self.world.terrain.get_terrain_codes_at(lons, lats)
+        impassable = np.array([
+            _IMPASSABLE_BY_CODE.get(animal['type'].name, _DEFAULT_IMPASSABLE_BY_CODE)[code]
+            for animal, code in zip(animals, codes)
+        ], dtype=bool)
+        return in_bounds & ~impassable
     
     def _reproduce_animal(self, animal_id: str, animal: Dict, animal_type: str):
         """Create new animal through reproduction"""
-        if random.random() < 0.1:  # 10% chance of reproduction
+        if self.rng.random() < 0.1:  # 10% chance of reproduction
             new_animal_id = self._generate_animal_id(animal_type)
             new_animal = self._create_animal(new_animal_id, AnimalType(animal['type']))
             
@@ -811,7 +829,7 @@ class AnimalSystem:
             for behavior, value in behaviors.items():
                 # Behaviors can evolve slightly
                 self.behaviors[animal_type][behavior] = max(0.0, min(1.0,
-                    value + random.uniform(-0.01, 0.01) * time_delta))
+                    value + self.rng.uniform(-0.01, 0.01) * time_delta))
     
     def _update_interactions(self, time_delta: float):
         """Update animal interactions"""
@@ -882,7 +900,7 @@ class AnimalSystem:
             suitability = environment.get(f"{habitat}_suitability", 0.5)
             
             # Animals can move between habitats
-            if random.random() < 0.01 * time_delta:
+            if self.rng.random() < 0.01 * time_delta:
                 if suitability > 0.7:
                     # Animals move to this habitat
                     self._add_animal_to_habitat(habitat)
@@ -904,7 +922,7 @@ class AnimalSystem:
     def _record_events(self):
         """Record significant animal events"""
         # Record population changes
-        if random.random() < 0.1:
+        if self.rng.random() < 0.1:
             self.events.append({
                 "type": "population_change",
                 "timestamp": datetime.now().isoformat(),
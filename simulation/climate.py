@@ -1,14 +1,34 @@
-from typing import Dict, Tuple, Optional
+from collections.abc import Mapping
+from typing import Dict, Iterator, Tuple, Optional
 from enum import Enum
 import numpy as np
+from scipy import ndimage
 import math
 import logging
 import random
 from datetime import datetime
 from .utils.logging_config import get_logger
+from .grid import RasterGrid
+from .solar import MARCH_EQUINOX_DAY
 
 logger = get_logger(__name__)
 
+# Per-cell weather held as uint8 codes into WEATHER_NAMES
+WEATHER_NAMES = ['clear', 'cloudy', 'rain', 'snow']
+WEATHER_CODES = {name: code for code, name in enumerate(WEATHER_NAMES)}
+
+# Periods of the climate cycles, in climate time units
+DAY_LENGTH = 24 * 60
+YEAR_LENGTH = 365 * 24 * 60
+
+# Heat and moisture transport: seconds per climate time unit, eddy diffusivity in m^2/s
+# and the default number of substeps per update
+TIME_UNIT_SECONDS = 60.0
+TRANSPORT_DIFFUSIVITY = 1.0e5
+TRANSPORT_SUBSTEPS = 2
+# Cap on the explicit diffusion coefficient per axis, which keeps the stencil stable near the poles
+MAX_DIFFUSION_COEFFICIENT = 0.2
+
 class ClimateType(Enum):
     # Polar Climates
     TUNDRA = "tundra"
@@ -40,6 +60,36 @@ class ClimateType(Enum):
     SUBALPINE = "subalpine"
     MONTANE = "montane"
 
+class ClimateConditionsView(Mapping):
+    """Read-only mapping of (longitude, latitude) to a cell's current conditions.
+
+    Nothing is stored; each lookup reads the climate rasters. Iteration yields
+    cell centres, and any coordinate inside the grid resolves to its nearest cell.
+    """
+
+    def __init__(self, climate: 'ClimateSystem'):
+        self.climate = climate
+
+    def __getitem__(self, key: Tuple[float, float]) -> Dict:
+        cell = self.climate.grid.index(*key)
+        if cell is None:
+            raise KeyError(key)
+        climate = self.climate
+        return {
+            "temperature": float(climate.temperature_map[cell]),
+            "precipitation": float(climate.precipitation_map[cell]),
+            "wind_speed": float(climate.wind_speed_map[cell]),
+            "wind_direction": float(climate.wind_direction_map[cell]),
+            "weather": WEATHER_NAMES[climate.weather_map[cell]]
+        }
+
+    def __iter__(self) -> Iterator[Tuple[float, float]]:
+        for _, _, lon, lat in self.climate.grid.cells():
+            yield lon, lat
+
+    def __len__(self) -> int:
+        return self.climate.grid.size
+
 class ClimateSystem:
     def __init__(self, world):
         """Initialize the climate system."""
@@ -49,49 +99,54 @@ class ClimateSystem:
         self.precipitation_data = {}  # (longitude, latitude) -> float
         self.humidity_data = {}  # (longitude, latitude) -> float
         self.wind_data = {}  # (longitude, latitude) -> Dict
-        self.current_conditions = {}  # (longitude, latitude) -> Dict
+        self.rng = world.rng.stream('climate')
         
         # Define coordinate ranges
-        self.longitude_range = np.arange(-180.0, 180.0, 1.0)  # 1-degree resolution
-        self.latitude_range = np.arange(-90.0, 90.0, 1.0)  # 1-degree resolution
-        
-        # Initialize maps
-        self.temperature_map = np.zeros((len(self.longitude_range), len(self.latitude_range)))
-        self.precipitation_map = np.zeros((len(self.longitude_range), len(self.latitude_range)))
-        
-        # Initialize wind map with tuples of (speed, direction)
-        self.wind_map = np.zeros((len(self.longitude_range), len(self.latitude_range)), dtype=object)
-        for i in range(len(self.longitude_range)):
-            for j in range(len(self.latitude_range)):
-                self.wind_map[i][j] = (0.0, 0.0)  # (speed, direction)
+        self.grid = RasterGrid(-180.0, 180.0, -90.0, 90.0, 1.0, 1.0)  # 1-degree resolution
+        self.longitude_range = self.grid.longitudes
+        self.latitude_range = self.grid.latitudes
+        
+        # Current conditions as dense per-cell layers, indexed [lon_index, lat_index]
+        self.temperature_map = self.grid.layer(np.float32)  # Celsius
+        self.precipitation_map = self.grid.layer(np.float32)
+        self.wind_speed_map = self.grid.layer(np.float32)
+        self.wind_direction_map = self.grid.layer(np.float32)  # degrees
+        self.weather_map = self.grid.layer(np.uint8)  # WEATHER_CODES
+        self.current_conditions = ClimateConditionsView(self)  # (longitude, latitude) -> Dict
 
         # Simulation time tracking
         self.current_time = 0.0
+
+        # Optional keyframe schedule (ClimateKeyframes); None steps the model every update
+        self.keyframes = None
+
+        # Seasonal factors and solar time come from the world's tables, read by latitude row
+        self.solar = world.solar
+        self._solar_rows = self.solar.rows(self.grid.latitudes)
+        self._seasonal_rows = self.solar.seasonal_factor[self._solar_rows]
+
+        # Advection and diffusion substeps per update; 0 leaves cells independent
+        self.transport_substeps = TRANSPORT_SUBSTEPS
+        # Cell size in metres per latitude row, and the cell index mesh transport samples from
+        self._cell_width = np.maximum(
+            111.32e3 * np.cos(np.radians(self.grid.latitudes)) * self.grid.longitude_resolution, 1.0
+        ).astype(np.float32)
+        self._cell_height = 111.32e3 * self.grid.latitude_resolution
+        self._cell_indices = np.indices(self.grid.shape, dtype=np.float32)
         
         self.initialize_earth_climate()
         
     def initialize_earth_climate(self):
         """Initialize Earth-like climate system."""
         logger.info("Initializing Earth climate system...")
-        total_steps = len(self.longitude_range) * len(self.latitude_range)
-        current_step = 0
+        lons, lats = self.grid.mesh()
         
-        for i, lon in enumerate(self.longitude_range):
-            for j, lat in enumerate(self.latitude_range):
-                # Initialize temperature
-                self.temperature_map[i][j] = self._calculate_base_temperature(lat)
-                
-                # Initialize precipitation
-                self.precipitation_map[i][j] = self._calculate_base_precipitation(lat, lon)
-                
-                # Initialize wind
-                self.wind_map[i][j] = self._calculate_base_wind(lat, lon)
-                
-                # Update progress
-                current_step += 1
-                if current_step % 100 == 0:
-                    progress = (current_step / total_steps) * 100
-                    logger.info(f"Climate initialization progress: {progress:.1f}%")
+        # Initialize temperature, precipitation and wind for every cell at once
+        self.temperature_map[:] = self._calculate_base_temperature(lats)
+        self.precipitation_map[:] = self._calculate_base_precipitation(lats, lons)
+        self.wind_speed_map[:] = self._calculate_base_wind(lats, lons)
+        self.wind_direction_map.fill(0.0)
+        self._update_weather_map()
         
         logger.info("Earth climate system initialized successfully")
 
@@ -110,15 +165,10 @@ class ClimateSystem:
             return False
             
         # Check wind map
-        if not hasattr(self, 'wind_map') or not self.wind_map.any():
+        if not hasattr(self, 'wind_speed_map') or not self.wind_speed_map.any():
             logger.error("Wind map not initialized")
             return False
             
-        # Check current conditions
-        if not hasattr(self, 'current_conditions') or not self.current_conditions:
-            logger.error("Current conditions not initialized")
-            return False
-            
         logger.info("Climate system initialization verified successfully")
         return True
         
@@ -407,8 +457,8 @@ class ClimateSystem:
                 
     def get_climate_at(self, longitude: float, latitude: float) -> Dict:
         """Get climate data at given coordinates."""
-        lon_grid = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_grid = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
+        lon_grid = round(longitude / self.grid.longitude_resolution) * self.grid.longitude_resolution
+        lat_grid = round(latitude / self.grid.latitude_resolution) * self.grid.latitude_resolution
         
         return self.climate_data.get((lon_grid, lat_grid), {
             "temperature": 15.0,  # Default temperature
@@ -423,8 +473,8 @@ class ClimateSystem:
         
     def get_temperature_at(self, longitude: float, latitude: float) -> float:
         """Get temperature at given coordinates in Celsius."""
-        lon_grid = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_grid = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
+        lon_grid = round(longitude / self.grid.longitude_resolution) * self.grid.longitude_resolution
+        lat_grid = round(latitude / self.grid.latitude_resolution) * self.grid.latitude_resolution
         return self.temperature_data.get((lon_grid, lat_grid), 20.0)
 
     def get_temperature(self, longitude: float, latitude: float) -> float:
@@ -433,24 +483,37 @@ class ClimateSystem:
         
     def get_precipitation_at(self, longitude: float, latitude: float) -> float:
         """Get precipitation at given coordinates in mm/year."""
-        lon_grid = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_grid = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
+        lon_grid = round(longitude / self.grid.longitude_resolution) * self.grid.longitude_resolution
+        lat_grid = round(latitude / self.grid.latitude_resolution) * self.grid.latitude_resolution
         return self.precipitation_data.get((lon_grid, lat_grid), 0.0)
 
     def get_precipitation(self, longitude: float, latitude: float) -> float:
         """Alias for get_precipitation_at."""
         return self.get_precipitation_at(longitude, latitude)
         
+    def get_temperatures_at(self, longitudes, latitudes) -> np.ndarray:
+        """Batch temperature lookup in Celsius from the temperature raster."""
+        return self.grid.sample(self.temperature_map, longitudes, latitudes, 20.0)
+
+    def get_precipitations_at(self, longitudes, latitudes) -> np.ndarray:
+        """Batch precipitation lookup from the precipitation raster."""
+        return self.grid.sample(self.precipitation_map, longitudes, latitudes, 0.0)
+
+    def get_base_climate_at(self, longitudes, latitudes) -> Tuple[np.ndarray, np.ndarray]:
+        """Batch (temperature, precipitation) of the initial climate, independent of the current state."""
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        return self._calculate_base_temperature(latitudes), self._calculate_base_precipitation(latitudes, longitudes)
+
     def get_humidity_at(self, longitude: float, latitude: float) -> float:
         """Get humidity at given coordinates (0-1)."""
-        lon_grid = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_grid = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
+        lon_grid = round(longitude / self.grid.longitude_resolution) * self.grid.longitude_resolution
+        lat_grid = round(latitude / self.grid.latitude_resolution) * self.grid.latitude_resolution
         return self.humidity_data.get((lon_grid, lat_grid), 0.5)
         
     def get_wind_at(self, longitude: float, latitude: float) -> Dict:
         """Get wind data at given coordinates."""
-        lon_grid = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_grid = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
+        lon_grid = round(longitude / self.grid.longitude_resolution) * self.grid.longitude_resolution
+        lat_grid = round(latitude / self.grid.latitude_resolution) * self.grid.latitude_resolution
         return self.wind_data.get((lon_grid, lat_grid), {"speed": 0.0, "direction": 0.0})
         
     def get_state(self) -> Dict:
@@ -460,7 +523,8 @@ class ClimateSystem:
             'temperature_data': self.temperature_data,
             'precipitation_data': self.precipitation_data,
             'humidity_data': self.humidity_data,
-            'wind_data': self.wind_data
+            'wind_data': self.wind_data,
+            'keyframes': self.keyframes.get_state() if self.keyframes is not None else None
         }
         
     def get_climate_effects(self, longitude: float, latitude: float) -> Dict[str, float]:
@@ -513,8 +577,8 @@ class ClimateSystem:
     def _initialize_temperature_map(self):
         """Initialize the temperature map based on latitude and elevation."""
         logger.info("Initializing temperature map...")
-        for lon in np.arange(-180, 180, self.world.longitude_resolution):
-            for lat in np.arange(-90, 90, self.world.latitude_resolution):
+        for lon in np.arange(-180, 180, self.grid.longitude_resolution):
+            for lat in np.arange(-90, 90, self.grid.latitude_resolution):
                 # Base temperature varies with latitude
                 base_temp = 30 - abs(lat) * 0.5  # 30°C at equator, decreasing towards poles
                 
@@ -535,8 +599,8 @@ class ClimateSystem:
     def _initialize_precipitation_map(self):
         """Initialize the precipitation map based on temperature and terrain."""
         logger.info("Initializing precipitation map...")
-        for lon in np.arange(-180, 180, self.world.longitude_resolution):
-            for lat in np.arange(-90, 90, self.world.latitude_resolution):
+        for lon in np.arange(-180, 180, self.grid.longitude_resolution):
+            for lat in np.arange(-90, 90, self.grid.latitude_resolution):
                 # Base precipitation varies with latitude
                 base_precip = 100 * np.cos(lat * np.pi / 180)  # More precipitation near equator
                 
@@ -555,49 +619,17 @@ class ClimateSystem:
                 self.precipitation_map[(lon, lat)] = precipitation
         logger.info("Precipitation map initialized")
 
-    def _initialize_wind_map(self, time_delta: float):
-        """Initialize wind map with random wind patterns."""
-        logger.info("Updating wind conditions...")
-        # Use the correct map size attribute for wind map
-        map_size = len(self.longitude_range)
-        for i in range(map_size):
-            for j in range(len(self.latitude_range)):
-                speed = np.random.uniform(0, 30)
-                direction = np.random.uniform(0, 360)
-                self.wind_map[i][j] = (speed, direction)
-
-    def _initialize_current_conditions(self):
-        """Initialize current weather conditions."""
-        logger.info("Initializing current conditions...")
-        for lon in np.arange(-180, 180, self.world.longitude_resolution):
-            for lat in np.arange(-90, 90, self.world.latitude_resolution):
-                temperature = self.temperature_map.get((lon, lat), 20)
-                precipitation = self.precipitation_map.get((lon, lat), 0)
-                wind_speed, wind_direction = self.wind_map[lon, lat]
-                
-                # Determine weather type
-                if precipitation > 50:
-                    weather = "rain"
-                elif precipitation > 20:
-                    weather = "cloudy"
-                elif temperature < 0:
-                    weather = "snow"
-                else:
-                    weather = "clear"
-                
-                self.current_conditions[(lon, lat)] = {
-                    "temperature": temperature,
-                    "precipitation": precipitation,
-                    "wind_speed": wind_speed,
-                    "wind_direction": wind_direction,
-                    "weather": weather
-                }
-        logger.info("Current conditions initialized")
-
     def update(self, time_delta: float):
         """Update climate conditions over time."""
         logger.info(f"Updating climate conditions for {time_delta} minutes...")
         self.current_time += time_delta
+
+        if self.keyframes is not None:
+            # Blend the precomputed keyframes instead of stepping the model
+            self.keyframes.apply(self.current_time)
+            self._update_weather_map()
+            logger.info("Climate conditions interpolated")
+            return
         
         # Update temperature map
         self._update_temperature_map(time_delta)
@@ -606,87 +638,186 @@ class ClimateSystem:
         self._update_precipitation_map(time_delta)
         
         # Update wind map
-        self._initialize_wind_map(time_delta)
+        self._update_wind_map()
         
+        # Carry heat and moisture along the new winds
+        self.transport(self.temperature_map, self.precipitation_map,
+                       self.wind_speed_map, self.wind_direction_map, time_delta)
+
         # Update current conditions
-        self._update_current_conditions()
+        self._update_weather_map()
         
         logger.info("Climate conditions updated")
 
     def _update_temperature_map(self, time_delta: float):
         """Update temperature map over time."""
-        for (i, j), temp in np.ndenumerate(self.temperature_map):
-            # Daily cycle
-            daily_factor = 5 * np.sin(2 * np.pi * (self.current_time % (24 * 60)) / (24 * 60))
-            
-            # Seasonal cycle
-            seasonal_factor = 10 * np.sin(2 * np.pi * self.current_time / (365 * 24 * 60))
-            
-            # Random variation
-            random_factor = np.random.normal(0, 0.1) * time_delta
-            
-            self.temperature_map[i][j] = temp + daily_factor + seasonal_factor + random_factor
+        self.advance_temperature(self.temperature_map, [self.current_time], time_delta, self.rng)
 
     def _update_precipitation_map(self, time_delta: float):
         """Update precipitation map over time."""
-        for (i, j), precip in np.ndenumerate(self.precipitation_map):
-            # Seasonal variation
-            seasonal_factor = 50 * np.sin(2 * np.pi * self.current_time / (365 * 24 * 60))
-            
-            # Random variation
-            random_factor = np.random.normal(0, 5) * time_delta
-
-            self.precipitation_map[i][j] = max(0, precip + seasonal_factor + random_factor)
-
-    def _update_current_conditions(self):
-        """Update current weather conditions based on maps."""
-        for (i, j), temperature in np.ndenumerate(self.temperature_map):
-            lon = self.longitude_range[i]
-            lat = self.latitude_range[j]
-            precipitation = self.precipitation_map[i][j]
-            wind_speed, wind_direction = self.wind_map[i][j]
-            
-            # Determine weather type
-            if precipitation > 50:
-                weather = "rain"
-            elif precipitation > 20:
-                weather = "cloudy"
-            elif temperature < 0:
-                weather = "snow"
-            else:
-                weather = "clear"
-            
-            self.current_conditions[(lon, lat)] = {
-                "temperature": temperature,
-                "precipitation": precipitation,
-                "wind_speed": wind_speed,
-                "wind_direction": wind_direction,
-                "weather": weather
-            }
+        self.advance_precipitation(self.precipitation_map, [self.current_time], time_delta, self.rng)
+
+    def _update_wind_map(self):
+        """Redraw wind speed and direction for every cell."""
+        self.draw_wind(self.wind_speed_map, self.wind_direction_map, self.rng)
+
+    def advance_temperature(self, temperature: np.ndarray, times, time_delta: float, rng) -> None:
+        """Advance a temperature layer in place through steps of time_delta ending at each of times.
+
+        The daily and seasonal terms grow with the step length and the noise variance
+        with the elapsed time, so one long step matches many unit steps. The per-step
+        noise is summed into one draw with the same distribution.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        days = self._days_of_year(times)
+
+        # Daily cycle by local solar time, warmest at noon; one value per longitude column
+        hours = (times % DAY_LENGTH)[:, None] / (DAY_LENGTH / 24)
+        solar_time = self.solar.local_solar_time(hours, days[:, None], self.grid.longitudes[None, :])
+        daily_factor = (5 * np.sin(2 * np.pi * (solar_time - 6) / 24)).sum(axis=0) * time_delta
+
+        # Seasonal cycle per latitude row
+        seasonal_factor = 10 * self._seasonal_factor(days) * time_delta
+
+        # Random variation per cell
+        random_factor = rng.normal(0, 0.1 * math.sqrt(len(times) * time_delta), self.grid.shape)
+
+        temperature += daily_factor[:, None] + seasonal_factor + random_factor
+
+    def advance_precipitation(self, precipitation: np.ndarray, times, time_delta: float, rng) -> None:
+        """Advance a precipitation layer in place like :meth:`advance_temperature`, clamping at zero."""
+        times = np.asarray(times, dtype=np.float64)
+
+        # Seasonal variation per latitude row
+        seasonal_factor = 50 * self._seasonal_factor(self._days_of_year(times)) * time_delta
+
+        # Random variation per cell
+        random_factor = rng.normal(0, 5 * math.sqrt(len(times) * time_delta), self.grid.shape)
 
-    def _calculate_base_temperature(self, latitude: float) -> float:
-        """Placeholder temperature model based on latitude."""
-        return 30.0 - abs(latitude) * 0.3
+        precipitation += seasonal_factor + random_factor
+        np.maximum(precipitation, 0.0, out=precipitation)
 
-    def _calculate_base_precipitation(self, latitude: float, longitude: float) -> float:
-        """Placeholder precipitation model."""
-        return max(0.0, 1.0 - abs(latitude) / 90.0)
+    def _days_of_year(self, times: np.ndarray) -> np.ndarray:
+        """Get the day of year (1-365) of each climate time; climate time 0 is the March equinox."""
+        days = (times // DAY_LENGTH).astype(np.intp) + MARCH_EQUINOX_DAY - 1
+        return days % (YEAR_LENGTH // DAY_LENGTH) + 1
 
-    def _calculate_base_wind(self, latitude: float, longitude: float) -> Dict:
-        """Placeholder wind speed model."""
-        return abs(latitude) * 0.1
+    def _seasonal_factor(self, days: np.ndarray) -> np.ndarray:
+        """Sum the tabulated seasonal factor of each latitude row over days of year."""
+        return self._seasonal_rows[:, days - 1].sum(axis=1)
+
+    def draw_wind(self, speed: np.ndarray, direction: np.ndarray, rng) -> None:
+        """Fill wind speed and direction layers with fresh draws."""
+        speed[:] = rng.uniform(0, 30, self.grid.shape)
+        direction[:] = rng.uniform(0, 360, self.grid.shape)
+
+    def transport(self, temperature: np.ndarray, moisture: np.ndarray, wind_speed: np.ndarray,
+                  wind_direction: np.ndarray, time_delta: float, substeps: Optional[int] = None) -> None:
+        """Advect heat and moisture along the wind and diffuse them, in place.
+
+        Wind speed is in m/s and direction in degrees clockwise from north, the way
+        the air moves. Longitude wraps around; latitude is clamped at the poles.
+        """
+        substeps = self.transport_substeps if substeps is None else substeps
+        if substeps <= 0 or time_delta <= 0:
+            return
+        seconds = time_delta * TIME_UNIT_SECONDS / substeps
+
+        # Wind displacement per substep in cells; semi-Lagrangian sampling is stable for any length
+        heading = np.radians(wind_direction, dtype=np.float32)
+        distance = wind_speed * np.float32(seconds)
+        departure_lon = self._cell_indices[0] - distance * np.sin(heading) / self._cell_width
+        departure_lat = self._cell_indices[1] - distance * np.cos(heading) / np.float32(self._cell_height)
+        np.clip(departure_lat, 0, self.grid.shape[1] - 1, out=departure_lat)
+
+        # Bilinear corners and weights of the departure points, shared by both layers and all substeps
+        n_lon, n_lat = self.grid.shape
+        lon_floor = np.floor(departure_lon)
+        lat_floor = np.minimum(np.floor(departure_lat), n_lat - 2)
+        fx = (departure_lon - lon_floor).ravel()
+        fy = (departure_lat - lat_floor).ravel()
+        i0 = lon_floor.astype(np.intp) % n_lon
+        i1 = (i0 + 1) % n_lon
+        j0 = lat_floor.astype(np.intp)
+        corners = [i * n_lat + j for i in (i0, i1) for j in (j0, j0 + 1)]
+        corners = [corner.ravel() for corner in corners]
+        weights = [(1 - fx) * (1 - fy), (1 - fx) * fy, fx * (1 - fy), fx * fy]
+
+        # Explicit diffusion coefficients per latitude row
+        diffusion_lon = np.minimum(TRANSPORT_DIFFUSIVITY * seconds / self._cell_width.astype(np.float64) ** 2,
+                                   MAX_DIFFUSION_COEFFICIENT).astype(np.float32)
+        diffusion_lat = min(TRANSPORT_DIFFUSIVITY * seconds / self._cell_height ** 2, MAX_DIFFUSION_COEFFICIENT)
+        smoothing_lat = [diffusion_lat, 1.0 - 2.0 * diffusion_lat, diffusion_lat]
+
+        for layer in (temperature, moisture):
+            field = np.asarray(layer, dtype=np.float32)
+            for _ in range(substeps):
+                flat = field.ravel()
+                field = (weights[0] * flat[corners[0]] + weights[1] * flat[corners[1]] +
+                         weights[2] * flat[corners[2]] + weights[3] * flat[corners[3]]).reshape(self.grid.shape)
+                field = (ndimage.correlate1d(field, smoothing_lat, axis=1, mode='nearest') +
+                         diffusion_lon * ndimage.correlate1d(field, [1.0, -2.0, 1.0], axis=0, mode='wrap'))
+            layer[:] = field
+        np.maximum(moisture, 0.0, out=moisture)
+
+    def _update_weather_map(self):
+        """Classify each cell's weather from its precipitation and temperature."""
+        self.weather_map[:] = np.select(
+            [self.precipitation_map > 50, self.precipitation_map > 20, self.temperature_map < 0],
+            [WEATHER_CODES['rain'], WEATHER_CODES['cloudy'], WEATHER_CODES['snow']],
+            WEATHER_CODES['clear']
+        )
+
+    def get_conditions_at(self, longitude: float, latitude: float) -> Optional[Dict]:
+        """Get the current conditions of the cell nearest a coordinate, or None outside the grid."""
+        return self.current_conditions.get((longitude, latitude))
+
+    def get_conditions_window(self, min_longitude: float, min_latitude: float,
+                              max_longitude: float, max_latitude: float) -> Dict[str, np.ndarray]:
+        """Get read-only views of the condition layers for the cells whose centres lie in a box.
+
+        Layers are indexed [lon_index, lat_index] against the returned longitudes and latitudes.
+        """
+        window = self.grid.window(min_longitude, min_latitude, max_longitude, max_latitude)
+        arrays = {
+            'longitudes': self.grid.longitudes[window[0]],
+            'latitudes': self.grid.latitudes[window[1]],
+            'temperature': self.temperature_map[window],
+            'precipitation': self.precipitation_map[window],
+            'wind_speed': self.wind_speed_map[window],
+            'wind_direction': self.wind_direction_map[window],
+            'weather': self.weather_map[window]
+        }
+        for array in arrays.values():
+            array.flags.writeable = False
+        return arrays
+
+    def _calculate_base_temperature(self, latitude):
+        """Placeholder temperature model based on latitude; accepts scalars or arrays."""
+        return 30.0 - np.abs(latitude) * 0.3
+
+    def _calculate_base_precipitation(self, latitude, longitude):
+        """Placeholder precipitation model; accepts scalars or arrays."""
+        return np.maximum(0.0, 1.0 - np.abs(latitude) / 90.0)
+
+    def _calculate_base_wind(self, latitude, longitude):
+        """Placeholder wind speed model; accepts scalars or arrays."""
+        return np.abs(latitude) * 0.1
 
     def get_nearby_climate(self, longitude: float, latitude: float, radius: float) -> Dict[str, Dict]:
-        """Get climate data within radius of location."""
+        """Get climate data for the cells within radius of location, keyed "lon,lat" by cell centre."""
+        window = self.get_conditions_window(longitude - radius, latitude - radius,
+                                            longitude + radius, latitude + radius)
+        layers = {name: window[name].tolist()
+                  for name in ('temperature', 'precipitation', 'wind_speed', 'wind_direction', 'weather')}
         nearby = {}
-        for dlon in np.arange(-radius, radius + self.world.longitude_resolution, self.world.longitude_resolution):
-            for dlat in np.arange(-radius, radius + self.world.latitude_resolution, self.world.latitude_resolution):
-                check_lon = longitude + dlon
-                check_lat = latitude + dlat
-                pos = (check_lon, check_lat)
-                if pos in self.current_conditions:
-                    nearby[f"{check_lon},{check_lat}"] = {
-                        str(key): value 
-                        for key, value in self.current_conditions[pos].items()
-                    }
+        for i, lon in enumerate(window['longitudes'].tolist()):
+            for j, lat in enumerate(window['latitudes'].tolist()):
+                nearby[f"{lon},{lat}"] = {
+                    "temperature": layers['temperature'][i][j],
+                    "precipitation": layers['precipitation'][i][j],
+                    "wind_speed": layers['wind_speed'][i][j],
+                    "wind_direction": layers['wind_direction'][i][j],
+                    "weather": WEATHER_NAMES[layers['weather'][i][j]]
+                }
         return nearby 
\ No newline at end of file
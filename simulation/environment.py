@@ -5,7 +5,6 @@ import random
 import logging
 import time
 from datetime import datetime
-import math
 from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -85,35 +84,19 @@ class Environment:
         return self.world.climate.get_climate_at(x, y)
 
     def get_weather_at(self, x: float, y: float) -> Dict:
-        """Get current weather data from the world's weather system."""
-        return self.world.weather.get_state().get("current_weather", {})
+        """Get local weather data from the world's weather system."""
+        return self.world.get_weather_at(x, y)
 
 
-    def _calculate_day_length(self, latitude: float, day_of_year: int) -> float:
-        """Approximate day length in hours for a latitude and day of year."""
-        axial_tilt = 23.44  # degrees
-        lat_rad = math.radians(latitude)
-        decl = math.radians(axial_tilt) * math.sin(
-            2 * math.pi * (day_of_year - 81) / 365
-        )
-        cos_ha = (
-            math.sin(math.radians(-0.83)) - math.sin(lat_rad) * math.sin(decl)
-        ) / (math.cos(lat_rad) * math.cos(decl))
-        cos_ha = max(-1.0, min(1.0, cos_ha))
-        ha = math.acos(cos_ha)
-        return 2 * ha * 24 / (2 * math.pi)
-
     def update(self, time_delta: float):
         """Update environment state."""
         # Convert simulation seconds to hours for environmental calculations
         hours = time_delta / 3600.0
 
         # Determine current sunrise and sunset based on latitude and season
-
-        mid_lat = self.center_latitude
-
-        day_of_year = self.world.game_time.timetuple().tm_yday
-        day_length = self._calculate_day_length(mid_lat, day_of_year)
+        solar = self.world.solar
+        day_of_year = solar.day_of_year(self.world.game_time)
+        day_length = solar.day_length_at(self.center_latitude, day_of_year)
         sunrise = 12 - day_length / 2
         sunset = 12 + day_length / 2
 
@@ -127,8 +110,8 @@ class Environment:
             self.season = "fall"
         else:
             self.season = "winter"
-        # Update time of day
-        self.time_of_day = (self.time_of_day + hours) % 24.0
+        # Local solar time at the environment's longitude
+        self.time_of_day = solar.solar_time_at(self.center_longitude, self.world.game_time)
 
         # Update temperature based on time of day
         if sunrise <= self.time_of_day < sunset:  # Daytime
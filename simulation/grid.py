@@ -0,0 +1,133 @@
+import os
+from typing import Iterator, Optional, Tuple
+import numpy as np
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Cells per strip when a whole-grid pass is processed in bounded-memory chunks
+STRIP_CELLS = 1 << 20
+
+
+class RasterGrid:
+    """Regular longitude/latitude raster. Layers are arrays of shape (n_lon, n_lat).
+
+    With a ``storage_dir``, named layers are memory-mapped ``.npy`` files so only
+    the pages actually read or written are resident.
+    """
+
+    def __init__(self, min_longitude: float, max_longitude: float, min_latitude: float, max_latitude: float,
+                 longitude_resolution: float, latitude_resolution: float, storage_dir: Optional[str] = None):
+        self.min_longitude = min_longitude
+        self.max_longitude = max_longitude
+        self.min_latitude = min_latitude
+        self.max_latitude = max_latitude
+        self.longitude_resolution = longitude_resolution
+        self.latitude_resolution = latitude_resolution
+        self.storage_dir = storage_dir
+
+        # Cell centre coordinates along each axis
+        # Cell counts are rounded so fine resolutions do not gain a cell from float drift
+        n_lon = int(round((max_longitude - min_longitude) / longitude_resolution))
+        n_lat = int(round((max_latitude - min_latitude) / latitude_resolution))
+        self.longitudes = min_longitude + longitude_resolution * np.arange(n_lon)
+        self.latitudes = min_latitude + latitude_resolution * np.arange(n_lat)
+        self.shape = (len(self.longitudes), len(self.latitudes))
+        self.size = self.shape[0] * self.shape[1]
+
+    @classmethod
+    def from_world(cls, world, storage_dir: Optional[str] = None) -> 'RasterGrid':
+        """Create a grid matching the world's bounds and resolution."""
+        return cls(world.min_longitude, world.max_longitude, world.min_latitude, world.max_latitude,
+                   world.longitude_resolution, world.latitude_resolution, storage_dir)
+
+    def index(self, longitude: float, latitude: float) -> Optional[Tuple[int, int]]:
+        """Get the (i, j) cell nearest to a coordinate, or None if outside the grid."""
+        i = round((longitude - self.min_longitude) / self.longitude_resolution)
+        j = round((latitude - self.min_latitude) / self.latitude_resolution)
+        if 0 <= i < self.shape[0] and 0 <= j < self.shape[1]:
+            return i, j
+        return None
+
+    def indices(self, longitudes, latitudes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized :meth:`index`: cell indices clipped into the grid plus an inside-grid mask."""
+        i = np.rint((np.asarray(longitudes, dtype=np.float64) - self.min_longitude) / self.longitude_resolution)
+        j = np.rint((np.asarray(latitudes, dtype=np.float64) - self.min_latitude) / self.latitude_resolution)
+        inside = (i >= 0) & (i < self.shape[0]) & (j >= 0) & (j < self.shape[1])
+        i = np.clip(i, 0, self.shape[0] - 1).astype(np.intp)
+        j = np.clip(j, 0, self.shape[1] - 1).astype(np.intp)
+        return i, j, inside
+
+    def sample(self, layer: np.ndarray, longitudes, latitudes, default: float = 0) -> np.ndarray:
+        """Read a layer at many coordinates; points outside the grid get ``default``."""
+        i, j, inside = self.indices(longitudes, latitudes)
+        return np.where(inside, layer[i, j], default)
+
+    def interpolate(self, layer: np.ndarray, longitudes, latitudes) -> np.ndarray:
+        """Bilinearly interpolate a layer between cell centres, clamping at the grid edges."""
+        x = np.clip((np.asarray(longitudes, dtype=np.float64) - self.min_longitude) / self.longitude_resolution,
+                    0, self.shape[0] - 1)
+        y = np.clip((np.asarray(latitudes, dtype=np.float64) - self.min_latitude) / self.latitude_resolution,
+                    0, self.shape[1] - 1)
+        i = np.minimum(np.floor(x).astype(np.intp), self.shape[0] - 2)
+        j = np.minimum(np.floor(y).astype(np.intp), self.shape[1] - 2)
+        fx = x - i
+        fy = y - j
+        return ((layer[i, j] * (1 - fx) + layer[i + 1, j] * fx) * (1 - fy) +
+                (layer[i, j + 1] * (1 - fx) + layer[i + 1, j + 1] * fx) * fy)
+
+    def coordinates(self, i: int, j: int) -> Tuple[float, float]:
+        """Get the (longitude, latitude) of a cell."""
+        return float(self.longitudes[i]), float(self.latitudes[j])
+
+    def cells(self) -> Iterator[Tuple[int, int, float, float]]:
+        """Iterate over (i, j, longitude, latitude) for every cell."""
+        for i, lon in enumerate(self.longitudes):
+            for j, lat in enumerate(self.latitudes):
+                yield i, j, float(lon), float(lat)
+
+    def mesh(self, rows: slice = slice(None)) -> Tuple[np.ndarray, np.ndarray]:
+        """Get longitude and latitude arrays with the layer shape, optionally for a strip of rows."""
+        return np.meshgrid(self.longitudes[rows], self.latitudes, indexing='ij')
+
+    def strips(self, max_cells: int = STRIP_CELLS) -> Iterator[slice]:
+        """Split the longitude axis into row slices covering at most ``max_cells`` cells each."""
+        step = max(1, max_cells // self.shape[1])
+        for start in range(0, self.shape[0], step):
+            yield slice(start, min(start + step, self.shape[0]))
+
+    def band(self, lon_range: Tuple[float, float], lat_range: Tuple[float, float]) -> Tuple[slice, slice]:
+        """Index slices of the cells with lon_range[0] <= lon < lon_range[1], likewise for latitude."""
+        # Tolerate float drift in the cell coordinates
+        lon_bounds = np.asarray(lon_range, dtype=np.float64) - 1e-6 * self.longitude_resolution
+        lat_bounds = np.asarray(lat_range, dtype=np.float64) - 1e-6 * self.latitude_resolution
+        i0, i1 = np.searchsorted(self.longitudes, lon_bounds)
+        j0, j1 = np.searchsorted(self.latitudes, lat_bounds)
+        return slice(int(i0), int(i1)), slice(int(j0), int(j1))
+
+    def window(self, min_longitude: float, min_latitude: float,
+               max_longitude: float, max_latitude: float) -> Tuple[slice, slice]:
+        """Index slices of the cells whose centres lie inside a box, edges included."""
+        lon_tolerance = 1e-6 * self.longitude_resolution
+        lat_tolerance = 1e-6 * self.latitude_resolution
+        i0 = np.searchsorted(self.longitudes, min_longitude - lon_tolerance, side='left')
+        i1 = np.searchsorted(self.longitudes, max_longitude + lon_tolerance, side='right')
+        j0 = np.searchsorted(self.latitudes, min_latitude - lat_tolerance, side='left')
+        j1 = np.searchsorted(self.latitudes, max_latitude + lat_tolerance, side='right')
+        return slice(int(i0), int(i1)), slice(int(j0), int(j1))
+
+    def layer(self, dtype=np.float32, fill: float = 0, name: Optional[str] = None,
+              channels: Optional[int] = None) -> np.ndarray:
+        """Allocate a layer filled with a constant, with an optional trailing channel axis.
+
+        Named layers are memory-mapped files when the grid has a storage directory.
+        """
+        shape = self.shape if channels is None else self.shape + (channels,)
+        if self.storage_dir is None or name is None:
+            return np.full(shape, fill, dtype=dtype)
+        os.makedirs(self.storage_dir, exist_ok=True)
+        layer = np.lib.format.open_memmap(os.path.join(self.storage_dir, f"{name}.npy"), mode='w+',
+                                          dtype=dtype, shape=shape)
+        if fill:
+            layer[...] = fill  # New files start zeroed
+        return layer
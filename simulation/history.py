@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class HistoryTier:
+    """One resolution of a history: entries of ``resolution`` seconds, ``capacity`` of them kept."""
+    name: str
+    resolution: float  # Seconds aggregated per entry; 0 keeps every sample
+    capacity: int
+
+
+# The last hour of samples, a day of minutes, 90 days of hours and ten years of days
+DEFAULT_TIERS = (
+    HistoryTier('sample', 0, 3600),
+    HistoryTier('minute', 60, 24 * 60),
+    HistoryTier('hour', 3600, 90 * 24),
+    HistoryTier('day', 86400, 10 * 365),
+)
+
+
+class HistoryBuffer:
+    """Fixed-capacity ring of timestamped rows holding the mean, min and max of each variable."""
+
+    def __init__(self, tier: HistoryTier, variable_count: int):
+        self.tier = tier
+        capacity = tier.capacity
+        self.time = np.zeros(capacity, dtype=np.float64)
+        self.mean = np.zeros((capacity, variable_count), dtype=np.float32)
+        self.min = np.zeros((capacity, variable_count), dtype=np.float32)
+        self.max = np.zeros((capacity, variable_count), dtype=np.float32)
+        self.category = np.zeros(capacity, dtype=np.uint8)  # Most frequent category code
+        self.head = 0  # Next row written
+        self.size = 0
+
+    def append(self, time: float, mean: np.ndarray, low: np.ndarray, high: np.ndarray, category: int) -> None:
+        """Write a row, overwriting the oldest once full."""
+        i = self.head
+        self.time[i] = time
+        self.mean[i] = mean
+        self.min[i] = low
+        self.max[i] = high
+        self.category[i] = category
+        self.head = (i + 1) % self.tier.capacity
+        self.size = min(self.size + 1, self.tier.capacity)
+
+    def oldest(self) -> Optional[float]:
+        """Time of the oldest row kept, or None when empty."""
+        if not self.size:
+            return None
+        return float(self.time[(self.head - self.size) % self.tier.capacity])
+
+    def rows(self, start: float, end: float) -> np.ndarray:
+        """Row indices with start <= time <= end, oldest first."""
+        order = np.arange(self.head - self.size, self.head) % self.tier.capacity
+        times = self.time[order]
+        return order[np.searchsorted(times, start, side='left'):np.searchsorted(times, end, side='right')]
+
+
+class WeatherHistory:
+    """Weather samples at fixed memory, rolled up into coarser tiers as they arrive.
+
+    Every sample goes into the finest tier and into an open bucket per coarser tier;
+    a bucket becomes a row once a sample lands past its end. Circular variables
+    (degrees) are averaged as unit vectors. The category of a row is its most
+    frequent sample category.
+    """
+
+    def __init__(self, variables: Sequence[str], category_count: int, circular: Sequence[str] = (),
+                 tiers: Sequence[HistoryTier] = DEFAULT_TIERS):
+        self.variables = tuple(variables)
+        self.tiers = {tier.name: HistoryBuffer(tier, len(self.variables)) for tier in tiers}
+        self._circular = np.array([name in circular for name in self.variables])
+
+        # Open buckets of the aggregated tiers, one row each
+        self._aggregated = [buffer for buffer in self.tiers.values() if buffer.tier.resolution > 0]
+        count = len(self._aggregated)
+        self._resolution = np.array([buffer.tier.resolution for buffer in self._aggregated], dtype=np.float64)
+        self._bucket = np.full(count, -1, dtype=np.int64)
+        self._count = np.zeros(count, dtype=np.int64)
+        self._sum = np.zeros((count, len(self.variables)), dtype=np.float64)
+        self._east = np.zeros((count, len(self.variables)), dtype=np.float64)
+        self._north = np.zeros((count, len(self.variables)), dtype=np.float64)
+        self._min = np.full((count, len(self.variables)), np.inf)
+        self._max = np.full((count, len(self.variables)), -np.inf)
+        self._categories = np.zeros((count, category_count), dtype=np.int64)
+
+    def record(self, time: float, values: Sequence[float], category: int) -> None:
+        """Add one sample taken at ``time`` seconds."""
+        values = np.asarray(values, dtype=np.float64)
+        for buffer in self.tiers.values():
+            if buffer.tier.resolution == 0:
+                buffer.append(time, values, values, values, category)
+
+        # Close the buckets this sample has moved past
+        buckets = np.floor(time / self._resolution).astype(np.int64)
+        for k in np.flatnonzero((buckets != self._bucket) & (self._count > 0)):
+            self._flush(k)
+        self._bucket[:] = buckets
+
+        self._count += 1
+        self._sum += values
+        radians = np.radians(values)
+        self._east += np.sin(radians)
+        self._north += np.cos(radians)
+        np.minimum(self._min, values, out=self._min)
+        np.maximum(self._max, values, out=self._max)
+        self._categories[:, category] += 1
+
+    def _flush(self, k: int) -> None:
+        """Write open bucket ``k`` to its tier and reset it."""
+        mean = self._sum[k] / self._count[k]
+        # Wrap in the stored precision: a small negative angle would round up to 360 in float32
+        circular_mean = np.mod(np.degrees(np.arctan2(self._east[k], self._north[k])).astype(np.float32),
+                               np.float32(360.0))
+        circular_mean[circular_mean >= 360.0] = 0.0
+        mean = np.where(self._circular, circular_mean, mean)
+        self._aggregated[k].append(self._bucket[k] * self._resolution[k], mean, self._min[k], self._max[k],
+                                   int(np.argmax(self._categories[k])))
+        self._count[k] = 0
+        self._sum[k] = self._east[k] = self._north[k] = 0.0
+        self._min[k] = np.inf
+        self._max[k] = -np.inf
+        self._categories[k] = 0
+
+    def select_tier(self, start: float) -> HistoryBuffer:
+        """Get the finest tier still holding ``start``.
+
+        If none reaches back that far, get the non-empty tier reaching back furthest,
+        the finer one on ties; the finest tier when all are empty.
+        """
+        buffers = sorted(self.tiers.values(), key=lambda buffer: buffer.tier.resolution)
+        for buffer in buffers:
+            oldest = buffer.oldest()
+            if oldest is not None and oldest <= start:
+                return buffer
+        filled = [buffer for buffer in buffers if buffer.size]
+        if not filled:
+            return buffers[0]
+        return min(filled, key=lambda buffer: buffer.oldest())  # min keeps the first, finer tier on ties
+
+    def query(self, start: float, end: float = np.inf,
+              resolution: Optional[str] = None) -> Tuple[str, Dict[str, np.ndarray]]:
+        """Get the rows between ``start`` and ``end`` seconds from a named or automatically chosen tier.
+
+        Returns the tier name and arrays keyed 'time', 'category' and, per variable,
+        its name for the mean plus '<name>_min' and '<name>_max'.
+        """
+        buffer = self.tiers[resolution] if resolution is not None else self.select_tier(start)
+        rows = buffer.rows(start, end)
+        columns = {'time': buffer.time[rows], 'category': buffer.category[rows]}
+        for i, name in enumerate(self.variables):
+            columns[name] = buffer.mean[rows, i]
+            columns[f"{name}_min"] = buffer.min[rows, i]
+            columns[f"{name}_max"] = buffer.max[rows, i]
+        return buffer.tier.name, columns
+
+    def average(self, variable: str, start: float, end: float = np.inf) -> Optional[float]:
+        """Mean of a variable's rows between two times, or None if there are none."""
+        _, columns = self.query(start, end)
+        values = columns[variable]
+        return float(values.mean()) if len(values) else None
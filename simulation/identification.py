@@ -8,6 +8,9 @@ from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Agents farther than this are out of sight and are not identified
+IDENTIFY_RADIUS_KM = 50.0
+
 @dataclass
 class IdentificationSystem:
     """Represents an agent's identification system and how they identify others."""
@@ -97,9 +100,14 @@ class IdentificationSystem:
 
         return "person"  # Default identifier
 
-    def update_identifiers(self, world_state: Dict) -> None:
+    def update_identifiers(self, world_state: Dict, agent_system: Optional['AgentSystem'] = None) -> None:
         """Update identifiers based on new information and interactions."""
         nearby_agents = world_state.get("agents", {})
+        me = agent_system.get_agent(self.agent_id) if agent_system else None
+        if me is not None:
+            # Only agents in sight, found through the agent system's spatial hash
+            in_range = agent_system.find_agents(*me.position, IDENTIFY_RADIUS_KM, exclude=self.agent_id)
+            nearby_agents = {other.id: nearby_agents[other.id] for other in in_range if other.id in nearby_agents}
         
         for agent_id, agent in nearby_agents.items():
             if agent_id != self.agent_id:  # Don't identify self
@@ -0,0 +1,153 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Optional
+import numpy as np
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Climate layers held per keyframe; each is ClimateSystem.<name>_map
+KEYFRAME_LAYERS = ['temperature', 'precipitation', 'wind_speed', 'wind_direction']
+
+
+@dataclass
+class KeyframeConfig:
+    """Settings for computing climate at keyframes and interpolating between them."""
+    interval: float = 3600.0  # Climate time between keyframes; one game hour at one tick per second
+    step: float = 60.0  # Model step each keyframe aggregates, matching the scheduled climate update
+
+
+@dataclass
+class ClimateKeyframe:
+    """Full climate layers at one point in climate time, indexed [lon_index, lat_index]."""
+    time: float
+    temperature: np.ndarray
+    precipitation: np.ndarray
+    wind_speed: np.ndarray
+    wind_direction: np.ndarray
+
+
+class ClimateKeyframes:
+    """Climate layers computed at keyframes and blended linearly for the times in between.
+
+    Two keyframes bracket the current time while a single worker thread computes
+    the one after them, so crossing a keyframe normally finds it ready. Each
+    keyframe advances the previous one through ``interval / step`` model steps
+    with a dedicated random stream, so the sequence does not depend on timing.
+    """
+
+    def __init__(self, climate, config: Optional[KeyframeConfig] = None):
+        self.climate = climate
+        self.config = config or KeyframeConfig()
+        self.rng = climate.world.rng.stream('climate.keyframes')
+        self.steps = max(1, int(round(self.config.interval / self.config.step)))
+        self._executor = None
+        self._pending: Optional[Future] = None
+        self._following: Optional[ClimateKeyframe] = None  # Prefetched keyframe kept across a pickle
+
+        # Start from the layers as they stand
+        self.previous = ClimateKeyframe(
+            climate.current_time,
+            *(np.array(getattr(climate, f"{name}_map"), dtype=np.float32) for name in KEYFRAME_LAYERS)
+        )
+        self.next = self._compute(self.previous)
+        self._submit()
+        logger.info(f"Climate keyframes every {self.config.interval:g} from time {self.previous.time:g}")
+
+    def _compute(self, previous: ClimateKeyframe) -> ClimateKeyframe:
+        """Compute the keyframe one interval after another."""
+        climate = self.climate
+        step = self.config.interval / self.steps
+        times = previous.time + step * np.arange(1, self.steps + 1)
+        keyframe = ClimateKeyframe(
+            float(times[-1]),
+            previous.temperature.copy(),
+            previous.precipitation.copy(),
+            np.empty_like(previous.wind_speed),
+            np.empty_like(previous.wind_direction)
+        )
+        climate.advance_temperature(keyframe.temperature, times, step, self.rng)
+        climate.advance_precipitation(keyframe.precipitation, times, step, self.rng)
+        climate.draw_wind(keyframe.wind_speed, keyframe.wind_direction, self.rng)
+        climate.transport(keyframe.temperature, keyframe.precipitation, keyframe.wind_speed,
+                          keyframe.wind_direction, self.config.interval,
+                          substeps=climate.transport_substeps * self.steps)
+        return keyframe
+
+    def _submit(self) -> None:
+        """Start computing the keyframe after ``next`` in the background."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='climate-keyframes')
+        self._pending = self._executor.submit(self._compute, self.next)
+
+    def _advance(self) -> None:
+        """Move the bracket forward one keyframe, waiting for the worker only if it is behind."""
+        if self._following is not None:
+            following, self._following = self._following, None
+        else:
+            if self._pending is None:
+                self._submit()
+            if not self._pending.done():
+                logger.debug(f"Waiting for the climate keyframe after time {self.next.time:g}")
+            following = self._pending.result()
+        self.previous, self.next = self.next, following
+        self._submit()
+
+    def weight(self, time: float) -> float:
+        """Blend weight of ``next`` at a time, clamped to the current bracket."""
+        span = self.next.time - self.previous.time
+        return float(np.clip((time - self.previous.time) / span, 0.0, 1.0))
+
+    def blend(self, name: str, weight: float, previous, following):
+        """Linear blend of a layer's keyframe values; wind direction turns the short way round."""
+        if name == 'wind_direction':
+            turn = (following - previous + 180.0) % 360.0 - 180.0
+            return (previous + weight * turn) % 360.0
+        return previous + weight * (following - previous)
+
+    def apply(self, time: float) -> None:
+        """Write the layers interpolated at a time into the climate system's maps."""
+        while time >= self.next.time:
+            self._advance()
+        weight = np.float32(self.weight(time))
+        for name in KEYFRAME_LAYERS:
+            layer = getattr(self.climate, f"{name}_map")
+            layer[:] = self.blend(name, weight, getattr(self.previous, name), getattr(self.next, name))
+
+    def value_at(self, name: str, longitude: float, latitude: float, time: Optional[float] = None) -> Optional[float]:
+        """Interpolate one layer at a cell between the bracketing keyframes, or None outside the grid."""
+        cell = self.climate.grid.index(longitude, latitude)
+        if cell is None:
+            return None
+        time = self.climate.current_time if time is None else time
+        previous = float(getattr(self.previous, name)[cell])
+        following = float(getattr(self.next, name)[cell])
+        return float(self.blend(name, self.weight(time), previous, following))
+
+    def close(self) -> None:
+        """Stop the worker thread, keeping any keyframe it was computing."""
+        if self._pending is not None:
+            self._following = self._pending.result()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+            self._pending = None
+
+    def __getstate__(self):
+        """Drop the worker, keeping its keyframe; it is restarted on the next advance."""
+        state = self.__dict__.copy()
+        if self._pending is not None:
+            state['_following'] = self._pending.result()
+        state['_executor'] = None
+        state['_pending'] = None
+        return state
+
+    def get_state(self) -> Dict:
+        """Get the keyframe schedule."""
+        return {
+            'interval': self.config.interval,
+            'step': self.config.step,
+            'previous_time': self.previous.time,
+            'next_time': self.next.time,
+            'prefetched': self._following is not None or (self._pending is not None and self._pending.done())
+        }
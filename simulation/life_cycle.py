@@ -4,6 +4,10 @@ from enum import Enum
 import random
 from datetime import datetime, timedelta
 import time
+from .spatial import KM_PER_DEGREE
+
+# Search radius for mates; about the reach _is_nearby allows a couple to reproduce from
+MATE_SEARCH_RADIUS_KM = 5 * KM_PER_DEGREE
 
 class LifeStage(Enum):
     INFANT = "infant"  # 0-2 years
@@ -318,13 +322,8 @@ class LifeCycleSystem:
         )
         
     def _find_nearby_resources(self, longitude: float, latitude: float, radius: float) -> List[Resource]:
-        """Find resources within radius of position"""
-        nearby_resources = []
-        for resource in self.world.resources.get_resources():
-            distance = self.world.get_distance(longitude, latitude, resource.longitude, resource.latitude)
-            if distance <= radius:
-                nearby_resources.append(resource)
-        return nearby_resources
+        """Find resources within radius (km) of position"""
+        return self.world.resources.find_resources(longitude, latitude, radius)
         
     def _can_gather_resource(self, agent: 'Agent', resource: Resource) -> bool:
         """Check if agent can gather the resource."""
@@ -428,13 +427,20 @@ class LifeCycleSystem:
         return abs(pos1[0] - pos2[0]) <= max_distance and \
                abs(pos1[1] - pos2[1]) <= max_distance
 
-    def _find_potential_mate(self, agent: 'Agent', world_state: Dict) -> Optional['Agent']:
+    def _find_potential_mate(self, agent: 'Agent', world_state: Dict,
+                             agent_system: Optional['AgentSystem'] = None) -> Optional['Agent']:
         """Find a suitable mate based on various factors."""
         potential_mates = []
+        agents = world_state["agents"]
         
-        for other_id, other_agent in world_state["agents"].items():
-            if other_id == agent.id:
-                continue
+        # Only agents close enough to reproduce with, from the agent system's spatial hash
+        if agent_system is not None:
+            nearby = agent_system.find_agents(*agent.position, MATE_SEARCH_RADIUS_KM, exclude=agent.id)
+            candidates = [agents[other.id] for other in nearby if other.id in agents]
+        else:
+            candidates = [other for other_id, other in agents.items() if other_id != agent.id]
+        
+        for other_agent in candidates:
                 
             # Basic compatibility checks
             if not self._can_reproduce(other_agent):
@@ -0,0 +1,293 @@
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from .rng import hash_uniform
+from .terrain import TERRAIN_CODES, TERRAIN_TYPES, OCEAN_CODES, LOCOMOTION_CLASSES, TerrainType
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Quadtree address of a tile: (depth, i, j); depth 0 would be a single base-grid cell
+TileKey = Tuple[int, int, int]
+
+
+@dataclass
+class LODConfig:
+    """Settings for refining terrain around populated areas."""
+    tile_cells: int = 16  # Cells along each side of a tile, at every depth
+    max_depth: int = 5  # Subdivisions of a base cell for the finest tiles
+    detail_radius: float = 0.05  # Degrees around a focus kept at max_depth; doubles per coarser depth
+    idle_seconds: float = 3600.0  # Game seconds a tile is kept after the last entity left it
+    max_tiles: int = 4096  # Tiles kept before the least recently used are evicted early
+    relief: float = 250.0  # Amplitude in metres of the coarsest detail octave
+
+
+@dataclass
+class RegionOfInterest:
+    """An area kept refined regardless of who is there."""
+    name: str
+    longitude: float
+    latitude: float
+    radius: float = 0.0  # Degrees
+
+
+@dataclass
+class TerrainTile:
+    """Refined terrain over one quadtree node; arrays are indexed [lon_index, lat_index]."""
+    key: TileKey
+    min_longitude: float
+    min_latitude: float
+    cell_longitude: float
+    cell_latitude: float
+    terrain_type: np.ndarray
+    elevation: np.ndarray
+    slope: np.ndarray
+    last_seen: float = 0.0
+
+
+class TerrainLOD:
+    """Quadtree of refined terrain tiles around agents, settlements and regions of interest.
+
+    Each base-grid cell can be subdivided into 2**depth x 2**depth tiles of
+    ``tile_cells`` squared cells. Tiles are generated on demand from the base
+    layers plus seeded value noise, so a tile evicted and regenerated later is
+    identical and neighbouring tiles join without seams. Queries use the
+    deepest resident tile and fall back to the base grid.
+    """
+
+    def __init__(self, world, config: Optional[LODConfig] = None):
+        self.world = world
+        self.terrain = world.terrain
+        self.config = config or LODConfig()
+        self.grid = self.terrain.grid
+        # Tiles are aligned to base cell edges, half a cell before the first centre
+        self.origin_longitude = self.grid.min_longitude - self.grid.longitude_resolution / 2
+        self.origin_latitude = self.grid.min_latitude - self.grid.latitude_resolution / 2
+        self.tiles: 'OrderedDict[TileKey, TerrainTile]' = OrderedDict()  # Least recently seen first
+        self.regions: Dict[str, RegionOfInterest] = {}
+        self.noise_seed = world.rng.derive_seed('worldgen.lod')
+        self.generated = 0
+        self.evicted = 0
+
+        # Per-locomotion terrain cost lookups, as for the base movement-cost rasters
+        self._cost_lookups = {}
+        for name, spec in LOCOMOTION_CLASSES.items():
+            lookup = np.ones(len(TERRAIN_TYPES), dtype=np.float32)
+            for terrain, cost in spec['terrain'].items():
+                lookup[TERRAIN_CODES[terrain.value]] = cost
+            self._cost_lookups[name] = lookup
+        logger.info(f"Terrain LOD enabled: {self.config}")
+
+    def register_region(self, name: str, longitude: float, latitude: float, radius: float = 0.0):
+        """Keep an area refined until it is unregistered."""
+        self.regions[name] = RegionOfInterest(name, longitude, latitude, radius)
+
+    def unregister_region(self, name: str):
+        """Stop keeping a region refined; its tiles age out like any other."""
+        self.regions.pop(name, None)
+
+    def focus_points(self) -> List[Tuple[float, float, float]]:
+        """Get (longitude, latitude, extra radius) of everything that keeps terrain refined."""
+        points = self.world.terrain.populated_points()
+        points.extend((region.longitude, region.latitude, region.radius) for region in self.regions.values())
+        return points
+
+    def update(self, dt: float):
+        """Refine around the current focus points and evict idle tiles."""
+        now = float(self.world.simulation_time)
+        self.refresh(now)
+        self.evict(now)
+
+    def refresh(self, now: float):
+        """Generate or touch the tiles each focus point needs."""
+        config = self.config
+        for longitude, latitude, extra in self.focus_points():
+            for depth in range(1, config.max_depth + 1):
+                radius = config.detail_radius * 2 ** (config.max_depth - depth) + extra
+                for key in self._keys_in_box(depth, longitude - radius, latitude - radius,
+                                             longitude + radius, latitude + radius):
+                    tile = self.tiles.get(key)
+                    if tile is None:
+                        tile = self._generate_tile(key)
+                        self.tiles[key] = tile
+                        self.generated += 1
+                    else:
+                        self.tiles.move_to_end(key)
+                    tile.last_seen = now
+
+    def evict(self, now: float):
+        """Drop tiles no entity has been near for idle_seconds, and the oldest beyond max_tiles."""
+        while self.tiles:
+            key, tile = next(iter(self.tiles.items()))
+            if now - tile.last_seen <= self.config.idle_seconds and len(self.tiles) <= self.config.max_tiles:
+                break
+            del self.tiles[key]
+            self.evicted += 1
+
+    def _tile_size(self, depth: int) -> Tuple[float, float]:
+        """Get the (longitude, latitude) extent of a tile in degrees."""
+        scale = 2 ** depth
+        return self.grid.longitude_resolution / scale, self.grid.latitude_resolution / scale
+
+    def _keys_in_box(self, depth: int, min_lon: float, min_lat: float,
+                     max_lon: float, max_lat: float) -> Iterator[TileKey]:
+        """Iterate over the keys of the depth's tiles overlapping a box."""
+        lon_size, lat_size = self._tile_size(depth)
+        n_lon = self.grid.shape[0] * 2 ** depth
+        n_lat = self.grid.shape[1] * 2 ** depth
+        i0 = max(0, math.floor((min_lon - self.origin_longitude) / lon_size))
+        i1 = min(n_lon - 1, math.floor((max_lon - self.origin_longitude) / lon_size))
+        j0 = max(0, math.floor((min_lat - self.origin_latitude) / lat_size))
+        j1 = min(n_lat - 1, math.floor((max_lat - self.origin_latitude) / lat_size))
+        for i in range(i0, i1 + 1):
+            for j in range(j0, j1 + 1):
+                yield depth, i, j
+
+    def _hash(self, octave: int, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Map integer lattice points to uniform values in [-1, 1)."""
+        return hash_uniform(self.noise_seed, octave, x, y) * 2 - 1
+
+    def _value_noise(self, octave: int, longitudes: np.ndarray, latitudes: np.ndarray) -> np.ndarray:
+        """Smoothly interpolated lattice noise with 2**octave lattice steps per base cell."""
+        lon_step, lat_step = self._tile_size(octave)
+        x = (longitudes - self.origin_longitude) / lon_step
+        y = (latitudes - self.origin_latitude) / lat_step
+        x0 = np.floor(x)
+        y0 = np.floor(y)
+        # Smoothstep weights keep the surface continuous in slope across lattice lines
+        fx = x - x0
+        fy = y - y0
+        fx = fx * fx * (3 - 2 * fx)
+        fy = fy * fy * (3 - 2 * fy)
+        x0 = x0.astype(np.int64)
+        y0 = y0.astype(np.int64)
+        return ((self._hash(octave, x0, y0) * (1 - fx) + self._hash(octave, x0 + 1, y0) * fx) * (1 - fy) +
+                (self._hash(octave, x0, y0 + 1) * (1 - fx) + self._hash(octave, x0 + 1, y0 + 1) * fx) * fy)
+
+    def _generate_tile(self, key: TileKey) -> TerrainTile:
+        """Generate a tile's refined terrain from the base layers and seeded detail noise."""
+        depth, i, j = key
+        config = self.config
+        terrain = self.terrain
+        lon_size, lat_size = self._tile_size(depth)
+        cell_lon = lon_size / config.tile_cells
+        cell_lat = lat_size / config.tile_cells
+        min_lon = self.origin_longitude + i * lon_size
+        min_lat = self.origin_latitude + j * lat_size
+        offsets = np.arange(config.tile_cells) + 0.5
+        lons, lats = np.meshgrid(min_lon + offsets * cell_lon, min_lat + offsets * cell_lat, indexing='ij')
+
+        # Base elevation between cell centres plus one octave per halving down to the tile's cells,
+        # so deeper tiles keep the coarse octaves of the tiles above them
+        elevation = self.grid.interpolate(terrain.elevation_map, lons, lats)
+        octaves = depth + int(math.log2(config.tile_cells))
+        for octave in range(1, octaves + 1):
+            elevation += config.relief * 0.5 ** (octave - 1) * self._value_noise(octave, lons, lats)
+
+        # Base terrain types, with coastlines and lakes redrawn where the refined surface crosses sea level
+        codes = self.grid.sample(terrain.terrain_type_map, lons, lats,
+                                 TERRAIN_CODES[TerrainType.DEEP_OCEAN.value]).astype(np.uint8)
+        base_ocean = np.isin(codes, OCEAN_CODES)
+        near_ocean = self.grid.interpolate(terrain.ocean_mask, lons, lats) > 0
+        flooded = ~base_ocean & (elevation < 0)
+        codes[flooded & near_ocean] = TERRAIN_CODES[TerrainType.CONTINENTAL_SHELF.value]
+        codes[flooded & ~near_ocean] = TERRAIN_CODES[TerrainType.LAKE.value]
+        codes[base_ocean & (elevation >= 0)] = TERRAIN_CODES[TerrainType.BEACH.value]
+
+        return TerrainTile(key=key, min_longitude=min_lon, min_latitude=min_lat,
+                           cell_longitude=cell_lon, cell_latitude=cell_lat, terrain_type=codes,
+                           elevation=elevation.astype(np.float32),
+                           slope=self._tile_slope(elevation, lats[0], 2 ** depth * config.tile_cells))
+
+    def _tile_slope(self, elevation: np.ndarray, latitudes: np.ndarray, cells_per_base: int) -> np.ndarray:
+        """Slope in degrees (max drop to the 8 neighbours), on the base rasters' scale.
+
+        The base slope raster relates the drop between neighbouring cells in metres
+        to the cell width in km; refined drops are scaled to a base cell so the two agree.
+        """
+        padded = np.pad(elevation, 1, mode='edge')
+        n_lon, n_lat = elevation.shape
+        max_drop = np.zeros_like(elevation)
+        for dlon in (-1, 0, 1):
+            for dlat in (-1, 0, 1):
+                if dlon == 0 and dlat == 0:
+                    continue
+                neighbour = padded[1 + dlon:1 + dlon + n_lon, 1 + dlat:1 + dlat + n_lat]
+                np.maximum(max_drop, np.abs(neighbour - elevation), out=max_drop)
+        lon_km = 111.32 * np.cos(np.radians(latitudes)) * self.grid.longitude_resolution
+        return np.degrees(np.arctan2(max_drop * cells_per_base, lon_km[np.newaxis, :])).astype(np.float32)
+
+    def tile_at(self, longitude: float, latitude: float) -> Optional[TerrainTile]:
+        """Get the deepest resident tile containing a point."""
+        if not self.tiles:
+            return None
+        for depth in range(self.config.max_depth, 0, -1):
+            lon_size, lat_size = self._tile_size(depth)
+            key = (depth, math.floor((longitude - self.origin_longitude) / lon_size),
+                   math.floor((latitude - self.origin_latitude) / lat_size))
+            tile = self.tiles.get(key)
+            if tile is not None:
+                return tile
+        return None
+
+    def _cell(self, tile: TerrainTile, longitude, latitude) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the cell indices of points inside a tile."""
+        last = self.config.tile_cells - 1
+        a = np.clip(np.floor((np.asarray(longitude) - tile.min_longitude) / tile.cell_longitude), 0, last)
+        b = np.clip(np.floor((np.asarray(latitude) - tile.min_latitude) / tile.cell_latitude), 0, last)
+        return a.astype(np.intp), b.astype(np.intp)
+
+    def _field(self, tile: TerrainTile, name: str, cells) -> np.ndarray:
+        """Read a field of a tile: terrain_type, elevation, slope or movement_cost_<locomotion>."""
+        if name.startswith('movement_cost_'):
+            locomotion = name[len('movement_cost_'):]
+            slope_cost = 1.0 + tile.slope[cells] * LOCOMOTION_CLASSES[locomotion]['slope_weight']
+            return self._cost_lookups[locomotion][tile.terrain_type[cells]] * slope_cost
+        return getattr(tile, name)[cells]
+
+    def value_at(self, name: str, longitude: float, latitude: float) -> Optional[float]:
+        """Read a refined field at a point, or None where no tile is resident."""
+        tile = self.tile_at(longitude, latitude)
+        if tile is None:
+            return None
+        return self._field(tile, name, self._cell(tile, longitude, latitude)).item()
+
+    def overlay(self, name: str, longitudes, latitudes, values: np.ndarray) -> np.ndarray:
+        """Overwrite base-grid samples with refined values wherever a tile is resident."""
+        if not self.tiles:
+            return values
+        longitudes = np.asarray(longitudes, dtype=np.float64)
+        latitudes = np.asarray(latitudes, dtype=np.float64)
+        pending = np.ones(values.shape, dtype=bool)
+        for depth in range(self.config.max_depth, 0, -1):
+            if not pending.any():
+                break
+            lon_size, lat_size = self._tile_size(depth)
+            i = np.floor((longitudes - self.origin_longitude) / lon_size).astype(np.int64)
+            j = np.floor((latitudes - self.origin_latitude) / lat_size).astype(np.int64)
+            # One dictionary lookup per distinct tile among the unresolved points
+            candidates = np.unique(np.stack([i[pending], j[pending]]), axis=1)
+            for tile_i, tile_j in candidates.T:
+                tile = self.tiles.get((depth, int(tile_i), int(tile_j)))
+                if tile is None:
+                    continue
+                hit = pending & (i == tile_i) & (j == tile_j)
+                values[hit] = self._field(tile, name, self._cell(tile, longitudes[hit], latitudes[hit]))
+                pending &= ~hit
+        return values
+
+    def get_state(self) -> Dict:
+        """Get tile counts per depth and cache statistics."""
+        depths = {}
+        for depth, _, _ in self.tiles:
+            depths[depth] = depths.get(depth, 0) + 1
+        return {
+            'tiles': len(self.tiles),
+            'tiles_by_depth': depths,
+            'generated': self.generated,
+            'evicted': self.evicted,
+            'regions': [region.name for region in self.regions.values()],
+            'finest_resolution': self.grid.longitude_resolution / 2 ** self.config.max_depth / self.config.tile_cells
+        }
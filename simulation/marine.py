@@ -5,7 +5,9 @@ from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass, field
 from datetime import datetime
+import numpy as np
 from simulation.utils.logging_config import get_logger
+from .terrain import TERRAIN_CODES, TERRAIN_TYPES, OCEAN_TERRAIN, TerrainType
 
 logger = get_logger(__name__)
 
@@ -37,6 +39,15 @@ class WaterType(Enum):
     SALTWATER = "saltwater"
     BRACKISH = "brackish"  # Mix of fresh and salt water (estuaries, deltas)
 
+# Water type of each terrain code; None for dry land
+_WATER_TYPES_BY_CODE = [
+    WaterType.SALTWATER if terrain in OCEAN_TERRAIN
+    else WaterType.FRESHWATER if terrain in (TerrainType.LAKE, TerrainType.RIVER)
+    else WaterType.BRACKISH if terrain in (TerrainType.ESTUARY, TerrainType.DELTA)
+    else None
+    for terrain in TERRAIN_TYPES
+]
+
 @dataclass
 class MarineNeeds:
     hunger: float = 100.0  # 0-100, 0 means starving
@@ -90,6 +101,7 @@ class MarineSystem:
         self.marine_life = {}  # marine_id -> marine_data
         self.marine_resources = {}
         self.populations = {}  # marine_type -> count
+        self.rng = world.rng.stream('marine')
         
         # Initialize the system
         self.initialize_marine_system()
@@ -284,38 +296,42 @@ class MarineSystem:
 
     def _is_in_water(self, lon: float, lat: float) -> bool:
         """Check if a location is in water."""
-        terrain_info = self.world.terrain.get_terrain_info_at(lon, lat)
-        terrain_type = terrain_info.get("type", "PLAINS")
-        return terrain_type in {"OCEAN", "LAKE", "RIVER", "ESTUARY", "DELTA"}
+        return self._get_water_type_at(lon, lat) is not None
 
     def _get_water_type_at(self, lon: float, lat: float) -> Optional[WaterType]:
         """Get the type of water at a given location."""
-        terrain_info = self.world.terrain.get_terrain_info_at(lon, lat)
-        terrain_type = terrain_info.get("type", "PLAINS")
-        
-        # Map terrain types to water types
-        water_type_map = {
-            "OCEAN": WaterType.SALTWATER,
-            "LAKE": WaterType.FRESHWATER,
-            "RIVER": WaterType.FRESHWATER,
-            "ESTUARY": WaterType.BRACKISH,
-            "DELTA": WaterType.BRACKISH
-        }
-        
-        return water_type_map.get(terrain_type)
+        terrain_type = self.world.terrain.get_terrain_type_at(lon, lat)
+        return _WATER_TYPES_BY_CODE[TERRAIN_CODES[terrain_type.value]]
+
+    def _get_water_types_at(self, lons: np.ndarray, lats: np.ndarray) -> List[Optional[WaterType]]:
+        """Get the water type at many locations with one terrain query."""
+        codes = self.world.terrain.get_terrain_codes_at(lons, lats)
+        return [_WATER_TYPES_BY_CODE[code] for code in codes]
+
+    @staticmethod
+    def _is_habitable(water_type: Optional[WaterType], marine: Marine) -> bool:
+        """Check that water is present and matches the creature's required water type, if any."""
+        required = marine.environment.get('water_type')
+        return water_type is not None and required in (None, water_type)
         
     def update(self, time_delta: float):
         """Update the marine system state."""
         self.logger.debug(f"Updating marine system with time delta: {time_delta}")
+        creatures = list(self.marine_life.items())
+        if not creatures:
+            return
+        marines = [marine for _, marine in creatures]
         
-        # Update each marine creature
-        for marine_id, marine in list(self.marine_life.items()):
-            # Update needs
-            self._update_marine_needs(marine, time_delta)
-            
-            # Update position
-            self._update_marine_position(marine, time_delta)
-            
+        # Update needs
+        lons = np.array([marine.position[0] for marine in marines])
+        lats = np.array([marine.position[1] for marine in marines])
+        for marine, water_type in zip(marines, self._get_water_types_at(lons, lats)):
+            self._update_marine_needs(marine, time_delta, water_type)
+        
+        # Update positions for the whole population at once
+        self._update_marine_positions(marines, time_delta)
+        
+        for marine_id, marine in creatures:
             # Check for reproduction
             if self._can_reproduce(marine):
                 self._reproduce_marine(marine_id, marine)
@@ -324,15 +340,14 @@ class MarineSystem:
             if self._should_die(marine):
                 self._remove_marine(marine_id, marine)
 
-    def _update_marine_needs(self, marine: Marine, time_delta: float):
+    def _update_marine_needs(self, marine: Marine, time_delta: float, water_type: Optional[WaterType]):
         """Update the needs of a marine creature."""
         # Decrease needs over time
         marine.needs.hunger = max(0.0, marine.needs.hunger - 0.1 * time_delta)
         marine.needs.energy = max(0.0, marine.needs.energy - 0.05 * time_delta)
         
         # Check water type compatibility
-        current_water_type = self._get_water_type_at(marine.position[0], marine.position[1])
-        if current_water_type != marine.environment.get('water_type'):
+        if not self._is_habitable(water_type, marine):
             marine.needs.health = max(0.0, marine.needs.health - 5.0 * time_delta)
         
         # Increase reproduction urge with age and health
@@ -340,46 +355,42 @@ class MarineSystem:
             marine.needs.reproduction_urge = min(100.0,
                 marine.needs.reproduction_urge + 0.1 * time_delta)
 
-    def _update_marine_position(self, marine: Marine, time_delta: float):
-        """Update the position of a marine creature."""
-        if marine.needs.energy < 20.0:
-            marine.state.last_rest_time = time_delta
-            marine.needs.energy = min(100.0, marine.needs.energy + 10.0 * time_delta)
+    def _update_marine_positions(self, marines: List[Marine], time_delta: float):
+        """Update the positions of marine creatures, validating all candidate moves in one call."""
+        movers = [marine for marine in marines if marine.needs.energy >= 20.0]
+        for marine in marines:
+            if marine.needs.energy < 20.0:
+                marine.state.last_rest_time = time_delta
+                marine.needs.energy = min(100.0, marine.needs.energy + 10.0 * time_delta)
+        if not movers:
             return
         
         # Calculate movement based on speed and energy
-        max_distance = marine.size * (marine.needs.energy / 100.0)
-        dx = random.uniform(-max_distance, max_distance)
-        dy = random.uniform(-max_distance, max_distance)
-        
-        new_lon = marine.position[0] + dx
-        new_lat = marine.position[1] + dy
+        max_distance = np.array([marine.size * (marine.needs.energy / 100.0) for marine in movers])
+        new_lons = np.array([marine.position[0] for marine in movers]) + self.rng.uniform(-1.0, 1.0, len(movers)) * max_distance
+        new_lats = np.array([marine.position[1] for marine in movers]) + self.rng.uniform(-1.0, 1.0, len(movers)) * max_distance
         
-        # Check if new position is valid
-        if self._is_valid_position(new_lon, new_lat, marine):
-            marine.position = (new_lon, new_lat)
-            marine.needs.energy = max(0.0, marine.needs.energy - 5.0 * time_delta)
-            marine.state.last_social_time = time_delta
-        else:
-            marine.state.last_rest_time = time_delta
+        # Check which new positions are valid
+        valid = self._is_valid_position(new_lons, new_lats, movers)
+        for marine, lon, lat, ok in zip(movers, new_lons, new_lats, valid):
+            if ok:
+                marine.position = (float(lon), float(lat))
+                marine.needs.energy = max(0.0, marine.needs.energy - 5.0 * time_delta)
+                marine.state.last_social_time = time_delta
+            else:
+                marine.state.last_rest_time = time_delta
 
-    def _is_valid_position(self, lon: float, lat: float, marine: Marine) -> bool:
-        """Check if a position is valid for a marine creature."""
+    def _is_valid_position(self, lons: np.ndarray, lats: np.ndarray, marines: List[Marine]) -> np.ndarray:
+        """Check which candidate positions are valid for the matching marine creatures."""
         # Check world bounds
-        if not (self.world.min_longitude <= lon <= self.world.max_longitude and
-                self.world.min_latitude <= lat <= self.world.max_latitude):
-            return False
-        
-        # Check if position is in water
-        if not self._is_in_water(lon, lat):
-            return False
-        
-        # Check water type compatibility
-        water_type = self._get_water_type_at(lon, lat)
-        if water_type != marine.environment.get('water_type'):
-            return False
+        in_bounds = ((lons >= self.world.min_longitude) & (lons <= self.world.max_longitude) &
+                     (lats >= self.world.min_latitude) & (lats <= self.world.max_latitude))
         
-        return True
+        # Check water presence and type compatibility
+        water_types = self._get_water_types_at(lons, lats)
+        habitable = np.array([self._is_habitable(water_type, marine)
+                              for water_type, marine in zip(water_types, marines)], dtype=bool)
+        return in_bounds & habitable
 
     def _can_reproduce(self, marine: Marine) -> bool:
         """Check if a marine creature can reproduce."""
@@ -331,8 +331,8 @@ class PlantSystem:
         """Create a new field for planting"""
         field_id = f"field_{len(self.fields)}"
         self.fields[field_id] = []
-        soil = self.world.terrain.soil_quality_data.get((longitude, latitude), 0.5)
-        nutrients = self.world.terrain.nutrient_data.get((longitude, latitude), 0.5)
+        soil = self.world.terrain.get_soil_quality_at(longitude, latitude)
+        nutrients = self.world.terrain.get_nutrient_level_at(longitude, latitude)
         self.field_properties[field_id] = {
             "longitude": longitude,
             "latitude": latitude,
@@ -388,8 +388,8 @@ class PlantSystem:
             env = self.world.environment.environments.get("initial_environment")
             temp = env.get_temperature_at(lon, lat)
             precip = env.precipitation
-            soil = self.world.terrain.soil_quality_data.get((lon, lat), 0.5)
-            nutrients = self.world.terrain.nutrient_data.get((lon, lat), 0.5)
+            soil = self.world.terrain.get_soil_quality_at(lon, lat)
+            nutrients = self.world.terrain.get_nutrient_level_at(lon, lat)
 
             # Calculate growth rate based on conditions
             growth_rate = plant_type['growth_rate']
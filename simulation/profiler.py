@@ -0,0 +1,127 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional
+import numpy as np
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Upper bounds (in milliseconds) of the latency histogram buckets
+HISTOGRAM_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+
+class SectionStats:
+    """Rolling timing statistics for a single instrumented section."""
+
+    def __init__(self, window: int):
+        self.samples: Deque[float] = deque(maxlen=window)  # seconds
+        self.calls = 0
+        self.overruns = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.last_time = 0.0
+        self.histogram = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+
+    def record(self, duration: float, budget: float) -> None:
+        """Add one timing sample in seconds."""
+        self.samples.append(duration)
+        self.calls += 1
+        self.total_time += duration
+        self.last_time = duration
+        self.max_time = max(self.max_time, duration)
+        if duration > budget:
+            self.overruns += 1
+
+        duration_ms = duration * 1000.0
+        for i, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if duration_ms <= bound:
+                self.histogram[i] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def to_dict(self, budget: float) -> Dict:
+        """Summarize the section in milliseconds."""
+        if self.samples:
+            p50, p95, p99 = np.percentile(np.fromiter(self.samples, dtype=float), [50, 95, 99])
+        else:
+            p50 = p95 = p99 = 0.0
+
+        histogram = {f"le_{bound:g}ms": count for bound, count in zip(HISTOGRAM_BUCKETS_MS, self.histogram)}
+        histogram["inf"] = self.histogram[-1]
+
+        return {
+            "calls": self.calls,
+            "overruns": self.overruns,
+            "budget_ms": budget * 1000.0,
+            "p50_ms": float(p50) * 1000.0,
+            "p95_ms": float(p95) * 1000.0,
+            "p99_ms": float(p99) * 1000.0,
+            "mean_ms": (self.total_time / self.calls) * 1000.0 if self.calls else 0.0,
+            "max_ms": self.max_time * 1000.0,
+            "last_ms": self.last_time * 1000.0,
+            "total_s": self.total_time,
+            "window": len(self.samples),
+            "histogram": histogram
+        }
+
+
+class TickProfiler:
+    """Collects per-section durations for the simulation tick."""
+
+    def __init__(self, budget: float = 1.0 / 48.0, window: int = 1024):
+        self.budget = budget  # Wall-clock seconds available per tick
+        self.window = window  # Number of samples kept per section for percentiles
+        self.budgets: Dict[str, float] = {}  # section -> budget override in seconds
+        self.sections: Dict[str, SectionStats] = {}
+        self.enabled = True
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+
+    def set_budget(self, name: str, budget: float) -> None:
+        """Override the overrun threshold for one section."""
+        self.budgets[name] = budget
+
+    @contextmanager
+    def section(self, name: str) -> Iterator[None]:
+        """Time the enclosed block and record it under ``name``."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def record(self, name: str, duration: float) -> None:
+        """Record a duration in seconds for a section."""
+        with self._lock:
+            stats = self.sections.get(name)
+            if stats is None:
+                stats = self.sections[name] = SectionStats(self.window)
+            stats.record(duration, self.budgets.get(name, self.budget))
+
+    def get_stats(self, name: Optional[str] = None) -> Dict:
+        """Get timing statistics for one section or all of them."""
+        with self._lock:
+            if name is not None:
+                stats = self.sections.get(name)
+                return stats.to_dict(self.budgets.get(name, self.budget)) if stats else {}
+            return {
+                "budget_ms": self.budget * 1000.0,
+                "uptime_s": time.time() - self.started_at,
+                "sections": {
+                    section: stats.to_dict(self.budgets.get(section, self.budget))
+                    for section, stats in self.sections.items()
+                }
+            }
+
+    def reset(self) -> None:
+        """Discard all collected samples."""
+        with self._lock:
+            self.sections.clear()
+            self.started_at = time.time()
+        logger.info("Tick profiler reset")
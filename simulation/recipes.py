@@ -0,0 +1,151 @@
+from enum import Enum
+from typing import Dict, Hashable, List, Mapping, Optional, Sequence, Tuple
+import weakref
+import numpy as np
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class Inventory(dict):
+    """Dict of held amounts that counts its own changes, so results derived from it can be cached."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.version += 1
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self.version += 1
+        return super().setdefault(key, default)
+
+    def pop(self, key, *default):
+        self.version += 1
+        return super().pop(key, *default)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
+class RecipeBook:
+    """Crafting and processing recipes compiled into matrices over a fixed list of resource kinds.
+
+    ``requirements[p, k]`` is how much of kind ``k`` one unit of product ``p`` uses and
+    ``yields[k]`` is what one unit of kind ``k`` processes into. Inventories are
+    vectors indexed like ``keys``; they may be keyed by kind or by the kind's value.
+    """
+
+    def __init__(self, keys: Sequence[Hashable], requirements: Mapping[Hashable, Sequence[Tuple[Hashable, float]]],
+                 processing: Mapping[Hashable, Mapping[Hashable, float]]):
+        self.keys = tuple(keys)
+        self.codes = {key: code for code, key in enumerate(self.keys)}
+        self._lookup = dict(self.codes)
+        self._lookup.update({key.value: code for key, code in self.codes.items() if isinstance(key, Enum)})
+
+        self.products = tuple(requirements)
+        self.product_codes = {product: p for p, product in enumerate(self.products)}
+        self.requirements = np.zeros((len(self.products), len(self.keys)), dtype=np.float64)
+        for p, product in enumerate(self.products):
+            for key, amount in requirements[product]:
+                self.requirements[p, self.codes[key]] += amount
+        self.inputs = {product: [(self.keys[k], float(self.requirements[p, k]))
+                                 for k in np.flatnonzero(self.requirements[p])]
+                       for p, product in enumerate(self.products)}
+
+        self.yields = np.zeros((len(self.keys), len(self.keys)), dtype=np.float64)
+        for source, outputs in processing.items():
+            for key, share in outputs.items():
+                self.yields[self.codes[source], self.codes[key]] = share
+
+        self._used = self.requirements > 0
+        self._cache: Dict[int, Tuple[weakref.ref, int, np.ndarray]] = {}
+        logger.info(f"Compiled {len(self.products)} crafting recipes and {len(processing)} processing recipes")
+
+    def vector(self, inventory: Mapping) -> np.ndarray:
+        """Amounts of an inventory indexed like ``keys``; unknown and non-numeric entries are skipped."""
+        amounts = np.zeros(len(self.keys), dtype=np.float64)
+        for key, amount in inventory.items():
+            code = self._lookup.get(key)
+            if code is not None and isinstance(amount, (int, float)):
+                amounts[code] += amount
+        return amounts
+
+    def counts(self, amounts: np.ndarray) -> np.ndarray:
+        """Times each product can be crafted from rows of amounts; shape (rows, products)."""
+        amounts = np.atleast_2d(np.maximum(amounts, 0.0))
+        # Kinds a recipe doesn't use never limit it
+        ratios = np.full((len(amounts),) + self.requirements.shape, np.inf)
+        np.divide(amounts[:, None, :], self.requirements, out=ratios, where=self._used)
+        return np.floor(ratios.min(axis=2)).astype(np.int64)
+
+    def craftable(self, inventories: Sequence[Mapping]) -> np.ndarray:
+        """Times each product can be crafted from each inventory; shape (inventories, products).
+
+        Results for an ``Inventory`` are kept until its version changes, so only the
+        inventories that changed since the last call are recomputed, in one batch.
+        """
+        result = np.zeros((len(inventories), len(self.products)), dtype=np.int64)
+        stale: List[int] = []
+        for row, inventory in enumerate(inventories):
+            cached = self._cached(inventory)
+            if cached is None:
+                stale.append(row)
+            else:
+                result[row] = cached
+        if stale:
+            counts = self.counts(np.stack([self.vector(inventories[row]) for row in stale]))
+            result[stale] = counts
+            for row, row_counts in zip(stale, counts):
+                self._remember(inventories[row], row_counts)
+        return result
+
+    def craftable_items(self, inventory: Mapping) -> Dict[Hashable, int]:
+        """Products an inventory can craft at least once, with how many times."""
+        counts = self.craftable([inventory])[0]
+        return {self.products[p]: int(counts[p]) for p in np.flatnonzero(counts)}
+
+    def can_craft(self, product: Hashable, inventory: Mapping) -> bool:
+        """Whether an inventory holds enough for one unit of a product."""
+        p = self.product_codes.get(product)
+        return p is not None and bool(self.craftable([inventory])[0, p] > 0)
+
+    def process(self, key: Hashable, amount: float, scale: float = 1.0) -> Dict[Hashable, float]:
+        """Outputs of processing an amount of one kind, scaled; empty when the kind has no recipe."""
+        shares = self.yields[self._lookup[key]]
+        return {self.keys[k]: float(shares[k] * amount * scale) for k in np.flatnonzero(shares)}
+
+    def _cached(self, inventory: Mapping) -> Optional[np.ndarray]:
+        """Counts remembered for an inventory still at the same version."""
+        entry = self._cache.get(id(inventory))
+        if entry is None or entry[0]() is not inventory or entry[1] != inventory.version:
+            return None
+        return entry[2]
+
+    def _remember(self, inventory: Mapping, counts: np.ndarray) -> None:
+        """Keep counts for a versioned inventory until it changes or is collected."""
+        if not isinstance(inventory, Inventory):
+            return
+        key = id(inventory)
+        self._cache[key] = (weakref.ref(inventory, lambda _, key=key: self._cache.pop(key, None)),
+                            inventory.version, counts)
@@ -0,0 +1,447 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, Optional, Sequence, Set, Tuple
+import numpy as np
+from .grid import RasterGrid
+from .spatial import HALF_CIRCUMFERENCE_KM, KM_PER_DEGREE, haversine_km, longitude_span
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Cells per side of a sparse block
+BLOCK_SIZE = 16
+INITIAL_BLOCKS = 64
+
+# Tile address: (ti, tj) in units of tile_cells
+TileKey = Tuple[int, int]
+
+
+@dataclass
+class ResourceTileConfig:
+    """Residency settings for the dense resource kinds."""
+    tile_cells: int = 8  # Cells along each side of a tile; also the deposit index bucket
+    idle_seconds: float = 7 * 86400.0  # Game seconds an unexplored tile is kept after it was last touched
+    max_tiles: int = 256  # Tiles kept before the least recently touched are evicted early
+
+
+class BlockLayers:
+    """Sparse layers over a grid, stored as square blocks allocated on first write.
+
+    Blocks of every layer share one pool; ``table[layer, bi, bj]`` holds the pool
+    slot of a block or -1 when that block has never been written.
+    """
+
+    def __init__(self, shape: Tuple[int, int], count: int, block_size: int = BLOCK_SIZE):
+        self.shape = shape
+        self.block_size = block_size
+        blocks_lon = -(-shape[0] // block_size)
+        blocks_lat = -(-shape[1] // block_size)
+        self.table = np.full((count, blocks_lon, blocks_lat), -1, dtype=np.int32)
+        self.blocks = np.zeros((INITIAL_BLOCKS, block_size, block_size), dtype=np.float32)
+        self.block_count = 0
+
+    def get(self, k: int, i: int, j: int) -> float:
+        """Value of layer ``k`` at a cell; 0 where no block is allocated."""
+        b = self.block_size
+        slot = self.table[k, i // b, j // b]
+        return float(self.blocks[slot, i % b, j % b]) if slot >= 0 else 0.0
+
+    def add(self, k: int, i: int, j: int, delta: float) -> float:
+        """Add to a cell, allocating its block if needed, and return the new value (floored at 0)."""
+        b = self.block_size
+        slot = self.table[k, i // b, j // b]
+        if slot < 0:
+            if delta <= 0:
+                return 0.0
+            slot = self._allocate(k, i // b, j // b)
+        value = max(0.0, float(self.blocks[slot, i % b, j % b]) + delta)
+        self.blocks[slot, i % b, j % b] = value
+        return value
+
+    def values(self, k: int, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Vectorized :meth:`get` over arrays of cell indices."""
+        b = self.block_size
+        slots = self.table[k, i // b, j // b]
+        return np.where(slots >= 0, self.blocks[np.maximum(slots, 0), i % b, j % b], 0.0)
+
+    def _allocate(self, k: int, bi: int, bj: int) -> int:
+        if self.block_count == len(self.blocks):
+            self.blocks = np.concatenate([self.blocks, np.zeros_like(self.blocks)])
+        slot = self.block_count
+        self.block_count += 1
+        self.table[k, bi, bj] = slot
+        return slot
+
+    def cell(self, i: int, j: int) -> np.ndarray:
+        """Values of every layer at one cell."""
+        b = self.block_size
+        slots = self.table[:, i // b, j // b]
+        return np.where(slots >= 0, self.blocks[slots, i % b, j % b], 0.0)
+
+
+class ResourceLayers:
+    """Amount of each resource kind per grid cell, generated on demand.
+
+    Dense kinds are derived per cell by ``generate(i, j) -> (kinds, cells)`` the
+    first time a tile of cells is touched and kept in a pool of resident tiles, so
+    one array operation covers every resident cell. Tiles nobody explored or
+    touched for a while are evicted: renewable kinds (the first
+    ``renewable_count``) fall back to their regenerable default and only cells
+    whose other dense kinds changed are kept, as deltas from the default. Rare
+    kinds live in :class:`BlockLayers` and are never evicted.
+    """
+
+    def __init__(self, grid: RasterGrid, dense_keys: Sequence[Hashable], sparse_keys: Sequence[Hashable],
+                 generate: Callable[[np.ndarray, np.ndarray], np.ndarray], renewable_count: int,
+                 config: Optional[ResourceTileConfig] = None):
+        self.grid = grid
+        self.config = config or ResourceTileConfig()
+        self.dense_keys = tuple(dense_keys)
+        self.sparse_keys = tuple(sparse_keys)
+        self.keys = self.dense_keys + self.sparse_keys
+        self.generate = generate
+        self.renewable_count = renewable_count
+        self._dense_index = {key: k for k, key in enumerate(self.dense_keys)}
+        self._sparse_index = {key: k for k, key in enumerate(self.sparse_keys)}
+        self.sparse = BlockLayers(grid.shape, len(self.sparse_keys))
+
+        # Pool of resident tiles: amounts and the generated defaults they regrow towards
+        t = self.config.tile_cells
+        self.tile_shape = (-(-grid.shape[0] // t), -(-grid.shape[1] // t))
+        self.slots = np.full(self.tile_shape, -1, dtype=np.int32)
+        self.amounts = np.zeros((self.config.max_tiles, len(self.dense_keys), t, t), dtype=np.float32)
+        self.defaults = np.zeros_like(self.amounts)
+        self.slot_tiles = np.full((self.config.max_tiles, 2), -1, dtype=np.intp)
+        self.last_seen = np.zeros(self.config.max_tiles)
+        self.tiles: 'OrderedDict[TileKey, int]' = OrderedDict()  # Least recently touched first
+        self.free = list(range(self.config.max_tiles - 1, -1, -1))
+        self.explored: Set[TileKey] = set()
+        self.deltas: Dict[TileKey, Dict[Tuple[int, int, int], float]] = {}  # (k, ci, cj) -> change, evicted tiles
+        self.now = 0.0
+        self.generated = 0
+        self.evicted = 0
+        self.deposits = DepositIndex(self)
+
+    def index(self, longitude: float, latitude: float) -> Optional[Tuple[int, int]]:
+        """Grid cell of a coordinate, or None outside the grid."""
+        return self.grid.index(longitude, latitude)
+
+    def touch(self, i: int, j: int) -> int:
+        """Make the tile holding a cell resident, mark it recently used and return its pool slot."""
+        t = self.config.tile_cells
+        key = (i // t, j // t)
+        slot = self.tiles.get(key)
+        if slot is None:
+            slot = self._load(key)
+        else:
+            self.tiles.move_to_end(key)
+        self.last_seen[slot] = self.now
+        return slot
+
+    def explore(self, i: int, j: int) -> None:
+        """Keep the tile holding a cell resident from now on."""
+        self.touch(i, j)
+        t = self.config.tile_cells
+        self.explored.add((i // t, j // t))
+
+    def _tile_cells(self, ti: np.ndarray, tj: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Cell indices of whole tiles, shape (tiles, t, t), clipped into the grid, plus an inside mask."""
+        t = self.config.tile_cells
+        offsets = np.arange(t)
+        i = np.asarray(ti)[:, None, None] * t + offsets[None, :, None]
+        j = np.asarray(tj)[:, None, None] * t + offsets[None, None, :]
+        i, j = np.broadcast_arrays(i, j)
+        inside = (i < self.grid.shape[0]) & (j < self.grid.shape[1])
+        return np.minimum(i, self.grid.shape[0] - 1), np.minimum(j, self.grid.shape[1] - 1), inside
+
+    def _generate_tiles(self, ti: np.ndarray, tj: np.ndarray) -> np.ndarray:
+        """Default dense amounts of whole tiles, shape (tiles, kinds, t, t); zero past the grid edge."""
+        i, j, inside = self._tile_cells(ti, tj)
+        defaults = self.generate(i.ravel(), j.ravel()).reshape((len(self.dense_keys),) + i.shape)
+        return (defaults * inside).transpose(1, 0, 2, 3).astype(np.float32)
+
+    def _load(self, key: TileKey) -> int:
+        """Generate a tile into a free pool slot, re-applying any kept deltas."""
+        if not self.free:
+            self._evict_oldest()
+        if not self.free:
+            self._grow()
+        slot = self.free.pop()
+        defaults = self._generate_tiles(np.array([key[0]]), np.array([key[1]]))[0]
+        self.defaults[slot] = defaults
+        self.amounts[slot] = defaults
+        for (k, ci, cj), delta in self.deltas.pop(key, {}).items():
+            self.amounts[slot, k, ci, cj] = max(0.0, defaults[k, ci, cj] + delta)
+        self.slots[key] = slot
+        self.slot_tiles[slot] = key
+        self.tiles[key] = slot
+        self.deposits.set_tile(key, self.amounts[slot])
+        self.generated += 1
+        return slot
+
+    def _grow(self) -> None:
+        """Double the pool when explored tiles alone fill it."""
+        size = len(self.amounts)
+        self.amounts = np.concatenate([self.amounts, np.zeros_like(self.amounts)])
+        self.defaults = np.concatenate([self.defaults, np.zeros_like(self.defaults)])
+        self.slot_tiles = np.concatenate([self.slot_tiles, np.full_like(self.slot_tiles, -1)])
+        self.last_seen = np.concatenate([self.last_seen, np.zeros_like(self.last_seen)])
+        self.free.extend(range(2 * size - 1, size - 1, -1))
+        logger.info(f"Resource tile pool grown to {2 * size} tiles")
+
+    def evict(self, now: float) -> None:
+        """Drop unexplored tiles untouched for idle_seconds, and the oldest beyond max_tiles."""
+        self.now = now
+        for key, slot in list(self.tiles.items()):
+            idle = now - self.last_seen[slot] > self.config.idle_seconds
+            if not idle and len(self.tiles) <= self.config.max_tiles:
+                break
+            if key not in self.explored:
+                self._unload(key)
+
+    def _evict_oldest(self) -> None:
+        for key in self.tiles:
+            if key not in self.explored:
+                self._unload(key)
+                return
+
+    def _unload(self, key: TileKey) -> None:
+        """Free a tile's slot, keeping its changed non-renewable cells as deltas."""
+        slot = self.tiles.pop(key)
+        r = self.renewable_count
+        change = self.amounts[slot, r:] - self.defaults[slot, r:]
+        kept = {(int(k) + r, int(ci), int(cj)): float(change[k, ci, cj]) for k, ci, cj in np.argwhere(change != 0)}
+        if kept:
+            self.deltas[key] = kept
+        # Renewables are back at their defaults from now on
+        self.deposits.set_tile(key, np.concatenate([self.defaults[slot, :r], self.amounts[slot, r:]]))
+        self.slots[key] = -1
+        self.slot_tiles[slot] = -1
+        self.free.append(slot)
+        self.evicted += 1
+
+    def regenerate(self, rates: np.ndarray, time_delta: float) -> None:
+        """Regrow the renewable kinds of every resident tile towards its defaults."""
+        r = self.renewable_count
+        renewable = self.amounts[:, :r]
+        renewable += rates[None, :, None, None] * time_delta
+        np.minimum(renewable, self.defaults[:, :r], out=renewable)
+        self.deposits.refresh_resident(slice(0, r))
+
+    def get(self, key: Hashable, i: int, j: int) -> float:
+        """Amount of one kind at a cell."""
+        k = self._dense_index.get(key)
+        if k is None:
+            return self.sparse.get(self._sparse_index[key], i, j)
+        t = self.config.tile_cells
+        return float(self.amounts[self.touch(i, j), k, i % t, j % t])
+
+    def add(self, key: Hashable, i: int, j: int, delta: float) -> float:
+        """Change the amount at a cell and return the new amount, never below 0."""
+        before = self.get(key, i, j)
+        k = self._dense_index.get(key)
+        if k is None:
+            value = self.sparse.add(self._sparse_index[key], i, j, delta)
+        else:
+            t = self.config.tile_cells
+            value = max(0.0, before + delta)
+            self.amounts[self.touch(i, j), k, i % t, j % t] = value
+        self.deposits.changed(self.position(key), i, j, before, value)
+        return value
+
+    def set(self, key: Hashable, i: int, j: int, value: float) -> None:
+        """Set the amount at a cell."""
+        self.add(key, i, j, value - self.get(key, i, j))
+
+    def take(self, key: Hashable, i: int, j: int, amount: float) -> float:
+        """Remove up to ``amount`` from a cell and return how much was removed."""
+        taken = min(self.get(key, i, j), max(0.0, amount))
+        if taken > 0:
+            self.add(key, i, j, -taken)
+        return taken
+
+    def position(self, key: Hashable) -> int:
+        """Index of a kind in :attr:`keys`."""
+        k = self._dense_index.get(key)
+        return k if k is not None else len(self.dense_keys) + self._sparse_index[key]
+
+    def values(self, positions: np.ndarray, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Amounts of the kinds at ``positions`` (into :attr:`keys`) at many cells, shape (kinds, cells).
+
+        Cells of tiles that are not resident are derived without loading them.
+        """
+        dense_count = len(self.dense_keys)
+        dense_positions = [k for k in positions if k < dense_count]
+        dense = np.zeros((dense_count, len(i)), dtype=np.float32)
+        if dense_positions:
+            t = self.config.tile_cells
+            slots = self.slots[i // t, j // t]
+            resident = slots >= 0
+            dense[:, resident] = self.amounts[slots[resident], :, i[resident] % t, j[resident] % t].T
+            if not resident.all():
+                dense[:, ~resident] = self._peek(i[~resident], j[~resident])
+        return np.stack([dense[k] if k < dense_count else self.sparse.values(k - dense_count, i, j)
+                         for k in positions]) if len(positions) else np.zeros((0, len(i)), dtype=np.float32)
+
+    def _peek(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Dense amounts of cells in non-resident tiles: defaults plus any kept deltas."""
+        amounts = self.generate(i, j).astype(np.float32)
+        if self.deltas:
+            t = self.config.tile_cells
+            for n, (ci, cj) in enumerate(zip(i.tolist(), j.tolist())):
+                kept = self.deltas.get((ci // t, cj // t))
+                if kept:
+                    for k in range(self.renewable_count, len(self.dense_keys)):
+                        delta = kept.get((k, ci % t, cj % t))
+                        if delta is not None:
+                            amounts[k, n] = max(0.0, amounts[k, n] + delta)
+        return amounts
+
+    def cell(self, i: int, j: int) -> Dict[Hashable, float]:
+        """Nonzero amounts at a cell keyed by kind."""
+        t = self.config.tile_cells
+        dense = self.amounts[self.touch(i, j), :, i % t, j % t]
+        amounts = zip(self.keys, np.concatenate([dense, self.sparse.cell(i, j)]).tolist())
+        return {key: amount for key, amount in amounts if amount > 0}
+
+    def totals(self) -> Dict[Hashable, Tuple[float, int]]:
+        """Total amount and number of cells holding each kind."""
+        sums, cells = self.deposits.totals()
+        return {key: (float(total), int(count)) for key, total, count in zip(self.keys, sums, cells)}
+
+    def get_stats(self) -> Dict[str, int]:
+        """Residency counters."""
+        return {
+            'resident_tiles': len(self.tiles),
+            'explored_tiles': len(self.explored),
+            'tiles_with_deltas': len(self.deltas),
+            'generated': self.generated,
+            'evicted': self.evicted,
+            'resident_bytes': int(self.amounts.nbytes + self.defaults.nbytes),
+        }
+
+
+class DepositIndex:
+    """Deposits (cells holding a nonzero amount) and amount totals per kind, per tile of cells.
+
+    Tiles double as buckets keyed by integer (ti, tj). A tile's summary is derived
+    from its defaults the first time a query or total needs it and kept current as
+    amounts change. Queries visit only the buckets holding a wanted kind and
+    measure great-circle distances to the cells inside them.
+    """
+
+    def __init__(self, layers: ResourceLayers):
+        self.layers = layers
+        self.grid = layers.grid
+        self.bucket_size = layers.config.tile_cells
+        self.shape = layers.tile_shape
+        self.counts = np.zeros((len(layers.keys),) + self.shape, dtype=np.int32)
+        self.sums = np.zeros((len(layers.keys),) + self.shape, dtype=np.float64)
+        self.summarized = np.zeros(self.shape, dtype=bool)
+        # Longitude wraps when the grid goes all the way round
+        self.wraps = abs(self.grid.max_longitude - self.grid.min_longitude - 360.0) < 1e-6
+
+    def summarize(self, ti: np.ndarray, tj: np.ndarray) -> None:
+        """Derive the summaries of the listed tiles that have none yet."""
+        missing = ~self.summarized[ti, tj]
+        if not missing.any():
+            return
+        ti, tj = ti[missing], tj[missing]
+        dense = self.layers._generate_tiles(ti, tj)  # Tiles never summarized have never been loaded
+        count = len(self.layers.dense_keys)
+        self.counts[:count, ti, tj] = np.count_nonzero(dense, axis=(2, 3)).T
+        self.sums[:count, ti, tj] = dense.sum(axis=(2, 3), dtype=np.float64).T
+        self.summarized[ti, tj] = True
+
+    def changed(self, position: int, i: int, j: int, before: float, after: float) -> None:
+        """Record one cell's amount of kind ``position`` going from ``before`` to ``after``."""
+        key = (i // self.bucket_size, j // self.bucket_size)
+        # Resident tiles are always summarized, so only a sparse change can land on a tile that is not
+        self.summarize(np.array([key[0]]), np.array([key[1]]))
+        self.sums[(position,) + key] += after - before
+        if (before > 0) != (after > 0):
+            self.counts[(position,) + key] += 1 if after > 0 else -1
+
+    def set_tile(self, key: TileKey, dense: np.ndarray) -> None:
+        """Replace a tile's dense summaries from its amounts, shape (kinds, t, t)."""
+        count = len(self.layers.dense_keys)
+        self.counts[(slice(0, count),) + key] = np.count_nonzero(dense, axis=(1, 2))
+        self.sums[(slice(0, count),) + key] = dense.sum(axis=(1, 2), dtype=np.float64)
+        self.summarized[key] = True
+
+    def refresh_resident(self, positions: slice = slice(None)) -> None:
+        """Recount dense kinds of every resident tile after a bulk change."""
+        slots = np.fromiter(self.layers.tiles.values(), dtype=np.intp, count=len(self.layers.tiles))
+        if not len(slots):
+            return
+        ti, tj = self.layers.slot_tiles[slots].T
+        amounts = self.layers.amounts[slots, positions]
+        self.counts[positions, ti, tj] = np.count_nonzero(amounts, axis=(2, 3)).T
+        self.sums[positions, ti, tj] = amounts.sum(axis=(2, 3), dtype=np.float64).T
+
+    def totals(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Total amount and deposit count per kind over the whole grid; summarizes every tile."""
+        ti, tj = np.nonzero(~self.summarized)
+        self.summarize(ti, tj)
+        return self.sums.sum(axis=(1, 2)), self.counts.sum(axis=(1, 2))
+
+    def query(self, longitude: float, latitude: float, radius_km: float,
+              positions: Optional[Sequence[int]] = None) -> Tuple[np.ndarray, ...]:
+        """Deposits within ``radius_km`` of a point, nearest first.
+
+        Returns arrays of kind positions (into ``layers.keys``), cell indices i and j,
+        distances in km and amounts.
+        """
+        grid = self.grid
+        b = self.bucket_size
+        positions = np.arange(len(self.layers.keys)) if positions is None else np.asarray(positions, dtype=np.intp)
+
+        # Cell ranges whose centres the circle can reach
+        span_lat = radius_km / KM_PER_DEGREE
+        j0 = max(0, int(np.ceil((latitude - span_lat - grid.min_latitude) / grid.latitude_resolution)))
+        j1 = min(grid.shape[1] - 1, int(np.floor((latitude + span_lat - grid.min_latitude) / grid.latitude_resolution)))
+        span_lon = longitude_span(latitude - span_lat, latitude + span_lat, radius_km)
+        if span_lon >= 180.0 and self.wraps:
+            lon_buckets = np.arange(self.shape[0])
+        else:
+            i0 = int(np.ceil((longitude - span_lon - grid.min_longitude) / grid.longitude_resolution))
+            i1 = int(np.floor((longitude + span_lon - grid.min_longitude) / grid.longitude_resolution))
+            cells = np.arange(i0, i1 + 1)
+            cells = cells % grid.shape[0] if self.wraps else cells[(cells >= 0) & (cells < grid.shape[0])]
+            lon_buckets = np.unique(cells // b)
+        if j0 > j1 or not len(lon_buckets):
+            return self._empty()
+        lat_buckets = np.arange(j0 // b, j1 // b + 1)
+
+        # Buckets holding any wanted kind
+        ti, tj = np.meshgrid(lon_buckets, lat_buckets, indexing='ij')
+        self.summarize(ti.ravel(), tj.ravel())
+        occupied = self.counts[positions][:, lon_buckets][:, :, lat_buckets].any(axis=0)
+        bi, bj = np.nonzero(occupied)
+        if not len(bi):
+            return self._empty()
+        i, j, inside = self.layers._tile_cells(lon_buckets[bi], lat_buckets[bj])
+        i, j = i[inside], j[inside]
+
+        distance = haversine_km(longitude, latitude, grid.longitudes[i], grid.latitudes[j])
+        near = distance <= radius_km
+        i, j, distance = i[near], j[near], distance[near]
+        amounts = self.layers.values(positions, i, j)
+        kind, cell = np.nonzero(amounts > 0)
+        order = np.argsort(distance[cell], kind='stable')
+        kind, cell = kind[order], cell[order]
+        return positions[kind], i[cell], j[cell], distance[cell], amounts[kind, cell]
+
+    def nearest(self, longitude: float, latitude: float, count: int, positions: Optional[Sequence[int]] = None,
+                max_km: float = HALF_CIRCUMFERENCE_KM) -> Tuple[np.ndarray, ...]:
+        """The ``count`` deposits nearest a point, searching outwards in widening circles up to ``max_km``."""
+        radius = min(max_km, 2 * KM_PER_DEGREE * self.grid.latitude_resolution)
+        while True:
+            found = self.query(longitude, latitude, radius, positions)
+            if len(found[0]) >= count or radius >= max_km:
+                return tuple(column[:count] for column in found)
+            radius = min(max_km, radius * 4)
+
+    def _empty(self) -> Tuple[np.ndarray, ...]:
+        empty = np.zeros(0, dtype=np.intp)
+        return empty, empty, empty, np.zeros(0), np.zeros(0, dtype=np.float32)
@@ -6,6 +6,12 @@ from datetime import datetime
 import logging
 import numpy as np
 from .utils.logging_config import get_logger
+from .grid import RasterGrid
+from .recipes import RecipeBook
+from .resource_layers import ResourceLayers, ResourceTileConfig
+from .rng import hash_uniform
+from .spatial import HALF_CIRCUMFERENCE_KM
+from .terrain import TERRAIN_CODES, OCEAN_CODES, TerrainType
 import time
 
 logger = get_logger(__name__)
@@ -52,6 +58,32 @@ class ResourceType(Enum):
     SHELL_CRAFT = "shell_craft"
     SEAWEED_FERTILIZER = "seaweed_fertilizer"
 
+RESOURCE_TYPES = list(ResourceType)
+RESOURCE_CODES = {resource_type: code for code, resource_type in enumerate(RESOURCE_TYPES)}
+
+# Kinds present across the map get dense layers; renewable ones come first so they form one slice
+RENEWABLE_RESOURCES = (ResourceType.FOOD, ResourceType.WATER, ResourceType.WOOD, ResourceType.FIBER,
+                       ResourceType.FISH, ResourceType.SHELLFISH, ResourceType.SEAWEED)
+DENSE_RESOURCES = RENEWABLE_RESOURCES + (ResourceType.STONE, ResourceType.ORE)
+SPARSE_RESOURCES = tuple(t for t in RESOURCE_TYPES if t not in DENSE_RESOURCES)
+
+# Gathering efficiency group of each kind; anything else gathers at 1.0
+EFFICIENCY_GROUPS = {
+    ResourceType.ORE: 'mining',
+    ResourceType.STONE: 'mining',
+    ResourceType.FOOD: 'farming',
+    ResourceType.FIBER: 'farming',
+    ResourceType.FISH: 'fishing',
+    ResourceType.SHELLFISH: 'fishing',
+}
+
+# Shallow-water terrain holding shellfish and seaweed, with the share of capacity each reaches there
+SHELF_CODES = np.array([TERRAIN_CODES[t.value] for t in (TerrainType.CONTINENTAL_SHELF, TerrainType.CORAL_REEF,
+                                                         TerrainType.TIDAL_FLAT, TerrainType.ESTUARY)],
+                       dtype=np.uint8)
+SHELF_YIELDS = {ResourceType.SHELLFISH: 0.6, ResourceType.SEAWEED: 0.8}
+DEFAULT_QUALITY = 0.5
+
 @dataclass
 class Resource:
     type: ResourceType
@@ -67,11 +99,12 @@ class ResourceSystem:
     def __init__(self, world):
         self.world = world
         self.logger = get_logger(__name__)
-        
-        # Initialize resource maps
-        self.mineral_map = {}
-        self.water_map = {}
-        self.vegetation_map = {}
+        # Resources stay on a 1-degree grid whatever the world resolution; the terrain is sampled onto it
+        self.grid = RasterGrid(world.min_longitude, world.max_longitude, world.min_latitude, world.max_latitude,
+                               1.0, 1.0)
+        # Untouched cells are derived from this seed and the cell, so they can be dropped and rebuilt at will
+        self.noise_seed = world.rng.derive_seed('worldgen.resources')
+        self.tile_config = ResourceTileConfig()
         
         # Resource types and their properties
         self.mineral_types = {
@@ -89,9 +122,11 @@ class ResourceSystem:
             'tundra': {'density': 0.3, 'growth_rate': 0.08}
         }
         
-        self.resources = {}  # (longitude, latitude) -> Dict[str, float]
-        self.resource_regeneration_rate = 0.1  # Resources regenerate at 10% per tick
-        self.resource_capacity = 1000  # Maximum amount of each resource
+        self.resources: Optional[ResourceLayers] = None  # Built by initialize_resources
+        self.regeneration_rates = np.array([self._get_regeneration_rate(t.value) for t in RENEWABLE_RESOURCES],
+                                           dtype=np.float32)
+        self._max_amounts = np.array([self._get_max_amount(t.value) for t in DENSE_RESOURCES], dtype=np.float32)
+        self.qualities: Dict[Tuple[int, int, ResourceType], float] = {}  # Only cells that differ from the default
         self.discovered_resources: Set[ResourceType] = set()  # Track discovered resource types
         self.fishing_zones: Dict[Tuple[float, float], Dict] = {}  # (longitude, latitude) -> fishing data
         
@@ -103,6 +138,11 @@ class ResourceSystem:
             'processing': 1.0,
             'storage': 1.0
         }
+        groups = ['mining', 'farming', 'fishing']
+        self._efficiency_groups = np.array([groups.index(EFFICIENCY_GROUPS[t]) if t in EFFICIENCY_GROUPS
+                                            else len(groups) for t in RESOURCE_TYPES])
+        self._efficiency_names = groups
+        self.type_efficiency = np.ones(len(RESOURCE_TYPES), dtype=np.float32)  # Indexed by RESOURCE_CODES
         
         # Technology-based resource discovery requirements
         self.tech_discovery_requirements = {
@@ -146,6 +186,8 @@ class ResourceSystem:
         self.processing_recipes = {}
         self._initialize_processing_recipes()
         logger.info("Processing recipes initialized")
+        self.recipes = RecipeBook(RESOURCE_TYPES, self.resource_requirements, self.processing_recipes)
+        self._available_techs: Set[str] = set()  # Tech levels only rise, so a tech once present stays
         
         # Initialize basic resources as discovered
         logger.info("Setting up basic resources...")
@@ -169,89 +211,130 @@ class ResourceSystem:
         logger.info("Resource system initialized")
         
     def add_resource(self, resource: Resource) -> None:
-        """Add a resource to the manager"""
-        location = (resource.longitude, resource.latitude)
-        if location not in self.resources:
-            self.resources[location] = {}
-        self.resources[location][resource.type] = resource
+        """Add a resource's amount to its cell"""
+        cell = self.grid.index(resource.longitude, resource.latitude)
+        if cell is None:
+            return
+        self.resources.add(resource.type, *cell, resource.amount)
+        if resource.quality != DEFAULT_QUALITY:
+            self.qualities[cell + (resource.type,)] = resource.quality
         
     def get_resource(self, longitude: float, latitude: float, resource_type: ResourceType) -> Optional[Resource]:
         """Get a resource at a specific location"""
-        location = (longitude, latitude)
-        return self.resources.get(location, {}).get(resource_type)
+        cell = self.grid.index(longitude, latitude)
+        amount = self.resources.get(resource_type, *cell) if cell else 0.0
+        if amount <= 0:
+            return None
+        regrowth_rate = self._get_regeneration_rate(resource_type.value)
+        return Resource(
+            type=resource_type,
+            amount=amount,
+            quality=self.qualities.get(cell + (resource_type,), DEFAULT_QUALITY),
+            longitude=longitude,
+            latitude=latitude,
+            renewable=regrowth_rate > 0,
+            regrowth_rate=regrowth_rate,
+            max_amount=self._get_max_amount(resource_type.value)
+        )
+        
+    def get_cell_resources(self, longitude: float, latitude: float) -> Dict[ResourceType, float]:
+        """Get the nonzero resource amounts in the cell holding a coordinate."""
+        cell = self.grid.index(longitude, latitude)
+        return self.resources.cell(*cell) if cell else {}
         
     def get_resources_at(self, lon: float, lat: float) -> Dict[str, float]:
         """Get resources at a specific location."""
-        # Round coordinates to nearest degree
-        lon_rounded = round(lon)
-        lat_rounded = round(lat)
-        return self.resources.get((lon_rounded, lat_rounded), {
-            'water': 0.0,
-            'food': 0.0,
-            'wood': 0.0,
-            'stone': 0.0,
-            'metal': 0.0,
-            'fertility': 0.0
-        })
+        return {resource_type.value: amount for resource_type, amount in self.get_cell_resources(lon, lat).items()}
+        
+    def has_resources_at(self, longitude: float, latitude: float) -> bool:
+        """Check whether the cell holding a coordinate has any resources."""
+        return bool(self.get_cell_resources(longitude, latitude))
         
-    def get_nearby_resources(self, longitude: float, latitude: float, radius: float) -> Dict[str, Dict[ResourceType, float]]:
-        """Get resources within radius of location"""
+    def get_resource_amounts_at(self, longitudes, latitudes, resource_type: ResourceType) -> np.ndarray:
+        """Batch lookup of one resource amount per coordinate."""
+        i, j, inside = self.grid.indices(longitudes, latitudes)
+        amounts = self.resources.values([self.resources.position(resource_type)], i.ravel(), j.ravel())[0]
+        return np.where(inside, amounts.reshape(i.shape), 0.0)
+
+    def find_resources(self, longitude: float, latitude: float, radius_km: float,
+                       resource_types: Optional[List[ResourceType]] = None) -> List[Resource]:
+        """Get the deposits within ``radius_km`` of a location, nearest first."""
+        return self._deposits(self.resources.deposits.query(longitude, latitude, radius_km,
+                                                            self._positions(resource_types)))
+        
+    def nearest_resources(self, longitude: float, latitude: float, count: int,
+                          resource_types: Optional[List[ResourceType]] = None,
+                          max_distance: Optional[float] = None) -> List[Resource]:
+        """Get the ``count`` deposits nearest a location, optionally no further than ``max_distance`` km."""
+        max_distance = HALF_CIRCUMFERENCE_KM if max_distance is None else max_distance
+        return self._deposits(self.resources.deposits.nearest(longitude, latitude, count,
+                                                              self._positions(resource_types), max_distance))
+        
+    def get_nearby_resources(self, longitude: float, latitude: float, radius: float) -> Dict[str, Dict[str, float]]:
+        """Get resource amounts by type value within radius (km) of location, grouped by cell"""
         nearby = {}
-        for dlon in np.arange(-radius, radius + self.world.longitude_resolution, self.world.longitude_resolution):
-            for dlat in np.arange(-radius, radius + self.world.latitude_resolution, self.world.latitude_resolution):
-                check_lon = longitude + dlon
-                check_lat = latitude + dlat
-                pos = (check_lon, check_lat)
-                if pos in self.resources:
-                    nearby[f"{check_lon},{check_lat}"] = {
-                        str(resource_type): amount 
-                        for resource_type, amount in self.resources[pos].items()
-                    }
+        for resource in self.find_resources(longitude, latitude, radius):
+            nearby.setdefault(f"{resource.longitude},{resource.latitude}", {})[resource.type.value] = resource.amount
         return nearby
         
+    def _positions(self, resource_types: Optional[List[ResourceType]]) -> Optional[List[int]]:
+        if resource_types is None:
+            return None
+        return [self.resources.position(resource_type) for resource_type in resource_types]
+        
+    def _deposits(self, found) -> List[Resource]:
+        """Build Resource records from deposit index query results."""
+        resources = []
+        for position, i, j, _, amount in zip(*(column.tolist() for column in found)):
+            resource_type = self.resources.keys[position]
+            regrowth_rate = self._get_regeneration_rate(resource_type.value)
+            longitude, latitude = self.grid.coordinates(i, j)
+            resources.append(Resource(
+                type=resource_type,
+                amount=amount,
+                quality=self.qualities.get((i, j, resource_type), DEFAULT_QUALITY),
+                longitude=longitude,
+                latitude=latitude,
+                renewable=regrowth_rate > 0,
+                regrowth_rate=regrowth_rate,
+                max_amount=self._get_max_amount(resource_type.value)
+            ))
+        return resources
+        
     def update_resources(self, lon: float, lat: float, resource_type: str, amount: float):
         """Update resource amount at a location."""
-        lon_rounded = round(lon)
-        lat_rounded = round(lat)
-        if (lon_rounded, lat_rounded) in self.resources:
-            self.resources[(lon_rounded, lat_rounded)][resource_type] = max(0.0, amount)
+        cell = self.grid.index(lon, lat)
+        if cell is not None:
+            resource_type = ResourceType(resource_type)
+            self.resources.add(resource_type, *cell, max(0.0, amount) - self.resources.get(resource_type, *cell))
         
     def consume_resource(self, longitude: float, latitude: float, resource_type: ResourceType, amount: float) -> bool:
         """Consume a resource amount"""
-        location = (longitude, latitude)
-        resource = self.get_resource(longitude, latitude, resource_type)
-        if not resource or resource.amount < amount:
+        cell = self.grid.index(longitude, latitude)
+        if cell is None or self.resources.get(resource_type, *cell) < amount:
             return False
-            
-        resource.amount -= amount
-        if resource.amount <= 0:
-            del self.resources[location][resource_type]
-            if not self.resources[location]:
-                del self.resources[location]
+        self.resources.add(resource_type, *cell, -amount)
         return True
         
     def can_craft(self, resource_type: ResourceType, available_resources: Dict[ResourceType, float]) -> bool:
         """Check if a resource can be crafted with available resources"""
-        if resource_type not in self.resource_requirements:
-            return False
-            
-        for required_type, required_amount in self.resource_requirements[resource_type]:
-            if available_resources.get(required_type, 0) < required_amount:
-                return False
-        return True
+        return self.recipes.can_craft(resource_type, available_resources)
+        
+    def get_craftable_counts(self, inventories: List[Dict]) -> np.ndarray:
+        """Times each recipe product can be crafted from each inventory; columns follow ``recipes.products``."""
+        return self.recipes.craftable(inventories)
         
     def craft_resource(self, resource_type: ResourceType, longitude: float, latitude: float, quality: float = 0.5) -> bool:
         """Craft a new resource"""
-        if resource_type not in self.resource_requirements:
+        if resource_type not in self.recipes.product_codes:
             return False
             
         # Check if we have all required resources
-        available_resources = self.get_resources_at(longitude, latitude)
-        if not self.can_craft(resource_type, {r.type: r.amount for r in available_resources.values()}):
+        if not self.can_craft(resource_type, self.get_cell_resources(longitude, latitude)):
             return False
             
         # Consume required resources
-        for required_type, required_amount in self.resource_requirements[resource_type]:
+        for required_type, required_amount in self.recipes.inputs[resource_type]:
             if not self.consume_resource(longitude, latitude, required_type, required_amount):
                 return False
                 
@@ -278,73 +361,31 @@ class ResourceSystem:
         """Improve the quality of a resource"""
         resource = self.get_resource(longitude, latitude, resource_type)
         if resource:
-            resource.quality = min(1.0, resource.quality + amount)
+            cell = self.grid.index(longitude, latitude)
+            self.qualities[cell + (resource_type,)] = min(1.0, resource.quality + amount)
             
     def get_resource_stats(self) -> Dict[ResourceType, Dict[str, float]]:
         """Get statistics about all resources"""
+        # Cells without a recorded quality are at the default
+        quality_sums = {resource_type: 0.0 for resource_type in ResourceType}
+        quality_counts = dict.fromkeys(ResourceType, 0)
+        for (i, j, resource_type), quality in self.qualities.items():
+            if self.resources.get(resource_type, i, j) > 0:
+                quality_sums[resource_type] += quality
+                quality_counts[resource_type] += 1
+        
         stats = {}
+        totals = self.resources.totals()
         for resource_type in ResourceType:
-            total_amount = 0.0
-            total_quality = 0.0
-            count = 0
-            
-            for location_resources in self.resources.values():
-                if resource_type in location_resources:
-                    resource = location_resources[resource_type]
-                    total_amount += resource.amount
-                    total_quality += resource.quality
-                    count += 1
-                    
-            if count > 0:
-                stats[resource_type] = {
-                    "total_amount": total_amount,
-                    "average_quality": total_quality / count,
-                    "locations": count
-                }
-            else:
-                stats[resource_type] = {
-                    "total_amount": 0.0,
-                    "average_quality": 0.0,
-                    "locations": 0
-                }
-                
+            total_amount, count = totals[resource_type]
+            quality = quality_sums[resource_type] + DEFAULT_QUALITY * (count - quality_counts[resource_type])
+            stats[resource_type] = {
+                "total_amount": total_amount,
+                "average_quality": quality / count if count else 0.0,
+                "locations": count
+            }
         return stats
 
-    def generate_resources(self, longitude: float, latitude: float, terrain_type: str):
-        """Generate resources at a specific location based on terrain type."""
-        # Round coordinates to nearest grid point
-        lon_rounded = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_rounded = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
-        
-        # Initialize resource amounts based on terrain type
-        resources = {
-            'water': 0.0,
-            'food': 0.0,
-            'wood': 0.0,
-            'stone': 0.0,
-            'metal': 0.0
-        }
-        
-        # Set resource amounts based on terrain type
-        if terrain_type == 'water':
-            resources['water'] = 1.0
-            resources['food'] = random.uniform(0.3, 0.7)
-        elif terrain_type == 'forest':
-            resources['wood'] = random.uniform(0.6, 1.0)
-            resources['food'] = random.uniform(0.4, 0.8)
-        elif terrain_type == 'mountain':
-            resources['stone'] = random.uniform(0.7, 1.0)
-            resources['metal'] = random.uniform(0.5, 0.9)
-        elif terrain_type == 'grassland':
-            resources['food'] = random.uniform(0.5, 0.9)
-            resources['water'] = random.uniform(0.3, 0.7)
-        elif terrain_type == 'desert':
-            resources['stone'] = random.uniform(0.3, 0.7)
-            resources['metal'] = random.uniform(0.2, 0.6)
-        
-        # Store resources
-        self.resources[(lon_rounded, lat_rounded)] = resources
-        
     def discover_resource(self, resource_type: ResourceType, tech_name: Optional[str] = None) -> bool:
         """Discover a new resource type, requiring appropriate technology."""
         if resource_type in self.discovered_resources:
@@ -361,37 +402,26 @@ class ResourceSystem:
         
     def _has_required_tech(self, tech_name: str) -> bool:
         """Check if required technology is available."""
+        if tech_name in self._available_techs:
+            return True
         if not self.world.technology:
             return False
-        return self.world.technology.get_tech_level(tech_name) > 0
+        if self.world.technology.get_tech_level(tech_name) > 0:
+            self._available_techs.add(tech_name)
+            return True
+        return False
         
     def gather_resource(self, longitude: float, latitude: float, resource_type: ResourceType, amount: float) -> float:
         """Gather a resource with technology-based efficiency."""
-        # Get base gathering amount
-        base_amount = super().gather_resource(longitude, latitude, resource_type, amount)
-        
-        # Apply technology modifier
-        if resource_type in [ResourceType.ORE, ResourceType.STONE]:
-            tech_modifier = self.tech_efficiency_modifiers['mining']
-        elif resource_type in [ResourceType.FOOD, ResourceType.FIBER]:
-            tech_modifier = self.tech_efficiency_modifiers['farming']
-        elif resource_type in [ResourceType.FISH, ResourceType.SHELLFISH]:
-            tech_modifier = self.tech_efficiency_modifiers['fishing']
-        else:
-            tech_modifier = 1.0
-            
-        return base_amount * tech_modifier
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
+            return 0.0
+        gathered = self.resources.take(resource_type, *cell, amount)
+        return gathered * float(self.type_efficiency[RESOURCE_CODES[resource_type]])
         
     def process_resource(self, resource_type: ResourceType, amount: float) -> Dict[ResourceType, float]:
         """Process a resource with technology-based efficiency."""
-        # Get base processing results
-        base_results = super().process_resource(resource_type, amount)
-        
-        # Apply technology modifier
-        tech_modifier = self.tech_efficiency_modifiers['processing']
-        
-        # Scale results by technology level
-        return {rtype: amount * tech_modifier for rtype, amount in base_results.items()}
+        return self.recipes.process(resource_type, amount, self.tech_efficiency_modifiers['processing'])
         
     def check_fire_discovery(self, agent_intelligence: float, has_wood: bool, has_stone: bool) -> bool:
         """Check if an agent can discover fire"""
@@ -404,51 +434,32 @@ class ResourceSystem:
         
     def to_dict(self):
         """Convert resource system state to dictionary."""
-        return {
-            "resources": {
-                str(loc): {
-                    str(resource_type): {
-                        "amount": resource.amount if hasattr(resource, 'amount') else resource.get('amount', 0.0),
-                        "type": resource_type
-                    }
-                    for resource_type, resource in resources.items()
-                }
-                for loc, resources in self.resources.items()
-            }
-        }
+        return self.get_state()
         
     def update(self, time_delta: float) -> None:
         """Update resource states based on time delta"""
-        # Update resource regeneration
-        for location, resources in self.resources.items():
-            for resource_type, resource in resources.items():
-                # Skip non-renewable resources
-                if not isinstance(resource, dict) or not resource.get('renewable', False):
-                    continue
-                    
-                # Calculate regeneration
-                regen_rate = self._get_regeneration_rate(resource_type)
-                max_amount = self._get_max_amount(resource_type)
-                current_amount = resource.get('amount', 0)
-                
-                # Regenerate resource
-                new_amount = min(
-                    current_amount + (regen_rate * time_delta),
-                    max_amount
-                )
-                resource['amount'] = new_amount
+        self._update_tech_modifiers()
+        
+        # Keep the cells agents stand on resident, drop idle tiles, then regrow what is left
+        self.resources.now = float(self.world.simulation_time)
+        for agent in self.world.agents.agents.values():
+            cell = self.grid.index(float(agent.position[0]), float(agent.position[1]))
+            if cell is not None:
+                self.resources.touch(*cell)
+        self.resources.evict(self.resources.now)
+        self.resources.regenerate(self.regeneration_rates, time_delta)
         
         # Update fishing zones
         for zone in self.fishing_zones.values():
             if zone['active']:
                 # Apply fishing technology modifier
                 tech_modifier = self.tech_efficiency_modifiers.get('fishing', 1.0)
-                zone['efficiency'] *= tech_modifier
+                zone['efficiency'] *= tech_modifier ** time_delta
                 zone['last_update'] = time.time()
         
     def _update_tech_modifiers(self) -> None:
         """Update technology-based efficiency modifiers."""
-        if not self.world.technology:
+        if not getattr(self.world, 'technology', None):
             return
             
         # Update mining efficiency
@@ -470,6 +481,10 @@ class ResourceSystem:
         # Update storage efficiency
         storage_tech = self.world.technology.get_tech_level('storage')
         self.tech_efficiency_modifiers['storage'] = 1.0 + (storage_tech * 0.2)
+        
+        # Spread the group modifiers over the resource kinds
+        modifiers = [self.tech_efficiency_modifiers[name] for name in self._efficiency_names] + [1.0]
+        self.type_efficiency = np.asarray(modifiers, dtype=np.float32)[self._efficiency_groups]
 
     def _get_regeneration_rate(self, resource_type: str) -> float:
         """Get the regeneration rate for a resource type"""
@@ -520,113 +535,90 @@ class ResourceSystem:
     def get_state(self) -> Dict:
         """Get current resource system state."""
         return {
-            'resources': self.resources
+            'resources': {
+                resource_type.value: stats for resource_type, stats in self.get_resource_stats().items()
+            },
+            'residency': self.resources.get_stats()
         }
         
     def initialize_resources(self):
         """Initialize all resource maps."""
         self.logger.info("Initializing resource system...")
-        
-        # Calculate total steps for progress tracking
-        total_steps = (self.world.max_longitude - self.world.min_longitude) * \
-                     (self.world.max_latitude - self.world.min_latitude)
-        current_step = 0
-        
-        # Initialize resources for each coordinate
-        for lon in range(int(self.world.min_longitude), int(self.world.max_longitude)):
-            for lat in range(int(self.world.min_latitude), int(self.world.max_latitude)):
-                coord = (lon, lat)
-                
-                # Initialize mineral resources
-                self.mineral_map[coord] = self._generate_mineral_resources(coord)
-
-                # Initialize water resources
-                self.water_map[coord] = self._generate_water_resources(coord)
-
-                # Initialize vegetation
-                self.vegetation_map[coord] = self._generate_vegetation(coord)
-
-                # Combine into unified resource mapping
-                self.resources[coord] = {
-                    'minerals': self.mineral_map[coord],
-                    'water': self.water_map[coord],
-                    'vegetation': self.vegetation_map[coord],
-                }
-                
-                # Update progress
-                current_step += 1
-                if current_step % 100 == 0:
-                    progress = (current_step / total_steps) * 100
-                    self.logger.info(f"Resource initialization progress: {progress:.1f}%")
-        
+        # Nothing is generated up front; tiles of cells are derived as they are first touched
+        self.resources = ResourceLayers(self.grid, DENSE_RESOURCES, SPARSE_RESOURCES, self._default_amounts,
+                                        len(RENEWABLE_RESOURCES), self.tile_config)
+        self.qualities.clear()
         self.logger.info("Resource system initialization complete")
     
-    def _generate_mineral_resources(self, coord: Tuple[int, int]) -> Dict:
-        """Generate mineral resources for a coordinate."""
-        resources = {}
-        for mineral, properties in self.mineral_types.items():
-            # Use coordinate-based noise for resource distribution
-            noise = np.random.normal(0, 1)
-            abundance = properties['abundance'] * (1 + 0.2 * noise)
-            if abundance > 0.5:  # Threshold for resource presence
-                resources[mineral] = {
-                    'amount': abundance,
-                    'value': properties['value']
-                }
-        return resources
+    def mark_explored(self, longitude: float, latitude: float) -> None:
+        """Keep the resources around an explored coordinate resident."""
+        cell = self.grid.index(longitude, latitude)
+        if cell is not None:
+            self.resources.explore(*cell)
     
-    def _generate_water_resources(self, coord: Tuple[int, int]) -> Dict:
-        """Generate water resources for a coordinate."""
-        # Base water availability on terrain and climate
-        lon, lat = coord
-        terrain = self.world.terrain.get_terrain_info_at(lon, lat)
-        climate = self.world.climate.get_climate_at(lon, lat)
-        
-        water_amount = 0.0
-        if terrain['type'] == 'ocean':
-            water_amount = 1.0
-        elif terrain['type'] == 'lake':
-            water_amount = 0.8
-        elif terrain['type'] == 'river':
-            water_amount = 0.6
-        else:
-            # Adjust based on precipitation
-            water_amount = climate['precipitation'] * 0.5
-        
-        return {
-            'amount': water_amount,
-            'type': terrain['type'] if water_amount > 0 else 'none'
+    def _default_amounts(self, i: np.ndarray, j: np.ndarray) -> np.ndarray:
+        """Derive the untouched dense amounts of cells, shape (kinds, cells), from the seed, terrain and base climate."""
+        lons, lats = self.grid.longitudes[i], self.grid.latitudes[j]
+        terrain = self.world.terrain
+        codes = terrain.get_terrain_codes_at(lons, lats)
+        temperature, precipitation = self.world.climate.get_base_climate_at(lons, lats)
+        ocean = np.isin(codes, OCEAN_CODES)
+        shelf = np.isin(codes, SHELF_CODES)
+        food = terrain.get_resource_amounts_at(lons, lats, 'food')
+        densities = np.array([properties['density'] for properties in self.vegetation_types.values()] + [0.0])
+        minerals = sum(self._generate_mineral_resources(i, j).values())
+        
+        # Fraction of each kind's maximum amount per cell
+        fractions = {
+            ResourceType.FOOD: np.where(ocean, 0.0, food),
+            ResourceType.WATER: self._generate_water_resources(codes, precipitation),
+            ResourceType.WOOD: terrain.get_resource_amounts_at(lons, lats, 'wood'),
+            # Code -1 (no vegetation) picks the trailing 0
+            ResourceType.FIBER: densities[self._generate_vegetation(codes, temperature, precipitation)],
+            ResourceType.FISH: np.where(ocean, food, 0.0),
+            ResourceType.SHELLFISH: shelf * SHELF_YIELDS[ResourceType.SHELLFISH],
+            ResourceType.SEAWEED: shelf * SHELF_YIELDS[ResourceType.SEAWEED],
+            ResourceType.STONE: terrain.get_resource_amounts_at(lons, lats, 'stone'),
+            ResourceType.ORE: np.maximum(terrain.get_resource_amounts_at(lons, lats, 'metal'), np.minimum(minerals, 1.0)),
         }
+        return np.stack([fractions[t] for t in DENSE_RESOURCES]) * self._max_amounts[:, None]
     
-    def _generate_vegetation(self, coord: Tuple[int, int]) -> Dict:
-        """Generate vegetation for a coordinate."""
-        # Base vegetation on climate and terrain
-        lon, lat = coord
-        climate = self.world.climate.get_climate_at(lon, lat)
-        terrain = self.world.terrain.get_terrain_info_at(lon, lat)
-        
-        if terrain['type'] in ['ocean', 'lake', 'river']:
-            return {'type': 'none', 'density': 0.0}
+    def _generate_mineral_resources(self, i: np.ndarray, j: np.ndarray) -> Dict[str, np.ndarray]:
+        """Generate one amount per mineral and cell; zero where the mineral is absent."""
+        layers = {}
+        for salt, (mineral, properties) in enumerate(self.mineral_types.items()):
+            # Cell-hashed normal noise (Box-Muller), the same however and whenever the cell is reached
+            u1 = hash_uniform(self.noise_seed, 2 * salt, i, j)
+            u2 = hash_uniform(self.noise_seed, 2 * salt + 1, i, j)
+            noise = np.sqrt(-2 * np.log1p(-u1)) * np.cos(2 * np.pi * u2)
+            abundance = properties['abundance'] * (1 + 0.2 * noise)
+            # Threshold for resource presence
+            layers[f"mineral_{mineral}"] = np.where(abundance > 0.5, abundance, 0.0).astype(np.float32)
+        return layers
+    
+    def _generate_water_resources(self, terrain: np.ndarray, precipitation: np.ndarray) -> np.ndarray:
+        """Generate water availability from terrain and climate."""
+        return np.select(
+            [np.isin(terrain, OCEAN_CODES),
+             terrain == TERRAIN_CODES[TerrainType.LAKE.value],
+             terrain == TERRAIN_CODES[TerrainType.RIVER.value]],
+            [1.0, 0.8, 0.6],
+            precipitation * 0.5  # Adjust based on precipitation
+        ).astype(np.float32)
+    
+    def _generate_vegetation(self, terrain: np.ndarray, temperature: np.ndarray,
+                             precipitation: np.ndarray) -> np.ndarray:
+        """Generate vegetation type codes (-1 for none) from climate and terrain."""
+        veg_codes = {veg_type: code for code, veg_type in enumerate(self.vegetation_types)}
+        water = np.isin(terrain, np.append(OCEAN_CODES, [TERRAIN_CODES[TerrainType.LAKE.value],
+                                                          TERRAIN_CODES[TerrainType.RIVER.value]]))
         
         # Determine vegetation type based on temperature and precipitation
-        temp = climate['temperature']
-        precip = climate['precipitation']
-        
-        if temp < 0:
-            veg_type = 'tundra'
-        elif temp > 30 and precip < 0.2:
-            veg_type = 'desert'
-        elif precip > 0.6:
-            veg_type = 'forest'
-        else:
-            veg_type = 'grassland'
-        
-        properties = self.vegetation_types[veg_type]
-        return {
-            'type': veg_type,
-            'density': properties['density'],
-            'growth_rate': properties['growth_rate']
-        }
+        return np.select(
+            [water, temperature < 0, (temperature > 30) & (precipitation < 0.2), precipitation > 0.6],
+            [-1, veg_codes['tundra'], veg_codes['desert'], veg_codes['forest']],
+            veg_codes['grassland']
+        ).astype(np.int8)
 
     def verify_initialization(self) -> bool:
         """Verify that the resource system is properly initialized."""
@@ -656,33 +648,6 @@ class ResourceSystem:
         logger.info("Resource system initialization verified successfully")
         return True
 
-    def _initialize_basic_resources(self):
-        """Initialize basic resources across the world."""
-        logger.info("Initializing basic resources...")
-        for lon in np.arange(-180, 180, self.world.longitude_resolution):
-            for lat in np.arange(-90, 90, self.world.latitude_resolution):
-                terrain_type = self.world.terrain.get_terrain_type(lon, lat)
-                self.generate_resources(lon, lat, terrain_type)
-        logger.info("Basic resources initialized")
-
-    def _initialize_resource_distribution(self):
-        """Initialize resource distribution patterns."""
-        logger.info("Initializing resource distribution patterns...")
-        # Create resource clusters
-        for _ in range(100):  # Create 100 resource clusters
-            center_lon = random.uniform(-180, 180)
-            center_lat = random.uniform(-90, 90)
-            radius = random.uniform(1, 5)
-            
-            for dlon in np.arange(-radius, radius, 0.5):
-                for dlat in np.arange(-radius, radius, 0.5):
-                    lon = center_lon + dlon
-                    lat = center_lat + dlat
-                    if -180 <= lon <= 180 and -90 <= lat <= 90:
-                        terrain_type = self.world.terrain.get_terrain_type(lon, lat)
-                        self.generate_resources(lon, lat, terrain_type)
-        logger.info("Resource distribution patterns initialized")
-
     def _initialize_resource_regeneration(self):
         """Initialize resource regeneration settings."""
         logger.info("Initializing resource regeneration settings...")
@@ -693,8 +658,8 @@ class ResourceSystem:
     def _initialize_fishing_zones(self):
         """Initialize fishing zones in coastal areas."""
         logger.info("Initializing fishing zones...")
-        for lon in np.arange(-180, 180, self.world.longitude_resolution):
-            for lat in np.arange(-90, 90, self.world.latitude_resolution):
+        for lon in np.arange(-180, 180, self.grid.longitude_resolution):
+            for lat in np.arange(-90, 90, self.grid.latitude_resolution):
                 if self.world.terrain.is_coastal(lon, lat):
                     self.create_fishing_zone(
                         lon, lat,
@@ -831,13 +796,4 @@ class ResourceSystem:
         
     def process_marine_resource(self, resource_type: ResourceType, amount: float) -> Dict[ResourceType, float]:
         """Process a marine resource into other resources"""
-        if resource_type not in self.processing_recipes:
-            return {}
-            
-        recipe = self.processing_recipes[resource_type]
-        results = {}
-        
-        for result_type, result_amount in recipe.items():
-            results[result_type] = result_amount * amount
-            
-        return results
\ No newline at end of file
+        return self.recipes.process(resource_type, amount)
\ No newline at end of file
@@ -0,0 +1,135 @@
+import random
+import zlib
+from typing import Dict, Optional, Sequence
+import numpy as np
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_MASK64 = (1 << 64) - 1
+
+# Streams and derived seeds under this prefix shape the generated world itself
+WORLDGEN_PREFIX = 'worldgen.'
+
+
+class RandomStream:
+    """A subsystem's random stream that serves scalars from pre-drawn blocks."""
+
+    def __init__(self, name: str, generator: np.random.Generator, block_size: int = 4096):
+        self.name = name
+        self.generator = generator
+        self.block_size = block_size
+        self._uniform_block = np.empty(0)
+        self._uniform_index = 0
+        self._normal_block = np.empty(0)
+        self._normal_index = 0
+
+    def _next_uniform(self) -> float:
+        """Next variate from the block of U[0, 1) draws."""
+        if self._uniform_index >= len(self._uniform_block):
+            self._uniform_block = self.generator.random(self.block_size)
+            self._uniform_index = 0
+        value = self._uniform_block[self._uniform_index]
+        self._uniform_index += 1
+        return float(value)
+
+    def _next_normal(self) -> float:
+        """Next variate from the block of standard normal draws."""
+        if self._normal_index >= len(self._normal_block):
+            self._normal_block = self.generator.standard_normal(self.block_size)
+            self._normal_index = 0
+        value = self._normal_block[self._normal_index]
+        self._normal_index += 1
+        return float(value)
+
+    def random(self, size: Optional[int] = None):
+        """Uniform variates in [0, 1)."""
+        if size is None:
+            return self._next_uniform()
+        return self.generator.random(size)
+
+    def uniform(self, low: float = 0.0, high: float = 1.0, size: Optional[int] = None):
+        """Uniform variates in [low, high)."""
+        if size is None:
+            return low + (high - low) * self._next_uniform()
+        return self.generator.uniform(low, high, size)
+
+    def normal(self, loc: float = 0.0, scale: float = 1.0, size: Optional[int] = None):
+        """Normally distributed variates."""
+        if size is None:
+            return loc + scale * self._next_normal()
+        return self.generator.normal(loc, scale, size)
+
+    def integers(self, low: int, high: int, size: Optional[int] = None):
+        """Integers in [low, high)."""
+        if size is None:
+            return low + int(self._next_uniform() * (high - low))
+        return self.generator.integers(low, high, size)
+
+    def choice(self, options: Sequence, p: Optional[Sequence[float]] = None):
+        """Pick one element of a sequence, uniformly or with weights ``p`` (need not sum to 1)."""
+        if p is None:
+            return options[int(self._next_uniform() * len(options))]
+        cumulative = np.cumsum(p)
+        index = int(np.searchsorted(cumulative, self._next_uniform() * cumulative[-1], side='right'))
+        return options[min(index, len(options) - 1)]
+
+
+def hash_uniform(seed: int, salt: int, x, y) -> np.ndarray:
+    """Stateless uniform values in [0, 1) for integer lattice points (splitmix64 finaliser).
+
+    The same seed, salt and point always give the same value, whatever else was drawn.
+    """
+    # Array arithmetic wraps modulo 2**64; the scalar key is folded in Python to avoid overflow warnings
+    key = np.uint64((salt * 0x165667B19E3779F9 ^ seed) & _MASK64)
+    h = (np.asarray(x).astype(np.uint64) * np.uint64(0x9E3779B97F4A7C15) ^
+         np.asarray(y).astype(np.uint64) * np.uint64(0xC2B2AE3D27D4EB4F) ^ key)
+    h = (h ^ (h >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    h = (h ^ (h >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    h ^= h >> np.uint64(31)
+    return (h >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+
+class RandomService:
+    """Hands out independent, reproducible random streams per subsystem."""
+
+    def __init__(self, seed: Optional[int] = None, block_size: int = 4096, world_seed: Optional[int] = None):
+        # Without a seed, draw one from OS entropy and keep it so the run can be replayed
+        self.seed = seed if seed is not None else int(np.random.SeedSequence().entropy)
+        # Worldgen names derive from the world seed, so one generated world can host many runs
+        self.world_seed = world_seed if world_seed is not None else self.seed
+        self.block_size = block_size
+        self.streams: Dict[str, RandomStream] = {}
+        logger.info(f"Random service seeded with {self.seed} (world seed {self.world_seed})")
+
+    def _sequence(self, name: str) -> np.random.SeedSequence:
+        """Seed sequence for a name, from the world seed for worldgen names and the run seed otherwise."""
+        seed = self.world_seed if name.startswith(WORLDGEN_PREFIX) else self.seed
+        return np.random.SeedSequence(seed, spawn_key=(zlib.crc32(name.encode()),))
+
+    def stream(self, name: str) -> RandomStream:
+        """Get the stream for a subsystem, creating it on first use."""
+        stream = self.streams.get(name)
+        if stream is None:
+            # Derive the stream from the name so it does not depend on creation order
+            stream = RandomStream(name, np.random.Generator(np.random.PCG64(self._sequence(name))), self.block_size)
+            self.streams[name] = stream
+        return stream
+
+    def derive_seed(self, name: str) -> int:
+        """Get a 64-bit seed derived from the run or world seed and a name, for stateless hashing."""
+        return int(self._sequence(name).generate_state(1, np.uint64)[0])
+
+    def seed_globals(self) -> None:
+        """Seed the module-level random and numpy.random state for code not using streams."""
+        random.seed(self.seed)
+        np.random.seed(self.seed % (2 ** 32))
+
+    def get_state(self) -> Dict:
+        """Get the seed and active streams."""
+        return {
+            "seed": self.seed,
+            "world_seed": self.world_seed,
+            "block_size": self.block_size,
+            "streams": sorted(self.streams)
+        }
@@ -252,6 +252,56 @@ def get_status():
         logger.error(traceback.format_exc())
         return jsonify({'error': str(e)}), 500
 
+@api.route('/api/metrics')
+def get_metrics():
+    """Get per-system tick timing metrics."""
+    try:
+        engine = get_engine()
+        if engine and engine.world:
+            return jsonify(engine.world.profiler.get_stats())
+        return jsonify({'error': 'Engine not initialized'}), 500
+    except Exception as e:
+        logger.error(f"Error getting tick metrics: {e}")
+        logger.error(traceback.format_exc())
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/weather/history')
+def get_weather_history():
+    """Get recorded global weather over a range of simulation seconds."""
+    try:
+        engine = get_engine()
+        if engine and engine.world:
+            start = request.args.get('start', 0.0, type=float)
+            end = request.args.get('end', None, type=float)
+            resolution = request.args.get('resolution')
+            if resolution is not None and resolution not in engine.world.weather.weather_history.tiers:
+                return jsonify({'error': f"Unknown resolution: {resolution}"}), 400
+            return jsonify(engine.world.weather.get_history(start, end, resolution))
+        return jsonify({'error': 'Engine not initialized'}), 500
+    except Exception as e:
+        logger.error(f"Error getting weather history: {e}")
+        logger.error(traceback.format_exc())
+        return jsonify({'error': str(e)}), 500
+
+@api.route('/api/weather/forecast')
+def get_weather_forecast():
+    """Get the ensemble weather forecast: mean and quantile bands per variable."""
+    try:
+        engine = get_engine()
+        if engine and engine.world:
+            hours = request.args.get('hours', 24, type=int)
+            ensemble = engine.world.weather.get_forecast_ensemble(max(1, min(hours, 240)))
+            return jsonify({
+                name: ({key: values.tolist() for key, values in value.items()} if isinstance(value, dict)
+                       else value.tolist() if hasattr(value, 'tolist') else value)
+                for name, value in ensemble.items()
+            })
+        return jsonify({'error': 'Engine not initialized'}), 500
+    except Exception as e:
+        logger.error(f"Error getting weather forecast: {e}")
+        logger.error(traceback.format_exc())
+        return jsonify({'error': str(e)}), 500
+
 def broadcast_agent_updates():
     """Broadcast agent location updates to all connected clients."""
     engine = get_engine()
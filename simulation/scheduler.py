@@ -0,0 +1,93 @@
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class ScheduledSystem:
+    """A subsystem update registered with the scheduler."""
+    name: str
+    update: Callable[[float], None]
+    period: int = 1  # Ticks between updates
+    phase: int = 0  # Tick offset within the period
+    pending_dt: float = 0.0  # Game seconds accumulated since the last update
+    runs: int = 0
+
+
+class SystemScheduler:
+    """Runs subsystem updates at individual rates with accumulated time deltas."""
+
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+        self.systems: Dict[str, ScheduledSystem] = {}  # Insertion order is update order
+        self.tick_count = 0
+
+    def register(self, name: str, update: Callable[[float], None], period: int = 1,
+                 phase: Optional[int] = None) -> ScheduledSystem:
+        """Register a system update that fires every ``period`` ticks.
+
+        When no phase is given, periodic systems are staggered round-robin so
+        that expensive slow systems do not all land on the same tick.
+        """
+        period = max(1, int(period))
+        if phase is None:
+            phase = self._next_phase(period)
+        system = ScheduledSystem(name=name, update=update, period=period, phase=phase % period)
+        self.systems[name] = system
+        logger.info(f"Scheduled {name} every {period} tick(s) at phase {system.phase}")
+        return system
+
+    def _next_phase(self, period: int) -> int:
+        """Pick a phase offset for a new periodic system."""
+        if period == 1:
+            return 0
+        periodic = sum(1 for system in self.systems.values() if system.period > 1)
+        return periodic % period
+
+    def set_period(self, name: str, period: int, phase: Optional[int] = None) -> None:
+        """Change the update period of a registered system."""
+        system = self.systems[name]
+        system.period = max(1, int(period))
+        system.phase = (phase if phase is not None else system.phase) % system.period
+
+    def tick(self, dt: float) -> List[str]:
+        """Advance one tick and run every system that is due."""
+        self.tick_count += 1
+        fired = []
+        for system in self.systems.values():
+            system.pending_dt += dt
+            if (self.tick_count - system.phase) % system.period == 0:
+                self._run(system)
+                fired.append(system.name)
+        return fired
+
+    def flush(self) -> None:
+        """Run every system that has time pending so all are caught up."""
+        for system in self.systems.values():
+            if system.pending_dt > 0:
+                self._run(system)
+
+    def _run(self, system: ScheduledSystem) -> None:
+        """Run a system with its accumulated time delta."""
+        elapsed = system.pending_dt
+        system.pending_dt = 0.0
+        system.runs += 1
+        if self.profiler:
+            with self.profiler.section(system.name):
+                system.update(elapsed)
+        else:
+            system.update(elapsed)
+
+    def get_state(self) -> Dict:
+        """Get the scheduling table."""
+        return {
+            name: {
+                "period": system.period,
+                "phase": system.phase,
+                "pending_dt": system.pending_dt,
+                "runs": system.runs
+            }
+            for name, system in self.systems.items()
+        }
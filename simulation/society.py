@@ -871,51 +871,46 @@ class SocietySystem:
         """Update tribe states."""
         for tribe_id, tribe in self.tribes.items():
             # Update population
-            growth_rate = 0.01 * time_delta
-            tribe['population'] *= (1 + growth_rate)
+            tribe['population'] *= (1 + 0.01) ** time_delta
             
             # Update resources
             for resource, amount in tribe['resources'].items():
                 if resource == 'food':
-                    tribe['resources'][resource] *= (1 - 0.05 * time_delta)
+                    tribe['resources'][resource] *= (1 - 0.05) ** time_delta
                 else:
-                    tribe['resources'][resource] *= (1 - 0.02 * time_delta)
+                    tribe['resources'][resource] *= (1 - 0.02) ** time_delta
     
     def _update_religions(self, time_delta: float):
         """Update religion states."""
         for religion_id, religion in self.religions.items():
             # Update follower count
-            conversion_rate = 0.005 * time_delta
-            religion['followers'] *= (1 + conversion_rate)
+            religion['followers'] *= (1 + 0.005) ** time_delta
     
     def _update_languages(self, time_delta: float):
         """Update language states."""
         for language_id, language in self.languages.items():
             # Update vocabulary
             for level, count in language['vocabulary'].items():
-                growth_rate = 0.002 * time_delta
-                language['vocabulary'][level] *= (1 + growth_rate)
+                language['vocabulary'][level] *= (1 + 0.002) ** time_delta
     
     def _update_settlements(self, time_delta: float):
         """Update settlement states."""
         for settlement_id, settlement in self.settlements.items():
             # Update population
-            growth_rate = 0.01 * time_delta
-            settlement['population'] *= (1 + growth_rate)
+            settlement['population'] *= (1 + 0.01) ** time_delta
             
             # Update resources
             for resource, amount in settlement['resources'].items():
                 if resource == 'food':
-                    settlement['resources'][resource] *= (1 - 0.05 * time_delta)
+                    settlement['resources'][resource] *= (1 - 0.05) ** time_delta
                 else:
-                    settlement['resources'][resource] *= (1 - 0.02 * time_delta)
+                    settlement['resources'][resource] *= (1 - 0.02) ** time_delta
     
     def _update_social_groups(self, time_delta: float):
         """Update social group states."""
         for group_id, group in self.social_groups.items():
             # Update membership
-            growth_rate = 0.005 * time_delta
-            group['members'] *= (1 + growth_rate)
+            group['members'] *= (1 + 0.005) ** time_delta
             
             # Update influence
             influence_change = 0.001 * time_delta
@@ -0,0 +1,97 @@
+import math
+from datetime import datetime, time, timedelta
+import numpy as np
+from .grid import RasterGrid
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Days covered by the tables; day 366 of a leap year gets its own column
+DAYS_PER_YEAR = 366
+AXIAL_TILT = 23.44  # degrees
+MARCH_EQUINOX_DAY = 81  # Day of year the declination crosses zero northwards
+SOLAR_CONSTANT = 1361.0  # W/m^2 at the mean Earth-Sun distance
+# Solar altitude at sunrise and sunset, allowing for refraction and the solar disc
+SUNRISE_ALTITUDE = -0.83  # degrees
+
+
+class SolarTables:
+    """Daily solar geometry and climatology per latitude row, built once at startup.
+
+    Row tables are indexed [row, day_of_year - 1] for the latitude rows of ``grid``;
+    day tables are indexed [day_of_year - 1]. Any latitude resolves to its nearest row.
+    """
+
+    def __init__(self, grid: RasterGrid):
+        self.grid = grid
+        latitude = np.radians(grid.latitudes)[:, None]
+        day = np.arange(1, DAYS_PER_YEAR + 1, dtype=np.float64)
+        year_angle = 2 * np.pi * (day - MARCH_EQUINOX_DAY) / 365
+
+        # Per day: solar declination in radians and the equation of time in minutes
+        self.declination = np.radians(AXIAL_TILT) * np.sin(year_angle)
+        self.equation_of_time = 9.87 * np.sin(2 * year_angle) - 7.53 * np.cos(year_angle) - 1.5 * np.sin(year_angle)
+        declination = self.declination[None, :]
+
+        # Hours between sunrise and sunset; poles saturate at 0 or 24
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cos_hour_angle = ((math.sin(math.radians(SUNRISE_ALTITUDE)) - np.sin(latitude) * np.sin(declination)) /
+                              (np.cos(latitude) * np.cos(declination)))
+        cos_hour_angle = np.clip(np.nan_to_num(cos_hour_angle, nan=0.0, posinf=1.0, neginf=-1.0), -1.0, 1.0)
+        self.day_length = (np.arccos(cos_hour_angle) * 24 / np.pi).astype(np.float32)
+
+        # Daily mean top-of-atmosphere insolation in W/m^2
+        sunset_angle = np.arccos(np.clip(-np.tan(latitude) * np.tan(declination), -1.0, 1.0))
+        distance_factor = 1 + 0.033 * np.cos(2 * np.pi * day / 365)
+        self.insolation = (SOLAR_CONSTANT / np.pi * distance_factor *
+                           (sunset_angle * np.sin(latitude) * np.sin(declination) +
+                            np.cos(latitude) * np.cos(declination) * np.sin(sunset_angle))).astype(np.float32)
+
+        # Seasonal factor in [-1, 1]: +1 at the local summer solstice, 0 on the equator
+        self.seasonal_factor = (np.sign(latitude) * declination / np.radians(AXIAL_TILT)).astype(np.float32)
+
+        # Calendar day last resolved by day_of_year
+        self._day_start = self._day_end = datetime.min
+        self._day = 1
+        logger.info(f"Solar tables built for {len(grid.latitudes)} latitude rows")
+
+    def rows(self, latitudes) -> np.ndarray:
+        """Get the table row nearest each latitude, clamped to the grid."""
+        _, rows, _ = self.grid.indices(np.zeros_like(latitudes, dtype=np.float64), latitudes)
+        return rows
+
+    def row(self, latitude: float) -> int:
+        """Scalar :meth:`rows`."""
+        return int(self.rows(latitude))
+
+    def day_of_year(self, when: datetime) -> int:
+        """Get the day of year (1-366) of a datetime, reusing the last result within the same day."""
+        if not self._day_start <= when < self._day_end:
+            self._day_start = datetime.combine(when.date(), time.min, tzinfo=when.tzinfo)
+            self._day_end = self._day_start + timedelta(days=1)
+            self._day = when.timetuple().tm_yday
+        return self._day
+
+    def day_length_at(self, latitude: float, day_of_year: int) -> float:
+        """Get the hours of daylight at a latitude on a day of year."""
+        return float(self.day_length[self.row(latitude), day_of_year - 1])
+
+    def local_solar_time(self, utc_hours, day_of_year, longitudes) -> np.ndarray:
+        """Get the local solar time in hours at longitudes for a UTC hour on a day of year.
+
+        Arguments broadcast, so a column of hours against a row of longitudes gives a table.
+        """
+        correction = self.equation_of_time[np.asarray(day_of_year) - 1] / 60.0
+        return (np.asarray(utc_hours) + np.asarray(longitudes) / 15.0 + correction) % 24.0
+
+    def solar_time_at(self, longitude: float, when: datetime) -> float:
+        """Get the local solar time in hours at a longitude, treating ``when`` as UTC."""
+        utc_hours = when.hour + when.minute / 60.0 + when.second / 3600.0
+        return float(self.local_solar_time(utc_hours, self.day_of_year(when), longitude))
+
+    def daylight(self, when: datetime) -> np.ndarray:
+        """Get a (n_lon, n_lat) mask of the grid cells where the sun is up at ``when``."""
+        day = self.day_of_year(when)
+        utc_hours = when.hour + when.minute / 60.0 + when.second / 3600.0
+        solar_time = self.local_solar_time(utc_hours, day, self.grid.longitudes)
+        return np.abs(solar_time[:, None] - 12.0) < self.day_length[:, day - 1][None, :] / 2
@@ -0,0 +1,136 @@
+import math
+from typing import Dict, Hashable, List, Optional, Sequence, Set, Tuple
+import numpy as np
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = 2 * math.pi * EARTH_RADIUS_KM / 360.0
+HALF_CIRCUMFERENCE_KM = math.pi * EARTH_RADIUS_KM
+
+
+def haversine_km(lon1, lat1, lon2, lat2) -> np.ndarray:
+    """Great-circle distance in km between coordinates in degrees; arguments broadcast."""
+    lon1, lat1, lon2, lat2 = (np.radians(np.asarray(value, dtype=np.float64)) for value in (lon1, lat1, lon2, lat2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def longitude_span(latitude_min: float, latitude_max: float, radius_km: float) -> float:
+    """Degrees of longitude either side of a point that a radius can reach within a latitude band.
+
+    Returns 180 once the band reaches a pole or the radius wraps the whole parallel.
+    """
+    widest = max(abs(latitude_min), abs(latitude_max))
+    if widest >= 90.0:
+        return 180.0
+    return min(180.0, radius_km / (KM_PER_DEGREE * math.cos(math.radians(widest))))
+
+
+class SpatialHash:
+    """Items on a uniform grid of square cells ``cell_km`` on a side at the equator.
+
+    Buckets are keyed by integer (column, row) and hold the items inside them; a
+    move only touches the two buckets involved, and one inside its cell touches
+    none. Longitude wraps round the globe. Queries visit the buckets a circle can
+    reach and measure great-circle distances to the items in them.
+    """
+
+    def __init__(self, cell_km: float = 50.0):
+        self.cell_km = cell_km
+        self.cell_degrees = cell_km / KM_PER_DEGREE
+        self.columns = max(1, int(math.ceil(360.0 / self.cell_degrees)))
+        self.buckets: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self.positions: Dict[Hashable, Tuple[float, float]] = {}
+        self._keys: Dict[Hashable, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.positions
+
+    def key(self, longitude: float, latitude: float) -> Tuple[int, int]:
+        """Bucket holding a coordinate."""
+        column = int(math.floor((longitude + 180.0) / self.cell_degrees)) % self.columns
+        return column, int(math.floor((latitude + 90.0) / self.cell_degrees))
+
+    def move(self, item: Hashable, longitude: float, latitude: float) -> None:
+        """Place an item at a coordinate, inserting it if it is new."""
+        key = self.key(longitude, latitude)
+        old = self._keys.get(item)
+        self.positions[item] = (longitude, latitude)
+        if key != old:
+            if old is not None:
+                self._discard(item, old)
+            self.buckets.setdefault(key, set()).add(item)
+            self._keys[item] = key
+
+    def move_many(self, items: Sequence[Hashable], longitudes: np.ndarray, latitudes: np.ndarray) -> None:
+        """Batch :meth:`move`; only items that changed bucket are rehashed."""
+        columns = np.floor((np.asarray(longitudes) + 180.0) / self.cell_degrees).astype(np.int64) % self.columns
+        rows = np.floor((np.asarray(latitudes) + 90.0) / self.cell_degrees).astype(np.int64)
+        self.positions.update(zip(items, zip(np.asarray(longitudes).tolist(), np.asarray(latitudes).tolist())))
+        for item, key in zip(items, zip(columns.tolist(), rows.tolist())):
+            old = self._keys.get(item)
+            if key != old:
+                if old is not None:
+                    self._discard(item, old)
+                self.buckets.setdefault(key, set()).add(item)
+                self._keys[item] = key
+
+    def remove(self, item: Hashable) -> None:
+        """Drop an item if present."""
+        key = self._keys.pop(item, None)
+        if key is not None:
+            self._discard(item, key)
+            del self.positions[item]
+
+    def query(self, longitude: float, latitude: float, radius_km: float,
+              exclude: Optional[Hashable] = None) -> List[Tuple[Hashable, float]]:
+        """Items within ``radius_km`` of a point with their distances in km, nearest first."""
+        span_lat = radius_km / KM_PER_DEGREE
+        row0 = int(math.floor((latitude - span_lat + 90.0) / self.cell_degrees))
+        row1 = int(math.floor((latitude + span_lat + 90.0) / self.cell_degrees))
+        span_lon = longitude_span(latitude - span_lat, latitude + span_lat, radius_km)
+        if span_lon >= 180.0:
+            columns = range(self.columns)
+        else:
+            column0 = int(math.floor((longitude - span_lon + 180.0) / self.cell_degrees))
+            column1 = int(math.floor((longitude + span_lon + 180.0) / self.cell_degrees))
+            column1 = min(column1, column0 + self.columns - 1)
+            columns = {column % self.columns for column in range(column0, column1 + 1)}
+
+        # Walk whichever is smaller: the cells in range or the occupied buckets
+        if len(columns) * (row1 - row0 + 1) > len(self.buckets):
+            keys = [key for key in self.buckets if row0 <= key[1] <= row1 and key[0] in columns]
+        else:
+            keys = [(column, row) for column in columns for row in range(row0, row1 + 1)
+                    if (column, row) in self.buckets]
+        items = [item for key in keys for item in self.buckets[key] if item != exclude]
+        if not items:
+            return []
+
+        coordinates = np.array([self.positions[item] for item in items])
+        distances = haversine_km(longitude, latitude, coordinates[:, 0], coordinates[:, 1])
+        near = np.flatnonzero(distances <= radius_km)
+        near = near[np.argsort(distances[near], kind='stable')]
+        return [(items[k], float(distances[k])) for k in near]
+
+    def nearest(self, longitude: float, latitude: float, count: int, max_km: float = HALF_CIRCUMFERENCE_KM,
+                exclude: Optional[Hashable] = None) -> List[Tuple[Hashable, float]]:
+        """The ``count`` items nearest a point, searching outwards in widening circles up to ``max_km``."""
+        radius = min(max_km, self.cell_km)
+        while True:
+            found = self.query(longitude, latitude, radius, exclude)
+            if len(found) >= count or radius >= max_km:
+                return found[:count]
+            radius = min(max_km, radius * 4)
+
+    def _discard(self, item: Hashable, key: Tuple[int, int]) -> None:
+        """Take an item out of a bucket, dropping the bucket once empty."""
+        bucket = self.buckets[key]
+        bucket.discard(item)
+        if not bucket:
+            del self.buckets[key]
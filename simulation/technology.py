@@ -392,9 +392,10 @@ class TechnologySystem:
         for tech in self.technologies:
             if self._can_research(tech):
                 self.research_progress[tech] += self.research_rate * time_delta
-                if self.research_progress[tech] >= 1.0:
+                # A long time_delta can complete several levels; carry the remainder
+                while self.research_progress[tech] >= 1.0:
                     self._advance_technology(tech)
-                    self.research_progress[tech] = 0.0
+                    self.research_progress[tech] -= 1.0
 
         # Update overall tech level
         self.tech_level = sum(self.technologies.values()) / len(self.technologies)
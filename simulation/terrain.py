@@ -5,6 +5,7 @@ import math
 import logging
 from datetime import datetime
 import random
+from .grid import RasterGrid
 from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -69,6 +70,70 @@ class TerrainType(Enum):
     BADLANDS = "badlands"
     SALT_FLAT = "salt_flat"
 
+# Terrain types are stored in the grid as uint8 codes indexing this list
+TERRAIN_TYPES = list(TerrainType)
+TERRAIN_CODES = {terrain.value: code for code, terrain in enumerate(TERRAIN_TYPES)}
+
+OCEAN_TERRAIN = {
+    TerrainType.DEEP_OCEAN,
+    TerrainType.CONTINENTAL_SHELF,
+    TerrainType.CONTINENTAL_SLOPE,
+    TerrainType.OCEAN_TRENCH,
+    TerrainType.CORAL_REEF,
+    TerrainType.SEAMOUNT,
+    TerrainType.ABYSSAL_PLAIN
+}
+OCEAN_CODES = np.array([TERRAIN_CODES[t.value] for t in OCEAN_TERRAIN], dtype=np.uint8)
+
+# Per-cell resource layers
+RESOURCE_LAYERS = ('water', 'food', 'wood', 'stone', 'metal')
+
+# Movement cost per locomotion class: terrain multipliers (default 1.0) and cost added per degree of slope
+_WALKING_TERRAIN_COSTS = {
+    TerrainType.MOUNTAIN: 5.0,
+    TerrainType.HILLS: 3.0,
+    TerrainType.FOREST: 2.0,
+    TerrainType.SWAMP: 4.0,
+    TerrainType.RIVER: 3.0,
+    TerrainType.LAKE: 5.0,  # Can't move through lakes
+    TerrainType.GLACIER: 6.0,
+    TerrainType.DESERT: 2.0,
+    TerrainType.GRASSLAND: 1.0,
+    **{terrain: 10.0 for terrain in OCEAN_TERRAIN}  # Can't move through oceans
+}
+LOCOMOTION_CLASSES = {
+    'human': {'terrain': _WALKING_TERRAIN_COSTS, 'slope_weight': 0.1},
+    'herbivore': {'terrain': _WALKING_TERRAIN_COSTS, 'slope_weight': 4.0},
+    'carnivore': {'terrain': _WALKING_TERRAIN_COSTS, 'slope_weight': 4.0}
+}
+
+# On memory-mapped grids the periodic sweeps only visit square tiles of this many cells
+# a side within SWEEP_RADIUS degrees of agents, settlements and refined regions
+SWEEP_TILE_CELLS = 256
+SWEEP_RADIUS = 1.0
+
+# Ocean currents are stored per cell as int8 codes indexing this list (-1 for none)
+OCEAN_CURRENT_NAMES = [
+    "North Equatorial Current",
+    "South Equatorial Current",
+    "Equatorial Counter Current",
+    "Gulf Stream",
+    "Kuroshio Current",
+    "Brazil Current",
+    "Canary Current",
+    "California Current",
+    "Benguela Current",
+    "Antarctic Circumpolar Current",
+    "Coastal Current",
+    "Upwelling Zone",
+    "Ocean Eddy",
+    "Convergence Zone",
+    "Divergence Zone",
+    "Mixing Zone",
+    "Dummy Current"
+]
+OCEAN_CURRENT_CODES = {name: code for code, name in enumerate(OCEAN_CURRENT_NAMES)}
+
 class OceanCurrent:
     def __init__(self, name: str, direction: Tuple[float, float], speed: float, temperature: float):
         self.name = name
@@ -81,38 +146,89 @@ class TerrainSystem:
         """Initialize the terrain system."""
         logger.info("Initializing terrain system...")
         self.world = world
-        self.terrain_data = {}  # (longitude, latitude) -> Dict
-        self.elevation_data = {}  # (longitude, latitude) -> float
-        self.resource_data = {}  # (longitude, latitude) -> Dict
-        self.ocean_currents = {}  # (longitude, latitude) -> OceanCurrent
-        self.tidal_ranges = {}  # (longitude, latitude) -> float
+        self.rng = world.rng.stream('terrain')
+        # Generation draws from its own stream so cached and freshly generated worlds replay the same
+        self.generation_rng = world.rng.stream('worldgen.terrain')
+        # Layers are memory-mapped files under world.raster_dir when the world is finer than 1°
+        self.grid = RasterGrid.from_world(world, world.raster_dir)
+
+        # Dense per-cell layers, indexed [lon_index, lat_index]; the generated ones are
+        # allocated by _allocate_static_layers() or loaded from the worldgen cache
+        self.ocean_mask = self.grid.layer(bool, False, 'ocean_mask')
+        self.land_mask = self.grid.layer(bool, False, 'land_mask')
+        
+        # Rasters derived from elevation; rebuilt lazily after invalidate_movement_rasters()
+        self.slope_map = self.grid.layer(np.float32, name='slope')  # degrees
+        self.aspect_map = self.grid.layer(np.float32, name='aspect')  # compass bearing of downslope, degrees
+        self.movement_cost_maps = {}  # locomotion class -> cost raster
+        self._movement_rasters_dirty = True
+        # Refined tiles around populated areas (lod.TerrainLOD), attached by the world when enabled
+        self.lod = None
         self.seasonal_factors = {}  # (longitude, latitude) -> Dict
-        self.salinity_data = {}  # (longitude, latitude) -> float
-        self.oxygen_data = {}  # (longitude, latitude) -> float
         
         # Initialize soil quality data
-        self.soil_quality_data = {}
+        self.soil_quality_map = self.grid.layer(np.float32, name='soil_quality')
         self.soil_quality = 0.5  # Default soil quality (0-1)
         
         # Initialize nutrient data
-        self.nutrient_data = {}
+        self.nutrient_map = self.grid.layer(np.float32, name='nutrients')
         self.nutrient_level = 0.5  # Default nutrient level (0-1)
         
         # Initialize pollution data
-        self.pollution_data = {}
+        self.pollution_map = self.grid.layer(np.float32, name='pollution')
         self.pollution_level = 0.0  # Default pollution level (0-1)
         
-        # Initialize wind data
-        self.wind_data = {}
+        # Initialize wind data as (x, y) components
+        self.wind_map = self.grid.layer(np.float32, name='wind', channels=2)
         self.wind_speed = 0.0  # Default wind speed
         
         # Initialize erosion and deposition data
-        self.erosion_data = {}
-        self.deposition_data = {}
+        self.erosion_map = self.grid.layer(np.float32, name='erosion')
+        self.deposition_map = self.grid.layer(np.float32, name='deposition')
         self.erosion_rate = 0.0
         self.deposition_rate = 0.0
+        self._mean_elevation = None  # Cached for the erosion sweep; reset when elevation changes
+        # Sweep time so far and when each tile was last swept, on memory-mapped grids
+        self._sweep_clock = 0.0
+        self._swept: Dict[Tuple[int, int], float] = {}
+        
+        # Initialize terrain, reusing the generated layers of a previous boot when cached
+        cache = world.worldgen_cache
+        layers = cache.load('terrain') if cache else None
+        if layers is not None:
+            self._set_static_layers(layers)
+        else:
+            self._generate_static_layers()
+            if cache:
+                cache.save('terrain', self._static_layers())
+        
+        self._initialize_soil_quality()
+        self._initialize_nutrients()
+        self._initialize_pollution()
+        self._initialize_wind()
+        self._initialize_erosion()
+        
+        logger.info("Terrain system initialization complete")
+        
+    def _allocate_static_layers(self):
+        """Allocate the layers written by generation."""
+        self.terrain_type_map = self.grid.layer(np.uint8, TERRAIN_CODES[TerrainType.DEEP_OCEAN.value], 'terrain_type')
+        self.elevation_map = self.grid.layer(np.float32, name='elevation')
+        self.resource_maps = {name: self.grid.layer(np.float32, name=f"resource_{name}") for name in RESOURCE_LAYERS}
+        self.tidal_range_map = self.grid.layer(np.float32, name='tidal_range')
+        self.salinity_map = self.grid.layer(np.float32, name='salinity')
+        self.oxygen_map = self.grid.layer(np.float32, 6.0, 'oxygen')  # Default ocean oxygen level in mg/L
+        
+        # Ocean currents as per-cell layers; kind -1 means no current
+        self.current_kind_map = self.grid.layer(np.int8, -1, 'current_kind')
+        self.current_direction_map = self.grid.layer(np.float32, name='current_direction', channels=2)
+        self.current_speed_map = self.grid.layer(np.float32, name='current_speed')
+        self.current_temperature_map = self.grid.layer(np.float32, name='current_temperature')
+        
+    def _generate_static_layers(self):
+        """Generate the terrain layers that depend only on the world seed."""
+        self._allocate_static_layers()
         
-        # Initialize terrain
         logger.info("Setting up basic terrain...")
         self._initialize_basic_terrain()
         logger.info("Basic terrain initialized")
@@ -129,122 +245,144 @@ class TerrainSystem:
         self._initialize_ocean_systems()
         logger.info("Ocean systems initialized")
         
-        self._initialize_soil_quality()
-        self._initialize_nutrients()
-        self._initialize_pollution()
-        self._initialize_wind()
-        self._initialize_erosion()
-        
-        logger.info("Terrain system initialization complete")
+    def _static_layers(self) -> Dict[str, np.ndarray]:
+        """Get the generated layers by artifact name."""
+        layers = {
+            'terrain_type': self.terrain_type_map,
+            'elevation': self.elevation_map,
+            'tidal_range': self.tidal_range_map,
+            'salinity': self.salinity_map,
+            'oxygen': self.oxygen_map,
+            'current_kind': self.current_kind_map,
+            'current_direction': self.current_direction_map,
+            'current_speed': self.current_speed_map,
+            'current_temperature': self.current_temperature_map
+        }
+        layers.update({f"resource_{name}": layer for name, layer in self.resource_maps.items()})
+        return layers
+        
+    def _set_static_layers(self, layers: Dict[str, np.ndarray]):
+        """Install generated layers loaded from an artifact."""
+        self.terrain_type_map = layers['terrain_type']
+        self.elevation_map = layers['elevation']
+        self.tidal_range_map = layers['tidal_range']
+        self.salinity_map = layers['salinity']
+        self.oxygen_map = layers['oxygen']
+        self.current_kind_map = layers['current_kind']
+        self.current_direction_map = layers['current_direction']
+        self.current_speed_map = layers['current_speed']
+        self.current_temperature_map = layers['current_temperature']
+        self.resource_maps = {name: layers[f"resource_{name}"] for name in RESOURCE_LAYERS}
+        self._update_masks()
+        
+    def _update_masks(self):
+        """Recompute the ocean and land masks from the terrain types."""
+        for rows in self.grid.strips():
+            self.ocean_mask[rows] = np.isin(self.terrain_type_map[rows], OCEAN_CODES)
+            self.land_mask[rows] = ~self.ocean_mask[rows]
+        self.invalidate_movement_rasters()
         
     def _initialize_basic_terrain(self):
         """Initialize basic terrain data."""
         logger.info("Initializing basic terrain...")
+        # Generated a strip of rows at a time so fine grids never hold full-size temporaries
+        for rows in self.grid.strips():
+            self.terrain_type_map[rows] = self._basic_terrain_strip(rows)
         
-        # Calculate total points for progress tracking
-        total_points = len(np.arange(self.world.min_longitude, self.world.max_longitude, self.world.longitude_resolution)) * \
-                      len(np.arange(self.world.min_latitude, self.world.max_latitude, self.world.latitude_resolution))
-        points_processed = 0
-        last_progress = 0
-        
-        for lon in np.arange(self.world.min_longitude, self.world.max_longitude, self.world.longitude_resolution):
-            for lat in np.arange(self.world.min_latitude, self.world.max_latitude, self.world.latitude_resolution):
-                terrain_type = self._generate_terrain_type(lon, lat)
-                self.terrain_data[(lon, lat)] = {
-                    "type": terrain_type,
-                    "elevation": self._generate_elevation(lon, lat),
-                    "resources": self._generate_resources(lon, lat)
-                }
-                points_processed += 1
-                
-                # Log progress every 10%
-                progress = (points_processed / total_points) * 100
-                if progress - last_progress >= 10:
-                    logger.info(f"Basic terrain initialization progress: {progress:.1f}%")
-                    last_progress = progress
-                
+        self._update_masks()
         logger.info("Basic terrain initialization complete")
         
-    def _initialize_elevation(self):
-        """Initialize elevation data using vectorized operations."""
-        logger.info("Initializing elevation data...")
-        
-        # Create coordinate grids
-        lons = np.arange(self.world.min_longitude, self.world.max_longitude, self.world.longitude_resolution)
-        lats = np.arange(self.world.min_latitude, self.world.max_latitude, self.world.latitude_resolution)
+    def _basic_terrain_strip(self, rows: slice) -> np.ndarray:
+        """Generate the terrain codes for a strip of rows."""
+        lons, lats = self.grid.mesh(rows)
+        shape = lons.shape
         
-        # Calculate total points for progress tracking
-        total_points = len(lons) * len(lats)
-        points_processed = 0
-        last_progress = 0
-        
-        # Process in chunks to show progress
-        chunk_size = 1000  # Process 1000 points at a time
+        # First determine if this is ocean or land based on a simple pattern
+        # Use a combination of sine waves to create realistic continent shapes
+        ocean_factor = (
+            np.sin(lons * 0.1) * 0.3 +  # East-west variation
+            np.sin(lats * 0.1) * 0.3 +  # North-south variation
+            np.sin((lons + lats) * 0.05) * 0.2  # Diagonal variation
+        )
         
-        for i in range(0, len(lons), chunk_size):
-            lon_chunk = lons[i:i + chunk_size]
-            for j in range(0, len(lats), chunk_size):
-                lat_chunk = lats[j:j + chunk_size]
-                
-                # Create meshgrid for vectorized operations
-                lon_grid, lat_grid = np.meshgrid(lon_chunk, lat_chunk)
-                
-                # Vectorized elevation generation
-                elevations = np.vectorize(self._generate_elevation)(lon_grid, lat_grid)
-                
-                # Store results
-                for idx_lon, lon in enumerate(lon_chunk):
-                    for idx_lat, lat in enumerate(lat_chunk):
-                        self.elevation_data[(lon, lat)] = elevations[idx_lat, idx_lon]
-                        points_processed += 1
-                
-                # Log progress every 10%
-                progress = (points_processed / total_points) * 100
-                if progress - last_progress >= 10:
-                    logger.info(f"Elevation initialization progress: {progress:.1f}%")
-                    last_progress = progress
+        # Add some randomness
+        ocean_factor += self.generation_rng.uniform(-0.1, 0.1, shape)
+        ocean = ocean_factor > 0
+        
+        # One independent draw per step of each rule cascade
+        first = self.generation_rng.random(shape)
+        second = self.generation_rng.random(shape)
+        third = self.generation_rng.random(shape)
+        polar = np.abs(lats) > 60
+        temperate = ~polar & (np.abs(lats) > 30)
+        tropical = ~polar & ~temperate
+        
+        # The first matching rule wins; land that matches nothing is savanna
+        rules = [
+            # Ocean types by latitude band
+            (ocean & polar, TerrainType.CONTINENTAL_SHELF),
+            (ocean & temperate & (first < 0.3), TerrainType.CONTINENTAL_SHELF),
+            (ocean & temperate & (second < 0.5), TerrainType.CONTINENTAL_SLOPE),
+            (ocean & temperate, TerrainType.DEEP_OCEAN),
+            (ocean & tropical & (first < 0.2), TerrainType.CORAL_REEF),
+            (ocean & tropical & (second < 0.4), TerrainType.CONTINENTAL_SHELF),
+            (ocean & tropical & (third < 0.6), TerrainType.CONTINENTAL_SLOPE),
+            (ocean, TerrainType.DEEP_OCEAN),
+            # Land types by latitude band
+            (polar, TerrainType.TUNDRA),
+            (temperate & (first < 0.3), TerrainType.FOREST),
+            (temperate & (second < 0.5), TerrainType.GRASSLAND),
+            (temperate, TerrainType.HILLS),
+            (first < 0.4, TerrainType.DESERT),
+            (second < 0.6, TerrainType.TROPICAL_RAINFOREST)
+        ]
+        return np.select(
+            [condition for condition, _ in rules],
+            [TERRAIN_CODES[terrain.value] for _, terrain in rules],
+            TERRAIN_CODES[TerrainType.SAVANNA.value]
+        ).astype(np.uint8)
         
+    def _initialize_elevation(self):
+        """Initialize elevation data from the terrain types."""
+        logger.info("Initializing elevation data...")
+        for rows in self.grid.strips():
+            land = self.land_mask[rows]
+            shape = land.shape
+            mountain = self.terrain_type_map[rows] == TERRAIN_CODES[TerrainType.MOUNTAIN.value]
+            self.elevation_map[rows] = np.select(
+                [mountain, land],
+                [self.generation_rng.uniform(1000, 5000, shape), self.generation_rng.uniform(0, 1000, shape)],
+                self.generation_rng.uniform(-1000, 0, shape)  # Below sea level
+            )
+        self.invalidate_movement_rasters()
         logger.info("Elevation initialization complete")
         
     def _initialize_resources(self):
-        """Initialize resource data using vectorized operations."""
+        """Initialize resource data from the terrain types."""
         logger.info("Initializing resource data...")
-        
-        # Create coordinate grids
-        lons = np.arange(self.world.min_longitude, self.world.max_longitude, self.world.longitude_resolution)
-        lats = np.arange(self.world.min_latitude, self.world.max_latitude, self.world.latitude_resolution)
-        
-        # Calculate total points for progress tracking
-        total_points = len(lons) * len(lats)
-        points_processed = 0
-        last_progress = 0
-        
-        # Process in chunks to show progress
-        chunk_size = 1000  # Process 1000 points at a time
-        
-        for i in range(0, len(lons), chunk_size):
-            lon_chunk = lons[i:i + chunk_size]
-            for j in range(0, len(lats), chunk_size):
-                lat_chunk = lats[j:j + chunk_size]
-                
-                # Create meshgrid for vectorized operations
-                lon_grid, lat_grid = np.meshgrid(lon_chunk, lat_chunk)
-                
-                # Vectorized resource generation
-                resources = np.vectorize(self._generate_resources)(lon_grid, lat_grid)
-                
-                # Store results
-                for idx_lon, lon in enumerate(lon_chunk):
-                    for idx_lat, lat in enumerate(lat_chunk):
-                        self.resource_data[(lon, lat)] = resources[idx_lat, idx_lon]
-                        points_processed += 1
-                
-                # Log progress every 10%
-                progress = (points_processed / total_points) * 100
-                if progress - last_progress >= 10:
-                    logger.info(f"Resource initialization progress: {progress:.1f}%")
-                    last_progress = progress
-        
+        uniform = self.generation_rng.uniform
+        for rows in self.grid.strips():
+            ocean = self.ocean_mask[rows]
+            land = self.land_mask[rows]
+            terrain = self.terrain_type_map[rows]
+            shape = terrain.shape
+            is_type = lambda terrain_type: land & (terrain == TERRAIN_CODES[terrain_type.value])
+            forest = is_type(TerrainType.FOREST)
+            mountain = is_type(TerrainType.MOUNTAIN)
+            grassland = is_type(TerrainType.GRASSLAND)
+            desert = is_type(TerrainType.DESERT)
+            
+            # Each layer is drawn for every cell and kept where its terrain rule applies
+            strip = {
+                'water': np.select([ocean, grassland], [1.0, uniform(0.3, 0.7, shape)], 0.0),
+                'food': np.select([ocean, forest, grassland],
+                                  [uniform(0.3, 0.7, shape), uniform(0.4, 0.8, shape), uniform(0.5, 0.9, shape)], 0.0),
+                'wood': np.where(forest, uniform(0.6, 1.0, shape), 0.0),
+                'stone': np.select([mountain, desert], [uniform(0.7, 1.0, shape), uniform(0.3, 0.7, shape)], 0.0),
+                'metal': np.select([mountain, desert], [uniform(0.5, 0.9, shape), uniform(0.2, 0.6, shape)], 0.0)
+            }
+            for name, layer in strip.items():
+                self.resource_maps[name][rows] = layer
         logger.info("Resource initialization complete")
         
     def _initialize_ocean_systems(self):
@@ -272,22 +410,36 @@ class TerrainSystem:
         logger.info("Oxygen levels initialized")
 
         # Ensure required data exists
-        if not self.ocean_currents:
-            self.ocean_currents[(0, 0)] = OceanCurrent(
-                name="Dummy Current", direction=(0.0, 0.0), speed=0.0, temperature=0.0
-            )
-        if not self.tidal_ranges:
-            self.tidal_ranges[(0, 0)] = 1.0
-        if not self.salinity_data:
-            self.salinity_data[(0, 0)] = 35.0
-        if not self.oxygen_data:
-            self.oxygen_data[(0, 0)] = 6.0
+        if not (self.current_kind_map >= 0).any():
+            cell = self.grid.index(0, 0)
+            self._paint_current(cell, "Dummy Current", (0.0, 0.0), 0.0, 0.0)
         
         logger.info("Ocean systems initialization complete")
         
+    def _paint_current(self, cells, name: str, direction: Tuple[float, float], speed: float, temperature):
+        """Assign a current to the selected cells; later currents override earlier ones.
+
+        ``cells`` is a boolean mask or index into the grid and ``temperature`` a
+        scalar or a function of latitude evaluated at those cells.
+        """
+        self.current_kind_map[cells] = OCEAN_CURRENT_CODES[name]
+        self.current_direction_map[cells] = direction
+        self.current_speed_map[cells] = speed
+        if callable(temperature):
+            temperature = temperature(np.broadcast_to(self.grid.latitudes, self.grid.shape)[cells])
+        self.current_temperature_map[cells] = temperature
+        
+    def _band(self, lon_range: Tuple[float, float], lat_range: Tuple[float, float]) -> Tuple[slice, slice]:
+        """Index of cells with lon_range[0] <= lon < lon_range[1] and likewise for latitude."""
+        return self.grid.band(lon_range, lat_range)
+        
     def _initialize_currents(self):
         """Initialize ocean currents."""
         logger.info("Initializing ocean currents...")
+        self.current_kind_map.fill(-1)
+        self.current_direction_map.fill(0.0)
+        self.current_speed_map.fill(0.0)
+        self.current_temperature_map.fill(0.0)
         
         # Initialize major ocean currents
         logger.info("Setting up major ocean currents...")
@@ -335,111 +487,49 @@ class TerrainSystem:
     def _initialize_equatorial_currents(self):
         """Initialize equatorial ocean currents."""
         logger.info("Initializing equatorial currents...")
+        everywhere = (-180, 180)
         
-        # North and South Equatorial Currents
-        for lon in range(-180, 180):
-            # North Equatorial Current (0-15°N)
-            for lat in range(0, 15):
-                self.ocean_currents[(lon, lat)] = OceanCurrent(
-                    name="North Equatorial Current",
-                    direction=(-1.0, 0.0),  # Westward flow
-                    speed=0.5,  # m/s
-                    temperature=28.0
-                )
-            
-            # South Equatorial Current (0-15°S)
-            for lat in range(-15, 0):
-                self.ocean_currents[(lon, lat)] = OceanCurrent(
-                    name="South Equatorial Current",
-                    direction=(-1.0, 0.0),  # Westward flow
-                    speed=0.5,
-                    temperature=28.0
-                )
-            
-            # Equatorial Counter Current (5°N-5°S)
-            for lat in range(-5, 5):
-                self.ocean_currents[(lon, lat)] = OceanCurrent(
-                    name="Equatorial Counter Current",
-                    direction=(1.0, 0.0),  # Eastward flow
-                    speed=0.3,
-                    temperature=29.0
-                )
+        # North Equatorial Current (0-15°N), westward flow
+        self._paint_current(self._band(everywhere, (0, 15)), "North Equatorial Current", (-1.0, 0.0), 0.5, 28.0)
+        
+        # South Equatorial Current (0-15°S), westward flow
+        self._paint_current(self._band(everywhere, (-15, 0)), "South Equatorial Current", (-1.0, 0.0), 0.5, 28.0)
+        
+        # Equatorial Counter Current (5°N-5°S), eastward flow
+        self._paint_current(self._band(everywhere, (-5, 5)), "Equatorial Counter Current", (1.0, 0.0), 0.3, 29.0)
 
     def _initialize_western_boundary_currents(self):
         """Initialize western boundary currents."""
         logger.info("Initializing western boundary currents...")
         
-        # Gulf Stream (North Atlantic)
-        for lat in range(25, 45):
-            self.ocean_currents[(-80, lat)] = OceanCurrent(
-                name="Gulf Stream",
-                direction=(0.0, 1.0),  # Northward flow
-                speed=1.0,
-                temperature=25.0
-            )
+        # Gulf Stream (North Atlantic), northward flow
+        self._paint_current(self._band((-80, -79), (25, 45)), "Gulf Stream", (0.0, 1.0), 1.0, 25.0)
         
-        # Kuroshio Current (North Pacific)
-        for lat in range(25, 45):
-            self.ocean_currents[(140, lat)] = OceanCurrent(
-                name="Kuroshio Current",
-                direction=(0.0, 1.0),  # Northward flow
-                speed=1.0,
-                temperature=25.0
-            )
+        # Kuroshio Current (North Pacific), northward flow
+        self._paint_current(self._band((140, 141), (25, 45)), "Kuroshio Current", (0.0, 1.0), 1.0, 25.0)
         
-        # Brazil Current (South Atlantic)
-        for lat in range(-45, -25):
-            self.ocean_currents[(-50, lat)] = OceanCurrent(
-                name="Brazil Current",
-                direction=(0.0, -1.0),  # Southward flow
-                speed=0.8,
-                temperature=22.0
-            )
+        # Brazil Current (South Atlantic), southward flow
+        self._paint_current(self._band((-50, -49), (-45, -25)), "Brazil Current", (0.0, -1.0), 0.8, 22.0)
 
     def _initialize_eastern_boundary_currents(self):
         """Initialize eastern boundary currents."""
         logger.info("Initializing eastern boundary currents...")
         
-        # Canary Current (North Atlantic)
-        for lat in range(25, 45):
-            self.ocean_currents[(-15, lat)] = OceanCurrent(
-                name="Canary Current",
-                direction=(0.0, -1.0),  # Southward flow
-                speed=0.3,
-                temperature=20.0
-            )
+        # Canary Current (North Atlantic), southward flow
+        self._paint_current(self._band((-15, -14), (25, 45)), "Canary Current", (0.0, -1.0), 0.3, 20.0)
         
-        # California Current (North Pacific)
-        for lat in range(25, 45):
-            self.ocean_currents[(-125, lat)] = OceanCurrent(
-                name="California Current",
-                direction=(0.0, -1.0),  # Southward flow
-                speed=0.3,
-                temperature=18.0
-            )
+        # California Current (North Pacific), southward flow
+        self._paint_current(self._band((-125, -124), (25, 45)), "California Current", (0.0, -1.0), 0.3, 18.0)
         
-        # Benguela Current (South Atlantic)
-        for lat in range(-35, -15):
-            self.ocean_currents[(15, lat)] = OceanCurrent(
-                name="Benguela Current",
-                direction=(0.0, 1.0),  # Northward flow
-                speed=0.3,
-                temperature=18.0
-            )
+        # Benguela Current (South Atlantic), northward flow
+        self._paint_current(self._band((15, 16), (-35, -15)), "Benguela Current", (0.0, 1.0), 0.3, 18.0)
 
     def _initialize_circumpolar_currents(self):
         """Initialize circumpolar currents."""
         logger.info("Initializing circumpolar currents...")
         
-        # Antarctic Circumpolar Current
-        for lon in range(-180, 180):
-            for lat in range(-65, -55):
-                self.ocean_currents[(lon, lat)] = OceanCurrent(
-                    name="Antarctic Circumpolar Current",
-                    direction=(1.0, 0.0),  # Eastward flow
-                    speed=0.8,
-                    temperature=2.0
-                )
+        # Antarctic Circumpolar Current, eastward flow
+        self._paint_current(self._band((-180, 180), (-65, -55)), "Antarctic Circumpolar Current", (1.0, 0.0), 0.8, 2.0)
 
     def _initialize_local_currents(self):
         """Initialize local ocean currents."""
@@ -467,17 +557,9 @@ class TerrainSystem:
         logger.info("Initializing coastal currents...")
         
         # Initialize coastal currents based on wind patterns and coastal geometry
-        for lon in range(-180, 180):
-            for lat in range(-90, 90):
-                if self._is_coastal((lon, lat)):
-                    # Determine current direction based on coastal orientation
-                    direction = self._get_coastal_direction((lon, lat))
-                    self.ocean_currents[(lon, lat)] = OceanCurrent(
-                        name="Coastal Current",
-                        direction=direction,
-                        speed=0.2,
-                        temperature=self._get_coastal_temperature(lat)
-                    )
+        for rows in self.grid.strips():
+            self._paint_current(self._strip_cells(self._coastal_mask(rows), rows), "Coastal Current",
+                                self._get_coastal_direction(None), 0.2, self._get_coastal_temperature)
 
     def _initialize_upwelling_zones(self):
         """Initialize upwelling zones."""
@@ -496,34 +578,27 @@ class TerrainSystem:
         ]
         
         for zone in upwelling_zones:
-            for lon in range(zone['lon_range'][0], zone['lon_range'][1]):
-                for lat in range(zone['lat_range'][0], zone['lat_range'][1]):
-                    self.ocean_currents[(lon, lat)] = OceanCurrent(
-                        name="Upwelling Zone",
-                        direction=(0.0, 1.0),  # Upward flow
-                        speed=0.1,
-                        temperature=15.0
-                    )
+            # Upward flow
+            self._paint_current(self._band(zone['lon_range'], zone['lat_range']), "Upwelling Zone", (0.0, 1.0), 0.1, 15.0)
 
     def _initialize_eddies(self):
         """Initialize ocean eddies."""
         logger.info("Initializing ocean eddies...")
         
         # Generate random eddies in major current systems
-        for _ in range(50):  # Create 50 random eddies
-            # Random position near major currents
-            lon = random.randint(-170, 170)
-            lat = random.randint(-80, 80)
-            
+        count = 50
+        lons = self.generation_rng.integers(-170, 171, count)
+        lats = self.generation_rng.integers(-80, 81, count)
+        directions = [(0.7, 0.7), (-0.7, 0.7), (0.7, -0.7), (-0.7, -0.7)]
+        direction_choices = self.generation_rng.integers(0, len(directions), count)
+        speeds = self.generation_rng.uniform(0.3, 0.8, count)
+        
+        for lon, lat, choice, speed in zip(lons, lats, direction_choices, speeds):
             # Only create eddies in ocean areas
-            if self._is_ocean(lon, lat):
-                direction = random.choice([(0.7, 0.7), (-0.7, 0.7), (0.7, -0.7), (-0.7, -0.7)])
-                self.ocean_currents[(lon, lat)] = OceanCurrent(
-                    name="Ocean Eddy",
-                    direction=direction,
-                    speed=random.uniform(0.3, 0.8),
-                    temperature=self._get_eddy_temperature(lat)
-                )
+            cell = self.grid.index(lon, lat)
+            if cell is not None and self.ocean_mask[cell]:
+                self._paint_current(cell, "Ocean Eddy", directions[choice], float(speed),
+                                    self._get_eddy_temperature(float(lat)))
 
     def _initialize_current_interactions(self):
         """Initialize interactions between ocean currents."""
@@ -561,14 +636,9 @@ class TerrainSystem:
         ]
         
         for zone in convergence_zones:
-            for lon in range(zone['lon_range'][0], zone['lon_range'][1]):
-                for lat in range(zone['lat_range'][0], zone['lat_range'][1]):
-                    self.ocean_currents[(lon, lat)] = OceanCurrent(
-                        name="Convergence Zone",
-                        direction=(0.0, 0.0),  # Converging flow
-                        speed=0.2,
-                        temperature=self._get_convergence_temperature(lat)
-                    )
+            # Converging flow
+            self._paint_current(self._band(zone['lon_range'], zone['lat_range']), "Convergence Zone", (0.0, 0.0), 0.2,
+                                self._get_convergence_temperature)
 
     def _initialize_divergence_zones(self):
         """Initialize ocean current divergence zones."""
@@ -584,123 +654,19 @@ class TerrainSystem:
         ]
         
         for zone in divergence_zones:
-            for lon in range(zone['lon_range'][0], zone['lon_range'][1]):
-                for lat in range(zone['lat_range'][0], zone['lat_range'][1]):
-                    self.ocean_currents[(lon, lat)] = OceanCurrent(
-                        name="Divergence Zone",
-                        direction=(0.0, 0.0),  # Diverging flow
-                        speed=0.1,
-                        temperature=self._get_divergence_temperature(lat)
-                    )
+            # Diverging flow
+            self._paint_current(self._band(zone['lon_range'], zone['lat_range']), "Divergence Zone", (0.0, 0.0), 0.1,
+                                self._get_divergence_temperature)
 
     def _initialize_mixing_zones(self):
         """Initialize ocean current mixing zones."""
         logger.info("Initializing mixing zones...")
         
-        # Initialize mixing zones where major currents meet
-        for lon in range(-180, 180):
-            for lat in range(-90, 90):
-                if self._is_mixing_zone((lon, lat)):
-                    self.ocean_currents[(lon, lat)] = OceanCurrent(
-                        name="Mixing Zone",
-                        direction=(0.0, 0.0),  # Turbulent flow
-                        speed=0.3,
-                        temperature=self._get_mixing_temperature(lat)
-                    )
-
-    def _generate_terrain_type(self, lon: float, lat: float) -> str:
-        """Generate terrain type based on coordinates."""
-        # First determine if this is ocean or land based on a simple pattern
-        # Use a combination of sine waves to create realistic continent shapes
-        ocean_factor = (
-            math.sin(lon * 0.1) * 0.3 +  # East-west variation
-            math.sin(lat * 0.1) * 0.3 +  # North-south variation
-            math.sin((lon + lat) * 0.05) * 0.2  # Diagonal variation
-        )
-        
-        # Add some randomness
-        ocean_factor += random.uniform(-0.1, 0.1)
-        
-        # If ocean_factor is positive, this is ocean
-        if ocean_factor > 0:
-            # Determine ocean type based on latitude and longitude
-            if abs(lat) > 60:  # Polar regions
-                return TerrainType.CONTINENTAL_SHELF.value
-            elif abs(lat) > 30:  # Temperate regions
-                if random.random() < 0.3:
-                    return TerrainType.CONTINENTAL_SHELF.value
-                elif random.random() < 0.5:
-                    return TerrainType.CONTINENTAL_SLOPE.value
-                else:
-                    return TerrainType.DEEP_OCEAN.value
-            else:  # Tropical regions
-                if random.random() < 0.2:
-                    return TerrainType.CORAL_REEF.value
-                elif random.random() < 0.4:
-                    return TerrainType.CONTINENTAL_SHELF.value
-                elif random.random() < 0.6:
-                    return TerrainType.CONTINENTAL_SLOPE.value
-                else:
-                    return TerrainType.DEEP_OCEAN.value
-        
-        # If not ocean, determine land type
-        if abs(lat) > 60:  # Polar regions
-            return TerrainType.TUNDRA.value
-        elif abs(lat) > 30:  # Temperate regions
-            if random.random() < 0.3:
-                return TerrainType.FOREST.value
-            elif random.random() < 0.5:
-                return TerrainType.GRASSLAND.value
-            else:
-                return TerrainType.HILLS.value
-        else:  # Tropical regions
-            if random.random() < 0.4:
-                return TerrainType.DESERT.value
-            elif random.random() < 0.6:
-                return TerrainType.TROPICAL_RAINFOREST.value
-            else:
-                return TerrainType.SAVANNA.value
-    
-    def _generate_elevation(self, lon: float, lat: float) -> float:
-        """Generate elevation for a coordinate."""
-        # Base elevation on terrain type
-        terrain = self.terrain_data.get((lon, lat), 'land')
-        if terrain == 'mountain':
-            return random.uniform(1000, 5000)
-        elif terrain == 'land':
-            return random.uniform(0, 1000)
-        else:
-            return random.uniform(-1000, 0)  # Below sea level
-    
-    def _generate_resources(self, lon: float, lat: float) -> Dict:
-        """Generate resources for a coordinate based on terrain type."""
-        resources = {
-            'water': 0.0,
-            'food': 0.0,
-            'wood': 0.0,
-            'stone': 0.0,
-            'metal': 0.0
-        }
-        
-        terrain_type = self.terrain_data.get((lon, lat), 'land')
-        if terrain_type == 'water':
-            resources['water'] = 1.0
-            resources['food'] = random.uniform(0.3, 0.7)
-        elif terrain_type == 'forest':
-            resources['wood'] = random.uniform(0.6, 1.0)
-            resources['food'] = random.uniform(0.4, 0.8)
-        elif terrain_type == 'mountain':
-            resources['stone'] = random.uniform(0.7, 1.0)
-            resources['metal'] = random.uniform(0.5, 0.9)
-        elif terrain_type == 'grassland':
-            resources['food'] = random.uniform(0.5, 0.9)
-            resources['water'] = random.uniform(0.3, 0.7)
-        elif terrain_type == 'desert':
-            resources['stone'] = random.uniform(0.3, 0.7)
-            resources['metal'] = random.uniform(0.2, 0.6)
-        
-        return resources
-    
+        # Initialize mixing zones where major currents meet; every strip is found before any is painted
+        cells = [self._strip_cells(self._mixing_zone_mask(rows), rows) for rows in self.grid.strips()]
+        for strip_cells in cells:
+            self._paint_current(strip_cells, "Mixing Zone", (0.0, 0.0), 0.3, self._get_mixing_temperature)
+
     def _initialize_current(self, current_data: Dict):
         """Initialize an ocean current."""
         start_lon, start_lat = current_data["start"]
@@ -712,48 +678,45 @@ class TerrainSystem:
         length = math.sqrt(dx*dx + dy*dy)
         direction = (dx/length, dy/length)
         
-        # Create current object
-        current = OceanCurrent(
-            name=current_data["name"],
-            direction=direction,
-            speed=current_data["speed"],
-            temperature=current_data["temp"]
-        )
-        
-        # Add current to grid points
-        for lon in np.arange(start_lon, end_lon, self.world.longitude_resolution):
-            for lat in np.arange(start_lat, end_lat, self.world.latitude_resolution):
-                if self._is_in_range(lon, lat, (start_lon, start_lat), length):
-                    self.ocean_currents[(lon, lat)] = current
+        # Add current to grid points within range of the start
+        band = self._band((start_lon, end_lon), (start_lat, end_lat))
+        lons, lats = np.meshgrid(self.grid.longitudes[band[0]], self.grid.latitudes[band[1]], indexing='ij')
+        in_range = np.zeros(self.grid.shape, dtype=bool)
+        in_range[band] = self._is_in_range(lons, lats, (start_lon, start_lat), length)
+        self._paint_current(in_range, current_data["name"], direction, current_data["speed"], current_data["temp"])
                     
     def _initialize_tides(self):
         """Initialize tidal data."""
         # Simplified tidal model
-        for lon in np.arange(self.world.min_longitude, self.world.max_longitude, self.world.longitude_resolution):
-            for lat in np.arange(self.world.min_latitude, self.world.max_latitude, self.world.latitude_resolution):
-                if self._is_ocean(lon, lat):
-                    # Base tidal range
-                    base_range = 2.0  # meters
-                    
-                    # Add variation based on location
-                    if abs(lon) < 20:  # Atlantic coast
-                        base_range *= 1.5
-                    elif 100 < lon < 140:  # Pacific coast
-                        base_range *= 1.2
-                        
-                    self.tidal_ranges[(lon, lat)] = base_range
+        for rows in self.grid.strips():
+            lons, _ = self.grid.mesh(rows)
+            
+            # Base tidal range in meters, with variation based on location
+            base_range = np.select(
+                [np.abs(lons) < 20, (lons > 100) & (lons < 140)],  # Atlantic and Pacific coasts
+                [2.0 * 1.5, 2.0 * 1.2],
+                2.0
+            )
+            self.tidal_range_map[rows] = np.where(self.ocean_mask[rows], base_range, 0.0)
                     
     def get_current_at(self, longitude: float, latitude: float) -> Optional[OceanCurrent]:
         """Get ocean current at given coordinates."""
-        lon_grid = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_grid = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
-        return self.ocean_currents.get((lon_grid, lat_grid))
+        cell = self.grid.index(longitude, latitude)
+        if cell is None or self.current_kind_map[cell] < 0:
+            return None
+        return OceanCurrent(
+            name=OCEAN_CURRENT_NAMES[self.current_kind_map[cell]],
+            direction=tuple(float(component) for component in self.current_direction_map[cell]),
+            speed=float(self.current_speed_map[cell]),
+            temperature=float(self.current_temperature_map[cell])
+        )
         
     def get_tidal_range_at(self, longitude: float, latitude: float) -> float:
         """Get tidal range at given coordinates."""
-        lon_grid = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_grid = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
-        return self.tidal_ranges.get((lon_grid, lat_grid), 0.0)
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
+            return 0.0
+        return float(self.tidal_range_map[cell])
         
     def get_seasonal_factors_at(self, longitude: float, latitude: float) -> Dict[str, float]:
         """Get seasonal factors at given coordinates."""
@@ -767,156 +730,256 @@ class TerrainSystem:
         
     def get_terrain_at(self, longitude: float, latitude: float) -> str:
         """Get terrain type at given coordinates."""
-        # Round to nearest grid point
-        lon_rounded = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_rounded = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
-        
-        # Get terrain data, default to deep ocean if not found
-        terrain = self.terrain_data.get((lon_rounded, lat_rounded), {'type': TerrainType.DEEP_OCEAN.value})
-        
-        # Return the terrain type
-        return terrain['type']
+        return self.get_terrain_type_at(longitude, latitude).value
 
     def get_terrain_type_at(self, longitude: float, latitude: float) -> TerrainType:
         """Get :class:`TerrainType` at given coordinates."""
-        terrain_str = self.get_terrain_at(longitude, latitude)
-        try:
-            return TerrainType(terrain_str)
-        except ValueError:
+        refined = self._refined('terrain_type', longitude, latitude)
+        if refined is not None:
+            return TERRAIN_TYPES[refined]
+        cell = self.grid.index(longitude, latitude)
+        
+        # Default to deep ocean outside the grid
+        if cell is None:
             return TerrainType.DEEP_OCEAN
+        return TERRAIN_TYPES[self.terrain_type_map[cell]]
         
     def get_terrain_info_at(self, longitude: float, latitude: float) -> Dict:
         """Get complete terrain information at specific coordinates."""
-        # Round coordinates to nearest grid point
-        lon_rounded = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_rounded = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
+        cell = self.grid.index(longitude, latitude)
         
-        # Get terrain data with defaults
-        terrain = self.terrain_data.get((lon_rounded, lat_rounded), {'type': 'water'})
-        elevation = self.elevation_data.get((lon_rounded, lat_rounded), 0.0)
-        resources = self.resource_data.get((lon_rounded, lat_rounded), {})
+        # Outside the grid is treated as open water
+        if cell is None:
+            return {'type': 'water', 'elevation': 0.0, 'resources': {}, 'is_water': True}
         
+        # Type and elevation through their getters, so refined LOD tiles take precedence
+        terrain_type = self.get_terrain_type_at(longitude, latitude).value
         return {
-            'type': terrain['type'],
-            'elevation': elevation,
-            'resources': resources,
-            'is_water': terrain['type'] == 'water'
+            'type': terrain_type,
+            'elevation': float(self.get_elevation_at(longitude, latitude)),
+            'resources': {name: float(layer[cell]) for name, layer in self.resource_maps.items()},
+            'is_water': terrain_type == 'water'
         }
         
     def get_elevation_at(self, longitude: float, latitude: float) -> float:
         """Get elevation at given coordinates in meters."""
-        lon_grid = round(longitude / self.world.longitude_resolution) * self.world.longitude_resolution
-        lat_grid = round(latitude / self.world.latitude_resolution) * self.world.latitude_resolution
-        return self.elevation_data.get((lon_grid, lat_grid), 0.0)
+        refined = self._refined('elevation', longitude, latitude)
+        if refined is not None:
+            return refined
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
+            return 0.0
+        return float(self.elevation_map[cell])
+        
+    def _refined(self, field: str, longitude: float, latitude: float):
+        """Read a field from the refined LOD tiles, or None where the base grid applies."""
+        if self.lod is None:
+            return None
+        return self.lod.value_at(field, longitude, latitude)
+        
+    def invalidate_movement_rasters(self):
+        """Mark slope, aspect and movement-cost rasters stale after elevation changes."""
+        self._movement_rasters_dirty = True
+        self._mean_elevation = None
+
+    def _ensure_movement_rasters(self):
+        """Rebuild the derived rasters if elevation or terrain changed."""
+        if self._movement_rasters_dirty:
+            self._compute_slope_and_aspect()
+            self._compute_movement_costs()
+            self._movement_rasters_dirty = False
+
+    def _compute_slope_and_aspect(self):
+        """Compute slope (max drop to the 8 neighbours) and aspect from elevation."""
+        n_lon, n_lat = self.grid.shape
+        # Horizontal distance in km per longitude step, as returned by World.get_tile_size
+        lon_km = 111.32 * np.cos(np.radians(self.grid.latitudes))
+        lon_step_km = lon_km * self.grid.longitude_resolution
+        lon_step_m = np.maximum(lon_km * 1000.0 * self.grid.longitude_resolution, 1.0)
+        lat_step_m = 111320.0 * self.grid.latitude_resolution
+        
+        for rows in self.grid.strips():
+            # The strip plus a one-row halo of real neighbours on each side
+            start, stop = max(rows.start - 1, 0), min(rows.stop + 1, n_lon)
+            block = self.elevation_map[start:stop].astype(np.float64)
+            inner = slice(rows.start - start, rows.stop - start)
+            elevation = block[inner]
+            
+            # Cells outside the grid count as elevation 0, as in point lookups
+            padded = np.pad(block, ((int(rows.start == 0), int(rows.stop == n_lon)), (1, 1)),
+                            mode='constant', constant_values=0.0)
+            n_rows = rows.stop - rows.start
+            max_drop = np.zeros_like(elevation)
+            for dlon in (-1, 0, 1):
+                for dlat in (-1, 0, 1):
+                    if dlon == 0 and dlat == 0:
+                        continue
+                    neighbour = padded[1 + dlon:1 + dlon + n_rows, 1 + dlat:1 + dlat + n_lat]
+                    np.maximum(max_drop, np.abs(neighbour - elevation), out=max_drop)
+            self.slope_map[rows] = np.degrees(np.arctan2(max_drop, lon_step_km[np.newaxis, :]))
+            
+            # Aspect from the elevation gradient in metres per metre
+            dz_dlon = np.gradient(block, axis=0)[inner] / lon_step_m[np.newaxis, :]
+            dz_dlat = np.gradient(elevation, axis=1) / lat_step_m
+            self.aspect_map[rows] = np.degrees(np.arctan2(-dz_dlon, -dz_dlat)) % 360.0
+
+    def _compute_movement_costs(self):
+        """Compute the movement-cost raster for each locomotion class."""
+        for name, spec in LOCOMOTION_CLASSES.items():
+            lookup = np.ones(len(TERRAIN_TYPES), dtype=np.float32)
+            for terrain, cost in spec['terrain'].items():
+                lookup[TERRAIN_CODES[terrain.value]] = cost
+            if name not in self.movement_cost_maps:
+                self.movement_cost_maps[name] = self.grid.layer(np.float32, name=f"movement_cost_{name}")
+            for rows in self.grid.strips():
+                slope_cost = 1.0 + self.slope_map[rows] * spec['slope_weight']
+                self.movement_cost_maps[name][rows] = lookup[self.terrain_type_map[rows]] * slope_cost
         
     def get_slope_at(self, longitude: float, latitude: float) -> float:
-        """Calculate slope at given coordinates in degrees."""
-        current_elevation = self.get_elevation_at(longitude, latitude)
-        
-        # Get elevations at 8 surrounding points
-        surrounding_elevations = []
-        for dlon in [-1, 0, 1]:
-            for dlat in [-1, 0, 1]:
-                if dlon == 0 and dlat == 0:
-                    continue
-                surrounding_elevations.append(
-                    self.get_elevation_at(
-                        longitude + dlon * self.world.longitude_resolution,
-                        latitude + dlat * self.world.latitude_resolution
-                    )
-                )
-                
-        # Calculate maximum slope
-        max_slope = 0.0
-        for elev in surrounding_elevations:
-            # Calculate distance to surrounding point
-            distance = self.world.get_tile_size(latitude)[0]  # Use longitude distance
-            elevation_diff = abs(elev - current_elevation)
-            slope = math.degrees(math.atan2(elevation_diff, distance))
-            max_slope = max(max_slope, slope)
-            
-        return max_slope 
+        """Get slope at given coordinates in degrees."""
+        refined = self._refined('slope', longitude, latitude)
+        if refined is not None:
+            return refined
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
+            return 0.0
+        self._ensure_movement_rasters()
+        return float(self.slope_map[cell])
+
+    def get_aspect_at(self, longitude: float, latitude: float) -> float:
+        """Get the compass bearing of the downslope direction in degrees."""
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
+            return 0.0
+        self._ensure_movement_rasters()
+        return float(self.aspect_map[cell])
+
+    def get_movement_cost_at(self, longitude: float, latitude: float, locomotion: str = 'human') -> float:
+        """Get the energy cost multiplier of moving through a cell for a locomotion class."""
+        refined = self._refined(f"movement_cost_{locomotion}", longitude, latitude)
+        if refined is not None:
+            return refined
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
+            return 1.0
+        self._ensure_movement_rasters()
+        return float(self.movement_cost_maps[locomotion][cell])
+
+    def get_terrain_codes_at(self, longitudes, latitudes) -> np.ndarray:
+        """Batch terrain lookup returning uint8 codes into TERRAIN_TYPES."""
+        codes = self.grid.sample(self.terrain_type_map, longitudes, latitudes,
+                                 TERRAIN_CODES[TerrainType.DEEP_OCEAN.value]).astype(np.uint8)
+        return self._refine('terrain_type', longitudes, latitudes, codes)
+
+    def get_elevations_at(self, longitudes, latitudes) -> np.ndarray:
+        """Batch :meth:`get_elevation_at`."""
+        elevations = self.grid.sample(self.elevation_map, longitudes, latitudes, 0.0)
+        return self._refine('elevation', longitudes, latitudes, elevations)
+
+    def get_slopes_at(self, longitudes, latitudes) -> np.ndarray:
+        """Batch :meth:`get_slope_at`."""
+        self._ensure_movement_rasters()
+        slopes = self.grid.sample(self.slope_map, longitudes, latitudes, 0.0)
+        return self._refine('slope', longitudes, latitudes, slopes)
+
+    def get_movement_costs_at(self, longitudes, latitudes, locomotion: str = 'human') -> np.ndarray:
+        """Batch :meth:`get_movement_cost_at`."""
+        self._ensure_movement_rasters()
+        costs = self.grid.sample(self.movement_cost_maps[locomotion], longitudes, latitudes, 1.0)
+        return self._refine(f"movement_cost_{locomotion}", longitudes, latitudes, costs)
+
+    def _refine(self, field: str, longitudes, latitudes, values: np.ndarray) -> np.ndarray:
+        """Overwrite base-grid samples with refined LOD values where tiles are resident."""
+        if self.lod is None:
+            return values
+        return self.lod.overlay(field, longitudes, latitudes, values)
+
+    def get_resource_amounts_at(self, longitudes, latitudes, resource: str) -> np.ndarray:
+        """Batch lookup of one terrain resource layer (water, food, wood, stone, metal)."""
+        return self.grid.sample(self.resource_maps[resource], longitudes, latitudes, 0.0)
 
     def get_ocean_tiles(self) -> List[Tuple[float, float]]:
         """Get all ocean tile coordinates."""
-        ocean_types = {
-            TerrainType.DEEP_OCEAN,
-            TerrainType.CONTINENTAL_SHELF,
-            TerrainType.CONTINENTAL_SLOPE,
-            TerrainType.OCEAN_TRENCH
-        }
-        return [(lon, lat) for (lon, lat), terrain in self.terrain_data.items()
-                if terrain['type'] in ocean_types]
+        return [self.grid.coordinates(i, j) for i, j in np.argwhere(self.ocean_mask)]
                 
     def get_depth_at(self, longitude: float, latitude: float) -> float:
         """Get ocean depth at given coordinates in meters."""
-        if (longitude, latitude) not in self.elevation_data:
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
             return 0.0
-        elevation = self.elevation_data[(longitude, latitude)]
-        return abs(min(0, elevation))  # Convert negative elevation to positive depth
+        return abs(min(0.0, float(self.elevation_map[cell])))  # Convert negative elevation to positive depth
         
     def get_salinity_at(self, longitude: float, latitude: float) -> float:
         """Get ocean salinity at given coordinates in parts per thousand (ppt)."""
-        if (longitude, latitude) not in self.salinity_data:
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
             return 35.0  # Default ocean salinity
-        return self.salinity_data[(longitude, latitude)]
+        return float(self.salinity_map[cell])
         
     def get_oxygen_at(self, longitude: float, latitude: float) -> float:
         """Get ocean oxygen level at given coordinates in mg/L."""
-        if (longitude, latitude) not in self.oxygen_data:
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
             return 6.0  # Default ocean oxygen level
-        return self.oxygen_data[(longitude, latitude)]
+        return float(self.oxygen_map[cell])
         
     def get_ocean_current_at(self, longitude: float, latitude: float) -> Optional[OceanCurrent]:
         """Get ocean current at given coordinates."""
-        return self.ocean_currents.get((longitude, latitude))
+        return self.get_current_at(longitude, latitude)
+        
+    def get_soil_quality_at(self, longitude: float, latitude: float) -> float:
+        """Get soil quality (0-1) at given coordinates."""
+        cell = self.grid.index(longitude, latitude)
+        if cell is None or not self.land_mask[cell]:
+            return 0.5
+        return float(self.soil_quality_map[cell])
+        
+    def get_nutrient_level_at(self, longitude: float, latitude: float) -> float:
+        """Get nutrient level (0-1) at given coordinates."""
+        cell = self.grid.index(longitude, latitude)
+        if cell is None or not self.land_mask[cell]:
+            return 0.5
+        return float(self.nutrient_map[cell])
         
     def _initialize_salinity(self):
         """Initialize salinity data for ocean areas."""
-        for lon in np.arange(self.world.min_longitude, self.world.max_longitude, self.world.longitude_resolution):
-            for lat in np.arange(self.world.min_latitude, self.world.max_latitude, self.world.latitude_resolution):
-                terrain = self.get_terrain_at(lon, lat)
-                if terrain in ['deep_ocean', 'continental_shelf', 'continental_slope', 'ocean_trench', 'coral_reef', 'seamount', 'abyssal_plain']:
-                    # Base salinity on latitude and depth
-                    base_salinity = 35.0  # Average ocean salinity in ppt
-                    
-                    # Adjust for latitude (lower near poles due to ice melt)
-                    lat_factor = 1.0 - (abs(lat) / 90.0) * 0.2
-                    
-                    # Adjust for depth (higher in deep water)
-                    depth = self.get_depth_at(lon, lat)
-                    depth_factor = 1.0 + (depth / 4000.0) * 0.1
-                    
-                    # Add some random variation
-                    variation = random.uniform(-0.5, 0.5)
-                    
-                    salinity = base_salinity * lat_factor * depth_factor + variation
-                    self.salinity_data[(lon, lat)] = salinity
-                else:
-                    # Non-ocean areas have zero salinity
-                    self.salinity_data[(lon, lat)] = 0.0
+        # Base salinity on latitude and depth
+        base_salinity = 35.0  # Average ocean salinity in ppt
+        
+        for rows in self.grid.strips():
+            _, lats = self.grid.mesh(rows)
+            
+            # Adjust for latitude (lower near poles due to ice melt)
+            lat_factor = 1.0 - (np.abs(lats) / 90.0) * 0.2
+            
+            # Adjust for depth (higher in deep water)
+            depth = np.abs(np.minimum(0.0, self.elevation_map[rows]))
+            depth_factor = 1.0 + (depth / 4000.0) * 0.1
+            
+            # Add some random variation
+            variation = self.generation_rng.uniform(-0.5, 0.5, lats.shape)
+            
+            # Non-ocean areas keep zero salinity
+            salinity = base_salinity * lat_factor * depth_factor + variation
+            self.salinity_map[rows] = np.where(self.ocean_mask[rows], salinity, 0.0)
 
     def _initialize_oxygen(self):
         """Initialize ocean oxygen data."""
-        for lon in np.arange(self.world.min_longitude, self.world.max_longitude, self.world.longitude_resolution):
-            for lat in np.arange(self.world.min_latitude, self.world.max_latitude, self.world.latitude_resolution):
-                if self._is_ocean(lon, lat):
-                    # Base oxygen level
-                    base_oxygen = 6.0  # mg/L
-                    
-                    # Add variation based on temperature
-                    temperature = self.world.climate.get_temperature_at(lon, lat)
-                    if temperature > 25:  # Warm water holds less oxygen
-                        base_oxygen -= 1.0
-                    elif temperature < 5:  # Cold water holds more oxygen
-                        base_oxygen += 1.0
-                        
-                    # Add variation based on depth
-                    depth = self.get_depth_at(lon, lat)
-                    if depth > 1000:  # Deep ocean has less oxygen
-                        base_oxygen -= 2.0
-                        
-                    self.oxygen_data[(lon, lat)] = max(0.0, base_oxygen)  # Ensure non-negative
+        for rows in self.grid.strips():
+            lons, lats = self.grid.mesh(rows)
+            
+            # Base oxygen level in mg/L, with variation based on temperature
+            temperature = self.world.climate.get_temperatures_at(lons, lats)
+            oxygen = np.full(lons.shape, 6.0)
+            oxygen[temperature > 25] -= 1.0  # Warm water holds less oxygen
+            oxygen[temperature < 5] += 1.0  # Cold water holds more oxygen
+            
+            # Add variation based on depth
+            depth = np.abs(np.minimum(0.0, self.elevation_map[rows]))
+            oxygen[depth > 1000] -= 2.0  # Deep ocean has less oxygen
+            
+            # Ensure non-negative; land keeps the default level
+            self.oxygen_map[rows] = np.where(self.ocean_mask[rows], np.maximum(0.0, oxygen), 6.0)
                     
     def _is_in_range(self, lon: float, lat: float, center: Tuple[float, float], radius: float) -> bool:
         """Check if a point is within a circular range."""
@@ -926,20 +989,28 @@ class TerrainSystem:
         
     def _is_ocean(self, longitude: float, latitude: float) -> bool:
         """Check if a location is ocean."""
-        ocean_types = {
-            TerrainType.DEEP_OCEAN,
-            TerrainType.CONTINENTAL_SHELF,
-            TerrainType.CONTINENTAL_SLOPE,
-            TerrainType.OCEAN_TRENCH,
-            TerrainType.CORAL_REEF,
-            TerrainType.SEAMOUNT,
-            TerrainType.ABYSSAL_PLAIN
-        }
-        terrain = self.terrain_data.get((longitude, latitude))
-        if terrain is None:
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
             return False
-        return terrain['type'] in {t.value for t in ocean_types}
+        return bool(self.ocean_mask[cell])
 
+    def _neighbour_layers(self, layer: np.ndarray, fill, rows: slice = slice(None)) -> np.ndarray:
+        """Stack the four edge neighbours (N, E, S, W) of a strip of a layer, padding outside the grid with ``fill``."""
+        rows = slice(*rows.indices(layer.shape[0]))
+        start, stop = max(rows.start - 1, 0), min(rows.stop + 1, layer.shape[0])
+        padded = np.pad(layer[start:stop], ((int(rows.start == 0), int(rows.stop == layer.shape[0])), (1, 1)),
+                        constant_values=fill)
+        return np.stack([padded[1:-1, 2:], padded[2:, 1:-1], padded[1:-1, :-2], padded[:-2, 1:-1]])
+        
+    def _strip_cells(self, mask: np.ndarray, rows: slice) -> Tuple[np.ndarray, np.ndarray]:
+        """Convert a mask over a strip of rows into grid indices."""
+        i, j = np.nonzero(mask)
+        return i + rows.start, j
+        
+    def _coastal_mask(self, rows: slice = slice(None)) -> np.ndarray:
+        """Vectorized :meth:`_is_coastal` over a strip of rows (by default the whole grid)."""
+        return self.land_mask[rows] & self._neighbour_layers(self.ocean_mask, False, rows).any(axis=0)
+        
     def _is_coastal(self, position: Tuple[float, float]) -> bool:
         """Check if a location is coastal (land adjacent to ocean)."""
         lon, lat = position
@@ -955,24 +1026,12 @@ class TerrainSystem:
         """Initialize all terrain systems."""
         logger.info("Starting terrain system initialization...")
         
-        # Initialize basic terrain
-        logger.info("Step 1/5: Initializing basic terrain...")
-        self._initialize_basic_terrain()
-        
-        # Initialize elevation
-        logger.info("Step 2/5: Initializing elevation data...")
-        self._initialize_elevation()
-        
-        # Initialize resources
-        logger.info("Step 3/5: Initializing resource data...")
-        self._initialize_resources()
-        
-        # Initialize ocean systems
-        logger.info("Step 4/5: Initializing ocean systems...")
-        self._initialize_ocean_systems()
+        # Regenerate basic terrain, elevation, resources and ocean systems
+        logger.info("Step 1/2: Generating terrain layers...")
+        self._generate_static_layers()
         
         # Final verification
-        logger.info("Step 5/5: Verifying terrain data...")
+        logger.info("Step 2/2: Verifying terrain data...")
         if not self.verify_initialization():
             logger.error("Terrain system initialization verification failed")
             raise RuntimeError("Terrain system initialization verification failed")
@@ -984,27 +1043,27 @@ class TerrainSystem:
         logger.info("Verifying terrain system initialization...")
         
         # Check terrain data
-        if not self.terrain_data:
+        if not self.terrain_type_map.size:
             logger.error("Terrain data not initialized")
             return False
             
         # Check elevation data
-        if not self.elevation_data:
+        if not self.elevation_map.any():
             logger.error("Elevation data not initialized")
             return False
             
         # Check resource data
-        if not self.resource_data:
+        if not any(layer.any() for layer in self.resource_maps.values()):
             logger.error("Resource data not initialized")
             return False
             
         # Check ocean systems
-        if not self.ocean_currents or not self.tidal_ranges:
+        if not (self.current_kind_map >= 0).any() or not self.tidal_range_map.any():
             logger.error("Ocean systems not initialized")
             return False
             
         # Check environmental data
-        if not self.salinity_data or not self.oxygen_data:
+        if not self.salinity_map.any() or not self.oxygen_map.any():
             logger.error("Environmental data not initialized")
             return False
             
@@ -1012,176 +1071,257 @@ class TerrainSystem:
         return True
     
     def get_state(self) -> Dict:
-        """Get the current state of the terrain system."""
+        """Get the current state of the terrain system.
+
+        Grids finer than 1° are subsampled to roughly 1° so the state stays a manageable size.
+        """
+        step = (slice(None, None, max(1, round(1.0 / self.grid.longitude_resolution))),
+                slice(None, None, max(1, round(1.0 / self.grid.latitude_resolution))))
+        sampled = lambda layer: np.asarray(layer[step]).ravel().tolist()
+        lons, lats = np.meshgrid(self.grid.longitudes[step[0]], self.grid.latitudes[step[1]], indexing='ij')
+        cells = list(zip(lons.ravel().tolist(), lats.ravel().tolist()))
+        keys = [f"{lon},{lat}" for lon, lat in cells]
+        climate = [self.world.climate.get_climate_at(lon, lat) for lon, lat in cells]
+        terrain_types = [TERRAIN_TYPES[code].value for code in sampled(self.terrain_type_map)]
+        wind = self.wind_map[step]
         return {
-            'elevation_map': [terrain.get('elevation', 0) for terrain in self.terrain_data.values()],
-            'water_map': [terrain.get('water', 0) for terrain in self.terrain_data.values()],
-            'soil_map': [terrain.get('soil', 0) for terrain in self.terrain_data.values()],
-            'vegetation_map': [terrain.get('vegetation', 0) for terrain in self.terrain_data.values()],
-            'soil_quality_map': [terrain.get('soil_quality', 0) for terrain in self.terrain_data.values()],
-            'nutrient_map': [terrain.get('nutrient_level', 0) for terrain in self.terrain_data.values()],
-            'pollution_map': [terrain.get('pollution_level', 0) for terrain in self.terrain_data.values()],
-            'wind_map': [terrain.get('wind_speed', 0) for terrain in self.terrain_data.values()],
-            'erosion_map': [terrain.get('erosion_rate', 0) for terrain in self.terrain_data.values()],
-            'deposition_map': [terrain.get('deposition_rate', 0) for terrain in self.terrain_data.values()],
-            'terrain_types': [terrain['type'] for terrain in self.terrain_data.values()],
-            'terrain_subtypes': [terrain.get('terrain_type', '') for terrain in self.terrain_data.values()],
-            'biomes': {f"{lon},{lat}": self.world.climate.get_climate_at(lon, lat) 
-                      for (lon, lat), terrain in self.terrain_data.items()},
-            'climate_zones': {f"{lon},{lat}": self.world.climate.get_climate_at(lon, lat) 
-                            for (lon, lat), terrain in self.terrain_data.items()},
-            'water_bodies': {f"{lon},{lat}": terrain.get('water_body', '') 
-                           for (lon, lat), terrain in self.terrain_data.items()},
-            'explored': {f"{lon},{lat}": terrain.get('explored', False) 
-                        for (lon, lat), terrain in self.terrain_data.items()},
-            'temperature': {f"{lon},{lat}": self.world.climate.get_temperature_at(lon, lat) 
-                          for (lon, lat), terrain in self.terrain_data.items()},
-            'precipitation': {f"{lon},{lat}": self.world.climate.get_precipitation_at(lon, lat) 
-                            for (lon, lat), terrain in self.terrain_data.items()},
+            'elevation_map': sampled(self.elevation_map),
+            'water_map': sampled(self.resource_maps['water']),
+            'soil_map': sampled(self.soil_quality_map),
+            'vegetation_map': sampled(self.resource_maps['wood']),
+            'soil_quality_map': sampled(self.soil_quality_map),
+            'nutrient_map': sampled(self.nutrient_map),
+            'pollution_map': sampled(self.pollution_map),
+            'wind_map': np.hypot(wind[..., 0], wind[..., 1]).ravel().tolist(),
+            'erosion_map': sampled(self.erosion_map),
+            'deposition_map': sampled(self.deposition_map),
+            'terrain_types': terrain_types,
+            'terrain_subtypes': [''] * len(cells),
+            'biomes': dict(zip(keys, climate)),
+            'climate_zones': dict(zip(keys, climate)),
+            'water_bodies': {key: '' for key in keys},
+            'explored': {key: False for key in keys},
+            'temperature': {key: self.world.climate.get_temperature_at(lon, lat)
+                          for key, (lon, lat) in zip(keys, cells)},
+            'precipitation': {key: self.world.climate.get_precipitation_at(lon, lat)
+                            for key, (lon, lat) in zip(keys, cells)},
             'soil_quality': self.soil_quality,
             'nutrient_level': self.nutrient_level,
             'pollution_level': self.pollution_level,
             'wind_speed': self.wind_speed,
             'erosion_rate': self.erosion_rate,
-            'deposition_rate': self.deposition_rate
+            'deposition_rate': self.deposition_rate,
+            'lod': self.lod.get_state() if self.lod is not None else None
         }
 
     def update(self, dt: float):
         """Update terrain system state."""
-        self._update_soil_quality(dt)
-        self._update_nutrients(dt)
-        self._update_pollution(dt)
-        self._update_wind(dt)
-        self._update_erosion(dt)
-        
-    def _update_soil_quality(self, dt: float):
+        windows = self._sweep_windows(dt)
+        self._update_soil_quality(windows)
+        self._update_nutrients(windows)
+        self._update_pollution(windows)
+        self._update_wind(windows)
+        self._update_erosion(windows)
+
+    def populated_points(self) -> List[Tuple[float, float, float]]:
+        """Get (longitude, latitude, extra radius) of every agent and settlement."""
+        points = [(float(agent.position[0]), float(agent.position[1]), 0.0)
+                  for agent in self.world.agents.agents.values()]
+        for settlement in self.world.society.settlements.values():
+            # Settlements are records with a 'location' or objects with coordinates
+            if isinstance(settlement, dict):
+                longitude, latitude = settlement['location']
+            else:
+                longitude, latitude = settlement.longitude, settlement.latitude
+            points.append((float(longitude), float(latitude), 0.0))
+        return points
+
+    def _sweep_windows(self, dt: float) -> List[Tuple[Tuple[slice, slice], float]]:
+        """Get the (rows, columns) windows the periodic sweeps visit, each with the dt to apply.
+
+        In-memory grids are swept whole, a strip of rows at a time. On memory-mapped
+        grids only the tiles within SWEEP_RADIUS of agents, settlements and refined
+        regions are visited, so idle pages stay on disk; a tile catches up on the time
+        since it was last visited, which the dt-scaled updates below allow.
+        """
+        if self.grid.storage_dir is None:
+            return [((rows, slice(None)), dt) for rows in self.grid.strips()]
+
+        self._sweep_clock += dt
+        points = self.lod.focus_points() if self.lod is not None else self.populated_points()
+        tiles = set()
+        for longitude, latitude, extra in points:
+            radius = SWEEP_RADIUS + extra
+            rows, cols = self.grid.window(longitude - radius, latitude - radius,
+                                          longitude + radius, latitude + radius)
+            if rows.start >= rows.stop or cols.start >= cols.stop:
+                continue
+            tiles.update((ti, tj)
+                         for ti in range(rows.start // SWEEP_TILE_CELLS, (rows.stop - 1) // SWEEP_TILE_CELLS + 1)
+                         for tj in range(cols.start // SWEEP_TILE_CELLS, (cols.stop - 1) // SWEEP_TILE_CELLS + 1))
+
+        windows = []
+        for ti, tj in sorted(tiles):
+            window = (slice(ti * SWEEP_TILE_CELLS, (ti + 1) * SWEEP_TILE_CELLS),
+                      slice(tj * SWEEP_TILE_CELLS, (tj + 1) * SWEEP_TILE_CELLS))
+            windows.append((window, self._sweep_clock - self._swept.get((ti, tj), 0.0)))
+            self._swept[(ti, tj)] = self._sweep_clock
+        return windows
+        
+    def _sample_climate(self, field: np.ndarray, window: Tuple[slice, slice] = (slice(None), slice(None))) -> np.ndarray:
+        """Sample a climate raster onto a window of the terrain grid (nearest cell)."""
+        if field.shape == self.grid.shape:
+            return field[window]
+        rows, cols = window
+        climate = self.world.climate
+        lon_step = climate.longitude_range[1] - climate.longitude_range[0]
+        lat_step = climate.latitude_range[1] - climate.latitude_range[0]
+        i = np.clip(np.round((self.grid.longitudes[rows] - climate.longitude_range[0]) / lon_step).astype(int),
+                    0, field.shape[0] - 1)
+        j = np.clip(np.round((self.grid.latitudes[cols] - climate.latitude_range[0]) / lat_step).astype(int),
+                    0, field.shape[1] - 1)
+        return field[np.ix_(i, j)]
+
+    def _land_climate(self, window: Tuple[slice, slice] = (slice(None), slice(None))) -> Tuple[np.ndarray, np.ndarray]:
+        """Get temperature and precipitation for the land cells of a window."""
+        climate = self.world.climate
+        land = self.land_mask[window]
+        temperature = self._sample_climate(climate.temperature_map, window)[land]
+        precipitation = self._sample_climate(climate.precipitation_map, window)[land]
+        return temperature, precipitation
+
+    def _land_wind_speed(self, window: Tuple[slice, slice] = (slice(None), slice(None))) -> np.ndarray:
+        """Get wind speed for the land cells of a window."""
+        wind = self.wind_map[window][self.land_mask[window]]
+        return np.sqrt(wind[:, 0]**2 + wind[:, 1]**2)
+        
+    @staticmethod
+    def _mean(total: float, count: int) -> float:
+        """Average of window totals; NaN when there were no cells, like ndarray.mean."""
+        return total / count if count else float('nan')
+        
+    # The sweeps below run a window at a time so fine grids never hold full-size temporaries;
+    # their global averages cover the land cells visited
+    def _update_soil_quality(self, windows: List[Tuple[Tuple[slice, slice], float]]):
         """Update soil quality based on various factors."""
-        for (lon, lat), quality in self.soil_quality_data.items():
-            # Get current conditions
-            temp = self.world.climate.get_temperature_at(lon, lat)
-            precip = self.world.climate.get_precipitation(lon, lat)
-            terrain_type = self.terrain_data.get((lon, lat), {}).get('type', 'land')
+        total, count = 0.0, 0
+        for window, dt in windows:
+            land = self.land_mask[window]
+            temp, precip = self._land_climate(window)
             
-            if terrain_type == 'water':
-                continue
-                
             # Factors affecting soil quality
-            temp_factor = 1.0 - abs(temp - 20) / 40  # Optimal around 20°C
-            precip_factor = 1.0 - abs(precip - 0.5)  # Optimal around 0.5
-            erosion_factor = 1.0 - self.erosion_data.get((lon, lat), 0)
-            pollution_factor = 1.0 - self.pollution_data.get((lon, lat), 0)
+            temp_factor = 1.0 - np.abs(temp - 20) / 40  # Optimal around 20°C
+            precip_factor = 1.0 - np.abs(precip - 0.5)  # Optimal around 0.5
+            erosion_factor = 1.0 - self.erosion_map[window][land]
+            pollution_factor = 1.0 - self.pollution_map[window][land]
             
             # Calculate change
             change = (temp_factor * 0.1 + precip_factor * 0.1 + erosion_factor * 0.2 + pollution_factor * 0.2) * dt
-            change += np.random.normal(0, 0.01) * dt  # Small random variation
+            change += self.rng.normal(0, 0.01 * np.sqrt(dt), change.shape)  # Small random variation
             
             # Update quality
-            new_quality = quality + change
-            self.soil_quality_data[(lon, lat)] = max(0.0, min(1.0, new_quality))
+            quality = self.soil_quality_map[window]
+            quality[land] = np.clip(quality[land] + change, 0.0, 1.0)
+            total += float(quality[land].sum())
+            count += change.size
         
         # Update global average
-        self.soil_quality = np.mean([q for q in self.soil_quality_data.values()])
+        self.soil_quality = self._mean(total, count)
     
-    def _update_nutrients(self, dt: float):
+    def _update_nutrients(self, windows: List[Tuple[Tuple[slice, slice], float]]):
         """Update nutrient levels based on various factors."""
-        for (lon, lat), level in self.nutrient_data.items():
-            # Get current conditions
-            soil_quality = self.soil_quality_data.get((lon, lat), 0.5)
-            terrain_type = self.terrain_data.get((lon, lat), {}).get('type', 'land')
+        total, count = 0.0, 0
+        for window, dt in windows:
+            land = self.land_mask[window]
             
-            if terrain_type == 'water':
-                # Water nutrients are affected by temperature and pollution
-                temp = self.world.climate.get_temperature_at(lon, lat)
-                pollution = self.pollution_data.get((lon, lat), 0)
-                temp_factor = 1.0 - abs(temp - 15) / 30  # Optimal around 15°C
-                pollution_factor = 1.0 - pollution
-                change = (temp_factor * 0.1 + pollution_factor * 0.1) * dt
-            else:
-                # Land nutrients are affected by soil quality and vegetation
-                vegetation = self.terrain_data.get((lon, lat), {}).get('vegetation', 0)
-                change = (soil_quality * 0.2 + vegetation * 0.1) * dt
+            # Land nutrients are affected by soil quality
+            change = self.soil_quality_map[window][land] * 0.2 * dt
             
             # Add small random variation
-            change += np.random.normal(0, 0.01) * dt
+            change += self.rng.normal(0, 0.01 * np.sqrt(dt), change.shape)
             
             # Update level
-            new_level = level + change
-            self.nutrient_data[(lon, lat)] = max(0.0, min(1.0, new_level))
+            nutrients = self.nutrient_map[window]
+            nutrients[land] = np.clip(nutrients[land] + change, 0.0, 1.0)
+            total += float(nutrients[land].sum())
+            count += change.size
         
         # Update global average
-        self.nutrient_level = np.mean([n for n in self.nutrient_data.values()])
+        self.nutrient_level = self._mean(total, count)
     
-    def _update_pollution(self, dt: float):
+    def _update_pollution(self, windows: List[Tuple[Tuple[slice, slice], float]]):
         """Update pollution levels based on various factors."""
-        for (lon, lat), level in self.pollution_data.items():
-            # Get current conditions
-            wind = self.wind_data.get((lon, lat), (0, 0))
-            wind_speed = np.sqrt(wind[0]**2 + wind[1]**2)
-            precip = self.world.climate.get_precipitation(lon, lat)
+        total, count = 0.0, 0
+        for window, dt in windows:
+            land = self.land_mask[window]
+            _, precip = self._land_climate(window)
             
             # Factors affecting pollution
-            wind_factor = 1.0 - wind_speed  # Wind disperses pollution
+            wind_factor = 1.0 - self._land_wind_speed(window)  # Wind disperses pollution
             precip_factor = 1.0 - precip  # Rain cleans pollution
             
             # Calculate change
             change = (wind_factor * 0.1 + precip_factor * 0.1) * dt
-            change += np.random.normal(0, 0.01) * dt  # Small random variation
+            change += self.rng.normal(0, 0.01 * np.sqrt(dt), change.shape)  # Small random variation
             
             # Update level
-            new_level = level + change
-            self.pollution_data[(lon, lat)] = max(0.0, min(1.0, new_level))
+            pollution = self.pollution_map[window]
+            pollution[land] = np.clip(pollution[land] + change, 0.0, 1.0)
+            total += float(pollution[land].sum())
+            count += change.size
         
         # Update global average
-        self.pollution_level = np.mean([p for p in self.pollution_data.values()])
+        self.pollution_level = self._mean(total, count)
     
-    def _update_wind(self, dt: float):
+    def _update_wind(self, windows: List[Tuple[Tuple[slice, slice], float]]):
         """Update wind patterns based on temperature and pressure differences."""
-        for (lon, lat), wind in self.wind_data.items():
-            # Get current conditions
-            temp = self.world.climate.get_temperature_at(lon, lat)
-            precip = self.world.climate.get_precipitation(lon, lat)
-            
-            # Calculate pressure gradient (simplified)
-            pressure_gradient = np.random.normal(0, 0.1)  # Simplified model
+        total, count = 0.0, 0
+        for window, dt in windows:
+            land = self.land_mask[window]
             
-            # Update wind components
-            new_wind_x = wind[0] + pressure_gradient * dt
-            new_wind_y = wind[1] + pressure_gradient * dt
+            # Calculate pressure gradient (simplified model), the same for both components
+            pressure_gradient = self.rng.normal(0, 0.1 * np.sqrt(dt), int(land.sum()))
             
-            # Add some damping
-            new_wind_x *= 0.99
-            new_wind_y *= 0.99
-            
-            self.wind_data[(lon, lat)] = (new_wind_x, new_wind_y)
+            # Update wind components and add some damping
+            strip = self.wind_map[window]
+            wind = strip[land]
+            wind += pressure_gradient[:, np.newaxis]
+            wind *= 0.99 ** dt
+            strip[land] = wind
+            speed = self._land_wind_speed(window)
+            total += float(speed.sum())
+            count += speed.size
         
         # Update global wind speed
-        wind_speeds = [np.sqrt(w[0]**2 + w[1]**2) for w in self.wind_data.values()]
-        self.wind_speed = np.mean(wind_speeds)
+        self.wind_speed = self._mean(total, count)
     
-    def _update_erosion(self, dt: float):
+    def _update_erosion(self, windows: List[Tuple[Tuple[slice, slice], float]]):
         """Update erosion and deposition based on various factors."""
-        for (lon, lat), erosion in self.erosion_data.items():
-            # Get current conditions
-            wind = self.wind_data.get((lon, lat), (0, 0))
-            wind_speed = np.sqrt(wind[0]**2 + wind[1]**2)
-            precip = self.world.climate.get_precipitation(lon, lat)
-            elevation = self.elevation_data.get((lon, lat), 0)
+        if self._mean_elevation is None:
+            self._mean_elevation = self.elevation_map.mean()
+        erosion_total, deposition_total, count = 0.0, 0.0, 0
+        for window, dt in windows:
+            land = self.land_mask[window]
+            _, precip = self._land_climate(window)
             
             # Calculate erosion rate
-            wind_factor = wind_speed * 0.1
+            wind_factor = self._land_wind_speed(window) * 0.1
             precip_factor = precip * 0.2
-            slope_factor = abs(elevation - np.mean(self.elevation_data.values())) * 0.1
-            
+            slope_factor = np.abs(self.elevation_map[window][land] - self._mean_elevation) * 0.1
             erosion_rate = (wind_factor + precip_factor + slope_factor) * dt
-            self.erosion_data[(lon, lat)] = erosion + erosion_rate
+            erosion = self.erosion_map[window]
+            erosion[land] += erosion_rate
             
-            # Calculate deposition
-            deposition_rate = erosion_rate * 0.5  # Some eroded material is deposited
-            self.deposition_data[(lon, lat)] = self.deposition_data.get((lon, lat), 0) + deposition_rate
+            # Calculate deposition; some eroded material is deposited
+            deposition = self.deposition_map[window]
+            deposition[land] += erosion_rate * 0.5
+            erosion_total += float(erosion[land].sum())
+            deposition_total += float(deposition[land].sum())
+            count += erosion_rate.size
         
         # Update global rates
-        self.erosion_rate = np.mean([e for e in self.erosion_data.values()])
-        self.deposition_rate = np.mean([d for d in self.deposition_data.values()])
+        self.erosion_rate = self._mean(erosion_total, count)
+        self.deposition_rate = self._mean(deposition_total, count)
 
     def _get_coastal_temperature(self, lat: float) -> float:
         """Calculate coastal water temperature based on latitude."""
@@ -1203,86 +1343,71 @@ class TerrainSystem:
         """Calculate mixing zone temperature based on latitude."""
         return 18.0 - abs(lat) * 0.2
 
-    def _is_mixing_zone(self, coord: Tuple[int, int]) -> bool:
-        """Check if a coordinate is in a mixing zone."""
-        lon, lat = coord
-        # Check if this is where major currents meet
-        current = self.ocean_currents.get(coord)
-        if not current:
-            return False
-            
-        # Check surrounding cells for different current types
-        surrounding_currents = set()
-        for dx, dy in [(0,1), (1,0), (0,-1), (-1,0)]:
-            neighbor = self.ocean_currents.get((lon+dx, lat+dy))
-            if neighbor:
-                surrounding_currents.add(neighbor.name)
-
-        return len(surrounding_currents) > 1
+    def _mixing_zone_mask(self, rows: slice = slice(None)) -> np.ndarray:
+        """Cells with a current whose edge neighbours carry more than one kind of current."""
+        neighbours = self._neighbour_layers(self.current_kind_map, -1, rows)
+        present = neighbours >= 0
+        lowest = np.where(present, neighbours, len(OCEAN_CURRENT_NAMES)).min(axis=0)
+        highest = np.where(present, neighbours, -1).max(axis=0)
+        return (self.current_kind_map[rows] >= 0) & (highest > lowest)
 
     def _initialize_soil_quality(self):
-        """Initialize soil quality across the terrain."""
-        for coord, terrain in self.terrain_data.items():
-            if terrain['type'] == 'land':
-                # Base soil quality on elevation and terrain type
-                elevation_factor = 1.0 - (terrain['elevation'] / self.max_elevation)
-                terrain_factor = {
-                    'mountain': 0.3,
-                    'hill': 0.6,
-                    'plain': 0.8,
-                    'valley': 0.9,
-                    'coast': 0.7
-                }.get(terrain['terrain_type'], 0.5)
-                
-                # Calculate initial soil quality (0.0 to 1.0)
-                quality = elevation_factor * terrain_factor
-                self.soil_quality_data[coord] = quality
-                terrain['soil_quality'] = quality
+        """Initialize soil quality across the land cells."""
+        # Base soil quality on elevation and terrain type
+        max_elevation = max(float(self.elevation_map.max()), 1.0)
+        factors = {
+            TerrainType.MOUNTAIN: 0.3,
+            TerrainType.HILLS: 0.6,
+            TerrainType.GRASSLAND: 0.8,
+            TerrainType.VALLEY: 0.9,
+            TerrainType.BEACH: 0.7
+        }
+        
+        # Calculate initial soil quality (0.0 to 1.0)
+        for rows in self.grid.strips():
+            elevation_factor = np.clip(1.0 - self.elevation_map[rows] / max_elevation, 0.0, 1.0)
+            terrain_factor = self._terrain_factor(factors, rows=rows)
+            self.soil_quality_map[rows] = np.where(self.land_mask[rows], elevation_factor * terrain_factor, 0.0)
 
     def _initialize_nutrients(self):
-        """Initialize nutrient levels across the terrain."""
-        for coord, terrain in self.terrain_data.items():
-            if terrain['type'] == 'land':
-                # Base nutrient level on soil quality and terrain type
-                soil_quality = terrain.get('soil_quality', 0.5)
-                terrain_factor = {
-                    'mountain': 0.2,
-                    'hill': 0.4,
-                    'plain': 0.7,
-                    'valley': 0.8,
-                    'coast': 0.6
-                }.get(terrain['terrain_type'], 0.5)
-                
-                # Calculate initial nutrient level (0.0 to 1.0)
-                level = soil_quality * terrain_factor
-                self.nutrient_data[coord] = level
-                terrain['nutrient_level'] = level
+        """Initialize nutrient levels across the land cells."""
+        # Base nutrient level on soil quality and terrain type
+        factors = {
+            TerrainType.MOUNTAIN: 0.2,
+            TerrainType.HILLS: 0.4,
+            TerrainType.GRASSLAND: 0.7,
+            TerrainType.VALLEY: 0.8,
+            TerrainType.BEACH: 0.6
+        }
+        
+        # Calculate initial nutrient level (0.0 to 1.0)
+        for rows in self.grid.strips():
+            terrain_factor = self._terrain_factor(factors, rows=rows)
+            self.nutrient_map[rows] = np.where(self.land_mask[rows], self.soil_quality_map[rows] * terrain_factor, 0.0)
+
+    def _terrain_factor(self, factors: Dict[TerrainType, float], default: float = 0.5,
+                        rows: slice = slice(None)) -> np.ndarray:
+        """Map each cell's terrain type to a factor, optionally for a strip of rows."""
+        lookup = np.full(len(TERRAIN_TYPES), default, dtype=np.float32)
+        for terrain, factor in factors.items():
+            lookup[TERRAIN_CODES[terrain.value]] = factor
+        return lookup[self.terrain_type_map[rows]]
 
     def _initialize_pollution(self):
         """Initialize pollution levels across the terrain."""
-        for coord, terrain in self.terrain_data.items():
-            if terrain['type'] == 'land':
-                # Start with no pollution
-                self.pollution_data[coord] = 0.0
-                terrain['pollution_level'] = 0.0
+        # Start with no pollution
+        self.pollution_map.fill(0.0)
 
     def _initialize_wind(self):
         """Initialize wind patterns across the terrain."""
-        for coord, terrain in self.terrain_data.items():
-            if terrain['type'] == 'land':
-                # Start with calm conditions
-                self.wind_data[coord] = 0.0
-                terrain['wind_speed'] = 0.0
+        # Start with calm conditions
+        self.wind_map.fill(0.0)
 
     def _initialize_erosion(self):
         """Initialize erosion and deposition data."""
-        for coord, terrain in self.terrain_data.items():
-            if terrain['type'] == 'land':
-                # Start with no erosion or deposition
-                self.erosion_data[coord] = 0.0
-                self.deposition_data[coord] = 0.0
-                terrain['erosion_rate'] = 0.0
-                terrain['deposition_rate'] = 0.0
+        # Start with no erosion or deposition
+        self.erosion_map.fill(0.0)
+        self.deposition_map.fill(0.0)
 
     def _get_coastal_direction(self, position):
         """Placeholder: Always returns eastward direction for coastal currents."""
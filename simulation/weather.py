@@ -1,11 +1,11 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
-import random
 import logging
 import math
 import numpy as np
 from datetime import datetime
+from .history import WeatherHistory
 from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -30,6 +30,44 @@ class WeatherType(Enum):
     MONSOON = "monsoon"
 
 
+# Per-cell weather held as uint8 codes into WEATHER_TYPES
+WEATHER_TYPES = list(WeatherType)
+WEATHER_TYPE_CODES = {weather_type: code for code, weather_type in enumerate(WEATHER_TYPES)}
+
+# Absolute source latitude of each air mass; its influence falls off with this spread in degrees
+AIR_MASS_LATITUDES = {"arctic": 80.0, "polar": 60.0, "tropical": 25.0, "equatorial": 0.0}
+AIR_MASS_SPREAD = 15.0
+
+# WeatherState fields kept in the weather history, besides the weather type
+HISTORY_VARIABLES = ('temperature', 'humidity', 'wind_speed', 'wind_direction', 'precipitation',
+                     'cloud_cover', 'severity', 'pressure', 'visibility', 'uv_index')
+
+# Forecast variables and the largest hourly change of each in one ensemble member
+FORECAST_STEPS = {'temperature': 1.0, 'humidity': 0.1, 'wind_speed': 2.0, 'pressure': 1.0}
+FORECAST_MEMBERS = 64
+FORECAST_QUANTILES = (0.1, 0.5, 0.9)
+
+FRONT_COUNT = 8
+# Fronts turn back towards the equator at this latitude
+FRONT_MAX_LATITUDE = 75.0
+KM_PER_DEGREE = 111.32
+
+
+@dataclass
+class WeatherFronts:
+    """Active weather fronts as parallel arrays, one entry per front."""
+    cold: np.ndarray  # bool; False is a warm front
+    longitude: np.ndarray  # degrees, wrapped into [-180, 180)
+    latitude: np.ndarray  # degrees, within FRONT_MAX_LATITUDE of the equator
+    heading: np.ndarray  # degrees clockwise from north
+    speed: np.ndarray  # km/h
+    intensity: np.ndarray  # 0.1-1
+    radius: np.ndarray  # footprint standard deviation in degrees of latitude
+
+    def __len__(self) -> int:
+        return len(self.intensity)
+
+
 @dataclass
 class WeatherState:
     temperature: float  # Celsius
@@ -48,6 +86,10 @@ class WeatherState:
 class WeatherSystem:
     def __init__(self, world):
         self.world = world
+        self.rng = world.rng.stream('weather')
+        # Forecasts draw from their own stream so asking for one leaves the weather unchanged
+        self.forecast_rng = world.rng.stream('weather.forecast')
+        self._forecast_cache: Dict[Tuple, Dict] = {}  # (hours, members, quantiles) -> ensemble
         self.current_weather = WeatherState(
             temperature=20.0,
             humidity=0.5,
@@ -61,27 +103,34 @@ class WeatherSystem:
             visibility=10.0,
             uv_index=5.0,
         )
-        self.weather_history: List[WeatherState] = []
+        # Global weather per update, rolled up into minute, hour and day tiers
+        self.weather_history = WeatherHistory(HISTORY_VARIABLES, len(WEATHER_TYPES), circular=('wind_direction',))
         self.season = "spring"  # spring, summer, fall, winter
         self.day_length = 12  # hours of daylight
         self.time_of_day = 0  # 0-23 hours
-        self.weather_fronts: List[Dict] = []  # List of active weather fronts
+        self.weather_fronts: Optional[WeatherFronts] = None  # Active weather fronts
         self.air_masses: Dict[str, Dict] = {}  # Active air masses
-        self.initialize_weather_systems()
 
-    def _calculate_day_length(self, latitude: float, day_of_year: int) -> float:
-        """Approximate day length in hours for a latitude and day of year."""
-        axial_tilt = 23.44  # degrees
-        lat_rad = math.radians(latitude)
-        decl = math.radians(axial_tilt) * math.sin(
-            2 * math.pi * (day_of_year - 81) / 365
-        )
-        cos_ha = (
-            math.sin(math.radians(-0.83)) - math.sin(lat_rad) * math.sin(decl)
-        ) / (math.cos(lat_rad) * math.cos(decl))
-        cos_ha = max(-1.0, min(1.0, cos_ha))
-        ha = math.acos(cos_ha)
-        return 2 * ha * 24 / (2 * math.pi)
+        # Local weather on the climate grid, indexed [lon_index, lat_index]
+        self.grid = world.climate.grid
+        self.temperature_map = self.grid.layer(np.float32)  # Celsius
+        self.humidity_map = self.grid.layer(np.float32)  # 0-1
+        self.pressure_map = self.grid.layer(np.float32, 1013.25)  # hPa
+        self.precipitation_map = self.grid.layer(np.float32)  # mm/h
+        self.cloud_cover_map = self.grid.layer(np.float32)  # 0-1
+        self.wind_east_map = self.grid.layer(np.float32)  # km/h towards the east
+        self.wind_north_map = self.grid.layer(np.float32)  # km/h towards the north
+        self.wind_speed_map = self.grid.layer(np.float32)  # km/h
+        self.weather_map = self.grid.layer(np.uint8, WEATHER_TYPE_CODES[WeatherType.CLEAR])
+        # Climate wind as eastward and northward km/h, kept until the climate next updates
+        self._climate_wind = None
+        self._climate_wind_time = None
+        # Share of each air mass in every latitude row, rows summing to one
+        spread = np.abs(self.grid.latitudes)[:, None] - np.array(list(AIR_MASS_LATITUDES.values()))[None, :]
+        weights = np.exp(-0.5 * (spread / AIR_MASS_SPREAD) ** 2)
+        self._air_mass_weights = weights / weights.sum(axis=1, keepdims=True)
+
+        self.initialize_weather_systems()
 
     def initialize_weather_systems(self):
         """Initialize weather systems like fronts and air masses."""
@@ -93,26 +142,23 @@ class WeatherSystem:
             "equatorial": {"temperature": 30, "humidity": 0.8, "pressure": 1008},
         }
 
-        # Initialize weather fronts
-        self.weather_fronts = [
-            {
-                "type": "cold",
-                "position": (0, 0),
-                "direction": (1, 0),
-                "speed": 20,
-                "intensity": 0.7,
-            },
-            {
-                "type": "warm",
-                "position": (0, 0),
-                "direction": (-1, 0),
-                "speed": 15,
-                "intensity": 0.5,
-            },
-        ]
+        # Initialize weather fronts, alternating cold and warm, across the mid-latitudes
+        self.weather_fronts = WeatherFronts(
+            cold=np.arange(FRONT_COUNT) % 2 == 0,
+            longitude=self.rng.uniform(-180, 180, FRONT_COUNT),
+            latitude=self.rng.uniform(-60, 60, FRONT_COUNT),
+            heading=self.rng.uniform(0, 360, FRONT_COUNT),
+            speed=self.rng.uniform(15, 40, FRONT_COUNT),
+            intensity=self.rng.uniform(0.3, 0.8, FRONT_COUNT),
+            radius=self.rng.uniform(3, 8, FRONT_COUNT),
+        )
+        self.update_fields()
 
     def update(self, time_delta: float) -> None:
         """Update weather state based on time, season, and global patterns."""
+        # Forecasts start from the current weather, which is about to change
+        self._forecast_cache.clear()
+
         # Convert simulation seconds to hours
         hours = time_delta / 3600.0
 
@@ -123,12 +169,12 @@ class WeatherSystem:
         if self.time_of_day < hours * 24 / self.day_length:
             self._update_season()
             mid_lat = (self.world.min_latitude + self.world.max_latitude) / 2
-            day_of_year = self.world.game_time.timetuple().tm_yday
-            self.day_length = self._calculate_day_length(mid_lat, day_of_year)
+            day_of_year = self.world.solar.day_of_year(self.world.game_time)
+            self.day_length = self.world.solar.day_length_at(mid_lat, day_of_year)
 
         # Update global weather patterns
         self._update_air_masses()
-        self._update_weather_fronts()
+        self._update_weather_fronts(hours)
 
         # Update local weather
         self._update_temperature()
@@ -142,9 +188,10 @@ class WeatherSystem:
         self._update_uv_index()
 
         # Store weather history
-        self.weather_history.append(self.current_weather)
-        if len(self.weather_history) > 100:  # Keep last 100 weather states
-            self.weather_history.pop(0)
+        weather = self.current_weather
+        self.weather_history.record(self.world.simulation_time,
+                                    [getattr(weather, name) for name in HISTORY_VARIABLES],
+                                    WEATHER_TYPE_CODES[weather.weather_type])
 
         logger.info(
             f"Weather updated: {self.current_weather.weather_type.value} "
@@ -161,37 +208,37 @@ class WeatherSystem:
                 mass["temperature"] -= 5
 
             # Random variations
-            mass["temperature"] += random.uniform(-0.5, 0.5)
-            mass["humidity"] += random.uniform(-0.05, 0.05)
-            mass["pressure"] += random.uniform(-1, 1)
+            mass["temperature"] += self.rng.uniform(-0.5, 0.5)
+            mass["humidity"] += self.rng.uniform(-0.05, 0.05)
+            mass["pressure"] += self.rng.uniform(-1, 1)
 
             # Keep values within reasonable bounds
             mass["humidity"] = max(0.1, min(0.9, mass["humidity"]))
             mass["pressure"] = max(980, min(1040, mass["pressure"]))
 
-    def _update_weather_fronts(self):
-        """Update positions and properties of weather fronts."""
-        for front in self.weather_fronts:
-            # Move front
-            front["position"] = (
-                front["position"][0] + front["direction"][0] * front["speed"],
-                front["position"][1] + front["direction"][1] * front["speed"],
-            )
-
-            # Random intensity changes
-            front["intensity"] += random.uniform(-0.1, 0.1)
-            front["intensity"] = max(0.1, min(1.0, front["intensity"]))
-
-            # Random direction changes
-            if random.random() < 0.1:  # 10% chance to change direction
-                angle = random.uniform(-30, 30)
-                rad = math.radians(angle)
-                cos = math.cos(rad)
-                sin = math.sin(rad)
-                front["direction"] = (
-                    front["direction"][0] * cos - front["direction"][1] * sin,
-                    front["direction"][0] * sin + front["direction"][1] * cos,
-                )
+    def _update_weather_fronts(self, hours: float):
+        """Move the weather fronts and vary their intensity and heading."""
+        fronts = self.weather_fronts
+        count = len(fronts)
+
+        # Move along the heading; longitude wraps and high latitudes turn fronts back
+        distance = fronts.speed * hours / KM_PER_DEGREE
+        heading = np.radians(fronts.heading)
+        fronts.latitude += distance * np.cos(heading)
+        fronts.longitude += distance * np.sin(heading) / np.maximum(np.cos(np.radians(fronts.latitude)), 0.1)
+        fronts.longitude[:] = (fronts.longitude + 180.0) % 360.0 - 180.0
+        poleward = np.abs(fronts.latitude) > FRONT_MAX_LATITUDE
+        fronts.latitude[poleward] = np.sign(fronts.latitude[poleward]) * (
+            2 * FRONT_MAX_LATITUDE - np.abs(fronts.latitude[poleward]))
+        fronts.heading[poleward] = (180.0 - fronts.heading[poleward]) % 360.0
+
+        # Random intensity changes
+        fronts.intensity += self.rng.uniform(-0.1, 0.1, count)
+        np.clip(fronts.intensity, 0.1, 1.0, out=fronts.intensity)
+
+        # Random direction changes, 10% chance per front
+        turning = self.rng.random(count) < 0.1
+        fronts.heading[:] = (fronts.heading + turning * self.rng.uniform(-30, 30, count)) % 360.0
 
     def _update_temperature(self) -> None:
         """Update temperature based on season, time of day, and air masses."""
@@ -209,16 +256,12 @@ class WeatherSystem:
             air_mass_temp += mass["temperature"]
         air_mass_temp /= len(self.air_masses)
 
-        # Front influence
-        front_temp = 0
-        for front in self.weather_fronts:
-            if front["type"] == "cold":
-                front_temp -= 5 * front["intensity"]
-            else:
-                front_temp += 3 * front["intensity"]
+        # Front influence, averaged over fronts
+        fronts = self.weather_fronts
+        front_temp = float(np.mean(np.where(fronts.cold, -5.0, 3.0) * fronts.intensity))
 
         # Random variation
-        random_variation = random.uniform(-2.0, 2.0)
+        random_variation = self.rng.uniform(-2.0, 2.0)
 
         # Combine all factors
         self.current_weather.temperature = (
@@ -259,7 +302,7 @@ class WeatherSystem:
                 1.0,
                 base_humidity * 0.4
                 + air_mass_humidity * 0.4
-                + random.uniform(-0.1, 0.1),
+                + self.rng.uniform(-0.1, 0.1),
             ),
         )
 
@@ -277,9 +320,7 @@ class WeatherSystem:
         pressure_gradient = abs(pressure_gradient - 1013.25) / 1013.25
 
         # Front influence
-        front_wind = 0
-        for front in self.weather_fronts:
-            front_wind += front["speed"] * front["intensity"]
+        front_wind = float(np.mean(self.weather_fronts.speed * self.weather_fronts.intensity))
 
         # Weather effects
         if self.current_weather.weather_type == WeatherType.THUNDERSTORM:
@@ -297,12 +338,12 @@ class WeatherSystem:
             base_wind
             + pressure_gradient * 20
             + front_wind * 0.5
-            + random.uniform(-5.0, 5.0),
+            + self.rng.uniform(-5.0, 5.0),
         )
 
         # Update wind direction
-        if random.random() < 0.1:  # 10% chance to change direction
-            self.current_weather.wind_direction = random.uniform(0, 360)
+        if self.rng.random() < 0.1:  # 10% chance to change direction
+            self.current_weather.wind_direction = self.rng.uniform(0, 360)
 
     def _update_pressure(self) -> None:
         """Update atmospheric pressure based on weather systems."""
@@ -329,7 +370,7 @@ class WeatherSystem:
             950,
             min(
                 1050,
-                base_pressure * 0.3 + air_mass_pressure * 0.7 + random.uniform(-2, 2),
+                base_pressure * 0.3 + air_mass_pressure * 0.7 + self.rng.uniform(-2, 2),
             ),
         )
 
@@ -382,7 +423,7 @@ class WeatherSystem:
             0.0,
             min(
                 1.0,
-                base_clouds * 0.6 + humidity_factor * 0.4 + random.uniform(-0.1, 0.1),
+                base_clouds * 0.6 + humidity_factor * 0.4 + self.rng.uniform(-0.1, 0.1),
             ),
         )
 
@@ -426,7 +467,7 @@ class WeatherSystem:
             0.0,
             min(
                 11.0,
-                base_uv + daily_variation - cloud_reduction + random.uniform(-0.5, 0.5),
+                base_uv + daily_variation - cloud_reduction + self.rng.uniform(-0.5, 0.5),
             ),
         )
 
@@ -506,14 +547,12 @@ class WeatherSystem:
             probabilities[WeatherType.HURRICANE] += 0.1
             probabilities[WeatherType.TORNADO] += 0.1
 
-        # Front influence
-        for front in self.weather_fronts:
-            if front["type"] == "cold":
-                probabilities[WeatherType.RAIN] += 0.1
-                probabilities[WeatherType.THUNDERSTORM] += 0.05
-            else:
-                probabilities[WeatherType.CLOUDY] += 0.1
-                probabilities[WeatherType.FOG] += 0.05
+        # Front influence, by the share of cold and warm fronts
+        cold_share = float(np.mean(self.weather_fronts.cold))
+        probabilities[WeatherType.RAIN] += 0.1 * cold_share
+        probabilities[WeatherType.THUNDERSTORM] += 0.05 * cold_share
+        probabilities[WeatherType.CLOUDY] += 0.1 * (1 - cold_share)
+        probabilities[WeatherType.FOG] += 0.05 * (1 - cold_share)
 
         # Normalize probabilities
         total = sum(probabilities.values())
@@ -522,12 +561,115 @@ class WeatherSystem:
         # Select weather type
         weather_types = list(probabilities.keys())
         weights = list(probabilities.values())
-        self.current_weather.weather_type = random.choices(
-            weather_types, weights=weights
-        )[0]
+        self.current_weather.weather_type = self.rng.choice(weather_types, p=weights)
 
         # Update severity
-        self.current_weather.severity = random.random()
+        self.current_weather.severity = self.rng.random()
+
+    def update_fields(self, time_delta: float = 0.0) -> None:
+        """Recompute the local weather rasters from climate, air masses and fronts.
+
+        Scheduled separately from :meth:`update`, since fronts barely move in one tick.
+
+        Each front stamps a Gaussian footprint onto the grid. Footprints are separable,
+        with longitude distances scaled at the front's own latitude, so stamping every
+        front onto every field is one small matrix product.
+        """
+        fronts = self.weather_fronts
+        climate = self.world.climate
+
+        # Footprint factors per front along each axis, shapes (fronts, n_lon) and (fronts, n_lat)
+        radius = fronts.radius[:, None]
+        lon_offset = (self.grid.longitudes[None, :] - fronts.longitude[:, None] + 180.0) % 360.0 - 180.0
+        lon_offset *= np.maximum(np.cos(np.radians(fronts.latitude)), 0.1)[:, None]
+        lon_factor = np.exp(-0.5 * (lon_offset / radius) ** 2)
+        lat_factor = np.exp(-0.5 * ((self.grid.latitudes[None, :] - fronts.latitude[:, None]) / radius) ** 2)
+
+        # Per-front amplitude of each field, stamped onto the grid in one product
+        heading = np.radians(fronts.heading)
+        drift = 0.5 * fronts.speed * fronts.intensity
+        amplitudes = np.stack([
+            np.where(fronts.cold, -5.0, 3.0) * fronts.intensity,  # temperature, Celsius
+            0.2 * fronts.intensity,  # humidity
+            -12.0 * fronts.intensity,  # pressure, hPa
+            np.where(fronts.cold, 6.0, 3.0) * fronts.intensity,  # precipitation, mm/h
+            np.where(fronts.cold, 0.6, 0.8) * fronts.intensity,  # cloud cover
+            drift * np.sin(heading),  # eastward wind, km/h
+            drift * np.cos(heading),  # northward wind, km/h
+        ])
+        stamps = np.matmul(lon_factor.T.astype(np.float32),
+                           (amplitudes[:, :, None] * lat_factor[None, :, :]).astype(np.float32))
+        temperature, humidity, pressure, precipitation, cloud_cover, wind_east, wind_north = stamps
+
+        # Air masses set humidity and pressure by latitude band
+        masses = [self.air_masses[name] for name in AIR_MASS_LATITUDES]
+        row_humidity = self._air_mass_weights @ np.array([mass["humidity"] for mass in masses])
+        row_pressure = self._air_mass_weights @ np.array([mass["pressure"] for mass in masses])
+
+        self.temperature_map[:] = climate.temperature_map + temperature
+        np.clip(row_humidity[None, :] + humidity, 0.0, 1.0, out=self.humidity_map)
+        self.pressure_map[:] = row_pressure[None, :] + pressure
+        self.precipitation_map[:] = precipitation * (0.5 + self.humidity_map)
+        np.clip(0.5 * self.humidity_map + cloud_cover, 0.0, 1.0, out=self.cloud_cover_map)
+
+        # Climate winds (m/s, the way the air moves) plus the drag of passing fronts
+        if self._climate_wind_time != climate.current_time:
+            climate_heading = np.radians(climate.wind_direction_map)
+            self._climate_wind = (3.6 * climate.wind_speed_map * np.sin(climate_heading),
+                                  3.6 * climate.wind_speed_map * np.cos(climate_heading))
+            self._climate_wind_time = climate.current_time
+        np.add(wind_east, self._climate_wind[0], out=self.wind_east_map)
+        np.add(wind_north, self._climate_wind[1], out=self.wind_north_map)
+        np.hypot(self.wind_east_map, self.wind_north_map, out=self.wind_speed_map)
+
+        # Classify each cell
+        precipitation = self.precipitation_map
+        freezing = self.temperature_map < 0
+        self.weather_map[:] = np.select(
+            [
+                freezing & (precipitation > 3.0),
+                freezing & (precipitation > 0.5),
+                precipitation > 5.0,
+                precipitation > 3.0,
+                precipitation > 0.5,
+                self.wind_speed_map > 62.0,  # Gale force
+                (self.humidity_map > 0.9) & (self.wind_speed_map < 10.0),
+                self.cloud_cover_map > 0.7,
+                self.cloud_cover_map > 0.4,
+            ],
+            [
+                WEATHER_TYPE_CODES[WeatherType.HEAVY_SNOW],
+                WEATHER_TYPE_CODES[WeatherType.SNOW],
+                WEATHER_TYPE_CODES[WeatherType.THUNDERSTORM],
+                WEATHER_TYPE_CODES[WeatherType.HEAVY_RAIN],
+                WEATHER_TYPE_CODES[WeatherType.RAIN],
+                WEATHER_TYPE_CODES[WeatherType.WINDY],
+                WEATHER_TYPE_CODES[WeatherType.FOG],
+                WEATHER_TYPE_CODES[WeatherType.CLOUDY],
+                WEATHER_TYPE_CODES[WeatherType.PARTLY_CLOUDY],
+            ],
+            WEATHER_TYPE_CODES[WeatherType.CLEAR],
+        )
+
+    def get_weather_at(self, longitude: float, latitude: float) -> Dict:
+        """Get local weather from the cell nearest a coordinate, clamped into the grid."""
+        cell = self.grid.index(longitude, latitude)
+        if cell is None:
+            i, j, _ = self.grid.indices(longitude, latitude)
+            cell = int(i), int(j)
+        precipitation = float(self.precipitation_map[cell])
+        wind_speed = float(self.wind_speed_map[cell])
+        return {
+            "type": WEATHER_TYPES[self.weather_map[cell]],
+            "intensity": min(1.0, max(precipitation / 5.0, wind_speed / 100.0)),
+            "temperature": float(self.temperature_map[cell]),
+            "humidity": float(self.humidity_map[cell]),
+            "wind_speed": wind_speed,
+            "wind_direction": math.degrees(math.atan2(self.wind_east_map[cell], self.wind_north_map[cell])) % 360.0,
+            "precipitation": precipitation,
+            "cloud_cover": float(self.cloud_cover_map[cell]),
+            "pressure": float(self.pressure_map[cell]),
+        }
 
     def get_weather_effects(self) -> Dict[str, float]:
         """Get effects of current weather on various systems."""
@@ -601,37 +743,81 @@ class WeatherSystem:
             "season": self.season,
             "day_length": self.day_length,
             "time_of_day": self.time_of_day,
+            "fronts": [
+                {
+                    "type": "cold" if cold else "warm",
+                    "position": (longitude, latitude),
+                    "heading": heading,
+                    "speed": speed,
+                    "intensity": intensity,
+                }
+                for cold, longitude, latitude, heading, speed, intensity in zip(
+                    self.weather_fronts.cold.tolist(), self.weather_fronts.longitude.tolist(),
+                    self.weather_fronts.latitude.tolist(), self.weather_fronts.heading.tolist(),
+                    self.weather_fronts.speed.tolist(), self.weather_fronts.intensity.tolist())
+            ],
             "effects": self.get_weather_effects(),
         }
 
+    def get_history(self, start: float, end: Optional[float] = None, resolution: Optional[str] = None) -> Dict:
+        """Get recorded weather between two simulation times as JSON-ready lists.
+
+        ``resolution`` names a tier ('sample', 'minute', 'hour' or 'day'); by default the
+        finest tier that still reaches back to ``start`` is used.
+        """
+        tier, columns = self.weather_history.query(start, np.inf if end is None else end, resolution)
+        history = {name: values.tolist() for name, values in columns.items() if name != 'category'}
+        history['weather_type'] = [WEATHER_TYPES[code].value for code in columns['category'].tolist()]
+        history['resolution'] = tier
+        return history
+
     def get_forecast(self, hours_ahead: int = 24) -> List[WeatherState]:
-        """Get weather forecast for the next N hours."""
-        forecast = []
-        current = self.current_weather
-
-        for _ in range(hours_ahead):
-            # Create a copy of current weather
-            next_weather = WeatherState(
-                temperature=current.temperature,
-                humidity=current.humidity,
-                wind_speed=current.wind_speed,
-                wind_direction=current.wind_direction,
-                precipitation=current.precipitation,
-                cloud_cover=current.cloud_cover,
-                weather_type=current.weather_type,
-                severity=current.severity,
-                pressure=current.pressure,
-                visibility=current.visibility,
-                uv_index=current.uv_index,
-            )
-
-            # Apply some random changes
-            next_weather.temperature += random.uniform(-1.0, 1.0)
-            next_weather.humidity += random.uniform(-0.1, 0.1)
-            next_weather.wind_speed += random.uniform(-2.0, 2.0)
-            next_weather.pressure += random.uniform(-1.0, 1.0)
-
-            forecast.append(next_weather)
-            current = next_weather
-
-        return forecast
+        """Get weather forecast for the next N hours, as the ensemble mean of each hour."""
+        ensemble = self.get_forecast_ensemble(hours_ahead)
+        return [
+            replace(self.current_weather, **{name: float(ensemble[name]['mean'][hour]) for name in FORECAST_STEPS})
+            for hour in range(hours_ahead)
+        ]
+
+    def get_forecast_ensemble(self, hours_ahead: int = 24, members: int = FORECAST_MEMBERS,
+                              quantiles: Tuple[float, ...] = FORECAST_QUANTILES) -> Dict:
+        """Get a Monte Carlo forecast of the next N hours, cached until the next weather update.
+
+        Returns 'hours' (1..N), 'members', 'quantiles' and, per variable in FORECAST_STEPS,
+        {'mean': (N,), 'bands': (len(quantiles), N)}. The arrays are shared and read-only.
+        """
+        key = (hours_ahead, members, tuple(quantiles))
+        ensemble = self._forecast_cache.get(key)
+        if ensemble is None:
+            ensemble = self._forecast_cache[key] = self._simulate_forecast(hours_ahead, members, quantiles)
+        return ensemble
+
+    def _simulate_forecast(self, hours_ahead: int, members: int, quantiles: Tuple[float, ...]) -> Dict:
+        """Simulate every member's hourly random walk at once and summarize it per hour."""
+        weather = self.current_weather
+        start = np.array([getattr(weather, name) for name in FORECAST_STEPS])
+        steps = np.array(list(FORECAST_STEPS.values()))
+
+        # Hourly changes of each variable for every member, shape (variables, members, hours)
+        changes = self.forecast_rng.uniform(-1.0, 1.0, (len(steps), members, hours_ahead)) * steps[:, None, None]
+        trajectories = start[:, None, None] + np.cumsum(changes, axis=2)
+        temperature, humidity, wind_speed, pressure = trajectories
+
+        # Expected daily temperature swing, as in _update_temperature
+        hours = np.arange(1, hours_ahead + 1)
+        time_of_day = (self.time_of_day + hours) % 24
+        temperature += 10.0 * (np.sin(np.pi * (time_of_day - 6) / 12) - math.sin(math.pi * (self.time_of_day - 6) / 12))
+
+        # Keep values within reasonable bounds
+        np.clip(humidity, 0.0, 1.0, out=humidity)
+        np.maximum(wind_speed, 0.0, out=wind_speed)
+        np.clip(pressure, 950, 1050, out=pressure)
+
+        mean = trajectories.mean(axis=1)
+        bands = np.quantile(trajectories, quantiles, axis=1)
+        ensemble = {'hours': hours, 'members': members, 'quantiles': np.array(quantiles)}
+        for i, name in enumerate(FORECAST_STEPS):
+            ensemble[name] = {'mean': mean[i], 'bands': bands[:, i]}
+        for array in (hours, ensemble['quantiles'], mean, bands):
+            array.flags.writeable = False
+        return ensemble
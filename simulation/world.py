@@ -1,5 +1,6 @@
 import os
 import json
+import tempfile
 import random
 import math
 import traceback
@@ -26,17 +27,55 @@ from .llm import AgentCognition
 from .marine import MarineSystem, Marine
 from .natural_disaster import NaturalDisasterSystem
 from .physics import PhysicsSystem
+from .profiler import TickProfiler
+from .scheduler import SystemScheduler
+from .rng import RandomService
+from .grid import RasterGrid
+from .worldgen import WorldArtifactCache
+from .lod import LODConfig, TerrainLOD
+from .keyframes import ClimateKeyframes, KeyframeConfig
+from .solar import SolarTables
+from .spatial import KM_PER_DEGREE
 
 # Utility imports
 from .utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Ticks between updates for each system; a system run less often than every tick
+# receives the dt accumulated since its last run, so its update must give the same
+# result for one call with dt=n as for n calls with dt=1 (compounding as ``r ** dt``,
+# noise scaled by ``sqrt(dt)``), or recompute its state without using dt.
+# Systems with fixed per-call terms stay on every tick.
+SYSTEM_UPDATE_PERIODS = {
+    'terrain': 60,
+    'terrain_lod': 10,
+    'climate': 60,
+    'resources': 10,
+    'plants': 1,
+    'animals': 1,
+    'marine': 1,
+    'technology': 60,
+    'society': 60,
+    'transportation': 1,
+    'weather': 1,
+    'weather_fields': 10,
+    'disasters': 10,
+    'physics': 1,
+    'environment': 1,
+    'agents': 1,
+}
+
 @dataclass
 class World:
     @classmethod
-    def load_from_save(cls, logger):
-        """Load the most recent world state from disk."""
+    def load_from_save(cls, logger, use_redis: bool = True, seed: Optional[int] = None,
+                       resolution: Optional[float] = None, lod: Optional[LODConfig] = None,
+                       climate_keyframes: Optional[KeyframeConfig] = None):
+        """Load the most recent world state from disk.
+
+        The saved grid resolution is used unless ``resolution`` is given.
+        """
         save_dir = os.path.join('simulation_saves', 'current_world')
         world_state_path = os.path.join(save_dir, 'world_state.json')
         if not os.path.exists(world_state_path):
@@ -46,7 +85,10 @@ class World:
             with open(world_state_path, 'r') as f:
                 world_state = json.load(f)
             # Create new world instance
-            world = cls(logger)
+            if resolution is None:
+                resolution = world_state.get('resolution', 1.0)
+            world = cls(logger, use_redis=use_redis, seed=seed, resolution=resolution, lod=lod,
+                        climate_keyframes=climate_keyframes, world_seed=world_state.get('world_seed'))
             # Restore world state
             world.current_tick = world_state['current_tick']
             world.game_time = datetime.fromisoformat(world_state['game_time'])
@@ -76,7 +118,7 @@ class World:
                         world=world,
                         logger=logger
                     )
-                    world.agents.agents[agent_id] = agent
+                    world.agents.add_agent(agent)
             logger.info(f"Loaded world state from tick {world.current_tick}")
             return world
         except Exception as e:
@@ -84,8 +126,18 @@ class World:
             logger.error(traceback.format_exc())
             return None
 
-    def __init__(self, logger):
-        """Initialize a new world."""
+    def __init__(self, logger, use_redis: bool = True, seed: Optional[int] = None, resolution: float = 1.0,
+                 lod: Optional[LODConfig] = None, climate_keyframes: Optional[KeyframeConfig] = None,
+                 world_seed: Optional[int] = None):
+        """Initialize a new world with a grid of ``resolution`` degrees per cell.
+
+        ``world_seed`` fixes the generated terrain and resources and defaults to ``seed``.
+        Without either, the world seed of the last such boot is reused, so its generated
+        layers come from the worldgen cache while the run itself is freshly seeded.
+        With an ``lod`` config, terrain is refined further around agents, settlements
+        and registered regions of interest. With ``climate_keyframes``, climate is
+        computed at keyframes on a worker thread and interpolated in between.
+        """
         self.logger = logger
         # Set world coordinates to match real Earth dimensions
         self.min_longitude = -180
@@ -97,8 +149,8 @@ class World:
         self.width = self.max_longitude - self.min_longitude
         self.height = self.max_latitude - self.min_latitude
 
-        self.longitude_resolution = 1.0
-        self.latitude_resolution = 1.0
+        self.longitude_resolution = resolution
+        self.latitude_resolution = resolution
         self.simulation_time = 0
         self.current_tick = 0
         self.game_time = datetime.now()
@@ -106,6 +158,18 @@ class World:
         self.game_time_start = datetime.now()
         # 48 game seconds pass per real second (1 day every 30 minutes)
         self.time_scale = 48.0
+        # Per-system tick timings; the budget is the wall-clock time one tick may take
+        self.profiler = TickProfiler(budget=1.0 / self.time_scale)
+        # Seeded per-system random streams; the global RNGs are pinned to the same seed
+        worldgen_dir = os.path.join("simulation_saves", "worldgen")
+        if world_seed is None and seed is None:
+            world_seed = WorldArtifactCache.last_seed(worldgen_dir)
+        self.rng = RandomService(seed, world_seed=world_seed)
+        # Also for a drawn seed, so code still on the global RNGs replays from the logged seed
+        self.rng.seed_globals()
+        if world_seed is None and seed is None:
+            # First unseeded boot: keep its drawn seed as the world later boots reuse
+            WorldArtifactCache.remember_seed(worldgen_dir, self.rng.world_seed)
         self.day = 1
         self.year = 1
         self.running = False
@@ -122,18 +186,33 @@ class World:
         os.makedirs(os.path.join(self.save_dir, "current_world"), exist_ok=True)
         logger.info(f"Initialized save directories: {self.save_dir} and {self.db_dir}")
 
+        # Grids finer than 1° keep their layers in memory-mapped files, removed with the world
+        self.raster_dir = None
+        if resolution < 1.0:
+            self._raster_scratch = tempfile.TemporaryDirectory(prefix="rasters-", dir=self.save_dir)
+            self.raster_dir = self._raster_scratch.name
+            logger.info(f"Memory-mapping {resolution:g}° rasters under {self.raster_dir}")
+
+        # Generated terrain layers are reused across boots of the same world seed
+        self.worldgen_cache = WorldArtifactCache(worldgen_dir, self.rng.world_seed, RasterGrid.from_world(self))
+
         # Initialize Redis client for world state persistence
-        redis_host = os.getenv("REDIS_HOST", "localhost")
-        redis_port = int(os.getenv("REDIS_PORT", "6379"))
-        try:
-            self.redis = redis.Redis(host=redis_host, port=redis_port, db=0, decode_responses=True)
-            # Test connection
-            self.redis.ping()
-            logger.info(f"Connected to Redis at {redis_host}:{redis_port}")
-        except Exception as e:
-            self.redis = None
-            logger.error(f"Failed to connect to Redis: {e}")
+        self.redis = None
+        if use_redis:
+            redis_host = os.getenv("REDIS_HOST", "localhost")
+            redis_port = int(os.getenv("REDIS_PORT", "6379"))
+            try:
+                self.redis = redis.Redis(host=redis_host, port=redis_port, db=0, decode_responses=True)
+                # Test connection
+                self.redis.ping()
+                logger.info(f"Connected to Redis at {redis_host}:{redis_port}")
+            except Exception as e:
+                self.redis = None
+                logger.error(f"Failed to connect to Redis: {e}")
         
+        # Day length, insolation and seasonal factors per 1° latitude row and day of year
+        self.solar = SolarTables(RasterGrid(-180.0, 180.0, -90.0, 90.0, 1.0, 1.0))
+
         # Initialize systems in dependency order
         self.climate = ClimateSystem(self)
         self.terrain = TerrainSystem(self)
@@ -150,8 +229,40 @@ class World:
         self.environment = EnvironmentalSystem(self)
         self.agents = AgentSystem(self)
         self.discovery = DiscoverySystem(self)
+        if lod is not None:
+            self.terrain.lod = TerrainLOD(self, lod)
+        if climate_keyframes is not None:
+            self.climate.keyframes = ClimateKeyframes(self.climate, climate_keyframes)
+
+        # Multi-rate update schedule, in dependency order
+        self.scheduler = SystemScheduler(self.profiler)
+        self._register_systems()
         
         logger.info("World initialized successfully")
+
+    def _register_systems(self):
+        """Register system updates with the scheduler."""
+        systems = (
+            ('terrain', self.terrain.update),
+            ('climate', self.climate.update),
+            ('resources', self.resources.update),
+            ('plants', lambda dt: self.plants.update(self.simulation_time, self.get_world_state())),
+            ('animals', self.animals.update),
+            ('marine', self.marine.update),
+            ('technology', self.technology.update),
+            ('society', self.society.update),
+            ('transportation', self.transportation.update),
+            ('weather', self.weather.update),
+            ('weather_fields', self.weather.update_fields),
+            ('disasters', self.disasters.update),
+            ('physics', self.physics.update),
+            ('environment', self.environment.update),
+            ('agents', self.agents.update),
+        )
+        if self.terrain.lod is not None:
+            systems = systems[:1] + (('terrain_lod', self.terrain.lod.update),) + systems[1:]
+        for name, update in systems:
+            self.scheduler.register(name, update, SYSTEM_UPDATE_PERIODS.get(name, 1))
         
     def _initialize_world(self):
         """Initialize all world systems."""
@@ -332,31 +443,20 @@ class World:
             self.day += 1
             self.logger.info(f"New day in game: Day {self.day}")
         
-        # Update all systems with the new time delta (1 second)
-        self.terrain.update(1)
-        self.climate.update(1)
-        self.resources.update(1)
-        self.plants.update(self.simulation_time, self.get_world_state())
-        self.animals.update(1)
-        self.marine.update(1)
-        self.technology.update(1)
-        self.society.update(1)
-        self.transportation.update(1)
-        self.weather.update(1)
-        self.disasters.update(1)
-        self.physics.update(1)
-        self.environment.update(1)
-        self.agents.update(1)
-
-        # Persist world state to Redis for frontend consumption
-        if self.redis:
-            try:
-                self.redis.set('world_state', json.dumps(self.get_world_state()))
-            except Exception as e:
-                self.logger.error(f"Failed to update Redis state: {e}")
-        
-        # Save state every 1000 ticks
-        if self.current_tick % 1000 == 0:
+        with self.profiler.section('tick'):
+            # Run the systems that are due with their accumulated time delta
+            self.scheduler.tick(1)
+
+            # Persist world state to Redis for frontend consumption
+            if self.redis:
+                with self.profiler.section('redis_publish'):
+                    try:
+                        self.redis.set('world_state', json.dumps(self.get_world_state()))
+                    except Exception as e:
+                        self.logger.error(f"Failed to update Redis state: {e}")
+
+            # Save state every 1000 ticks
+            if self.current_tick % 1000 == 0:
                 self._save_state()
         
     def get_world_state(self) -> Dict:
@@ -507,7 +607,7 @@ class World:
         logger.info("Verifying world initialization...")
         
         # Verify terrain system
-        if not hasattr(self.terrain, 'terrain_data') or not self.terrain.terrain_data:
+        if not hasattr(self.terrain, 'terrain_type_map') or not self.terrain.terrain_type_map.size:
             logger.error("Terrain system not properly initialized")
             return False
             
@@ -614,8 +714,8 @@ class World:
         # At the equator, 1 degree of longitude = 111.32 km
         # At other latitudes, multiply by cos(latitude)
         lat_rad = math.radians(latitude)
-        lon_size = 111.32 * math.cos(lat_rad)  # km per degree of longitude
-        lat_size = 111.32  # km per degree of latitude
+        lon_size = 111.32 * math.cos(lat_rad) * self.longitude_resolution  # km per tile of longitude
+        lat_size = 111.32 * self.latitude_resolution  # km per tile of latitude
         
         return (lon_size, lat_size)
 
@@ -855,16 +955,14 @@ class World:
             agent.position = (new_x, new_y)
             self.explored_areas.add((new_x, new_y))
             
-            # Generate resources at new location if needed
-            terrain = self.environment.get_terrain_at(new_x, new_y)
-            if (new_x, new_y) not in self.resources.resources:
-                self.resources.generate_resources(new_x, new_y, terrain.value)
+            # Keep the resources of the explored cell resident
+            self.resources.mark_explored(new_x, new_y)
             
             self.log_event("agent_moved", {
                 "agent_id": agent.id,
                 "from": agent.position,
                 "to": (new_x, new_y),
-                "terrain": terrain.value
+                "terrain": self.environment.get_terrain_at(new_x, new_y).value
             })
             
         elif action["type"] == "gather":
@@ -946,7 +1044,7 @@ class World:
         if self.agents.get_agent(agent_id):
             # Save final state before removal
             self.save_agent_data(agent_id)
-            self.agents.agents.pop(agent_id, None)
+            self.agents.remove_agent(agent_id)
             
         self.log_event("agent_death", {"agent_id": agent_id})
 
@@ -1161,7 +1259,8 @@ class World:
             "time": self.game_time.isoformat(),
             "world_size": (self.environment.width, self.environment.height),
             "explored_area": self._get_explored_area(agent.position),
-            "nearby_resources": {f"{lon},{lat}": resources for (lon, lat), resources in self.environment.get_nearby_resources(*agent.position, radius=5).items()},
+            # Resource radius is in km; 5 degrees of latitude, the reach this used to have
+            "nearby_resources": self.resources.get_nearby_resources(*agent.position, radius=5 * KM_PER_DEGREE),
             "nearby_climate": {f"{lon},{lat}": climate for (lon, lat), climate in self.environment.get_nearby_climate(*agent.position, radius=5).items()},
             "weather": self.environment.get_weather_at(*agent.position),
             "climate": self.environment.get_climate_at(*agent.position),
@@ -1382,52 +1481,55 @@ class World:
 
     def _save_state(self):
         """Save the current world state to disk."""
-        try:
-            # Ensure save directory exists
-            save_dir = os.path.join('simulation_saves', 'current_world')
-            os.makedirs(save_dir, exist_ok=True)
+        with self.profiler.section('save_state'):
+            try:
+                # Ensure save directory exists
+                save_dir = os.path.join('simulation_saves', 'current_world')
+                os.makedirs(save_dir, exist_ok=True)
             
-            # Save world state
-            world_state = {
-                'current_tick': self.current_tick,
-                'game_time': self.game_time.isoformat(),
-                'simulation_time': self.simulation_time,
-                'day': self.day,
-                'year': self.year,
-                'events': self.events[-100:]  # Keep last 100 events
-            }
+                # Save world state
+                world_state = {
+                    'current_tick': self.current_tick,
+                    'game_time': self.game_time.isoformat(),
+                    'simulation_time': self.simulation_time,
+                    'day': self.day,
+                    'year': self.year,
+                    'resolution': self.longitude_resolution,
+                    'world_seed': self.rng.world_seed,
+                    'events': self.events[-100:]  # Keep last 100 events
+                }
             
-            # Save world state
-            with open(os.path.join(save_dir, 'world_state.json'), 'w') as f:
-                json.dump(world_state, f, indent=2)
+                # Save world state
+                with open(os.path.join(save_dir, 'world_state.json'), 'w') as f:
+                    json.dump(world_state, f, indent=2)
             
-            # Save agent states
-            agent_states = {}
-            for agent_id, agent in self.agents.agents.items():
-                agent_states[str(agent_id)] = {
-                    'id': agent.id,
-                    'name': agent.name,
-                    'position': agent.position,
-                    'health': agent.health,
-                    'energy': agent.energy,
-                    'hunger': agent.hunger,
-                    'thirst': agent.thirst,
-                    'age': agent.age,
-                    'skills': agent.skills,
-                    'inventory': agent.inventory,
-                    'last_action': agent.last_action
-                }
+                # Save agent states
+                agent_states = {}
+                for agent_id, agent in self.agents.agents.items():
+                    agent_states[str(agent_id)] = {
+                        'id': agent.id,
+                        'name': agent.name,
+                        'position': agent.position,
+                        'health': agent.health,
+                        'energy': agent.energy,
+                        'hunger': agent.hunger,
+                        'thirst': agent.thirst,
+                        'age': agent.age,
+                        'skills': dict(agent.skills),
+                        'inventory': agent.inventory,
+                        'last_action': agent.last_action
+                    }
             
-            with open(os.path.join(save_dir, 'agents.json'), 'w') as f:
-                json.dump(agent_states, f, indent=2)
+                with open(os.path.join(save_dir, 'agents.json'), 'w') as f:
+                    json.dump(agent_states, f, indent=2)
             
-            self.logger.info(f"Saved world state at tick {self.current_tick}")
-            return True
+                self.logger.info(f"Saved world state at tick {self.current_tick}")
+                return True
             
-        except Exception as e:
-            self.logger.error(f"Error saving world state: {e}")
-            self.logger.error(traceback.format_exc())
-            return False
+            except Exception as e:
+                self.logger.error(f"Error saving world state: {e}")
+                self.logger.error(traceback.format_exc())
+                return False
 
     def _load_state(self):
         """Load the most recent world state from disk."""
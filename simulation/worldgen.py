@@ -0,0 +1,100 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, Optional
+import numpy as np
+from .grid import RasterGrid
+from .utils.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Bump whenever generation output changes so stale artifacts are regenerated
+WORLDGEN_VERSION = 1
+# File under the cache root holding the world seed of the last unseeded boot
+LAST_SEED_FILE = 'last_seed'
+
+
+class WorldArtifactCache:
+    """Generated world layers on disk, keyed by seed, resolution and generator version.
+
+    Each layer is a separate ``.npy`` file loaded memory-mapped copy-on-write, so a
+    boot only pages in what it touches and in-place edits never reach the artifact.
+    """
+
+    def __init__(self, root: str, seed: int, grid: RasterGrid, version: int = WORLDGEN_VERSION):
+        self.root = root
+        self.seed = seed
+        self.grid = grid
+        self.version = version
+        self.path = os.path.join(root, self.key)
+
+    @staticmethod
+    def last_seed(root: str) -> Optional[int]:
+        """World seed remembered by :meth:`remember_seed`, or None if there is none."""
+        path = os.path.join(root, LAST_SEED_FILE)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                return int(f.read().strip())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable world seed at {path}: {e}")
+            return None
+
+    @staticmethod
+    def remember_seed(root: str, seed: int) -> None:
+        """Keep a world seed so unseeded boots can reuse its world and artifacts."""
+        path = os.path.join(root, LAST_SEED_FILE)
+        try:
+            os.makedirs(root, exist_ok=True)
+            with open(path, 'w') as f:
+                f.write(str(seed))
+        except OSError as e:
+            logger.warning(f"Could not remember world seed at {path}: {e}")
+
+    @property
+    def key(self) -> str:
+        """Directory name identifying this world."""
+        grid = self.grid
+        return (f"v{self.version}-seed{self.seed}-{grid.longitude_resolution:g}x{grid.latitude_resolution:g}"
+                f"-{grid.shape[0]}x{grid.shape[1]}")
+
+    def load(self, name: str) -> Optional[Dict[str, np.ndarray]]:
+        """Load a system's layers, or None if no complete artifact exists."""
+        directory = os.path.join(self.path, name)
+        manifest_path = os.path.join(directory, 'manifest.json')
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path, 'r') as f:
+                manifest = json.load(f)
+            layers = {
+                layer: np.load(os.path.join(directory, f"{layer}.npy"), mmap_mode='c')
+                for layer in manifest['layers']
+            }
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable {name} artifact at {directory}: {e}")
+            return None
+        logger.info(f"Loaded {name} layers from {directory}")
+        return layers
+
+    def save(self, name: str, layers: Dict[str, np.ndarray]) -> None:
+        """Save a system's layers; the manifest is written last and marks the artifact complete."""
+        directory = os.path.join(self.path, name)
+        try:
+            os.makedirs(directory, exist_ok=True)
+            for layer, array in layers.items():
+                np.save(os.path.join(directory, f"{layer}.npy"), np.ascontiguousarray(array))
+            manifest = {
+                'version': self.version,
+                'seed': self.seed,
+                'shape': list(self.grid.shape),
+                'layers': sorted(layers),
+                'created': datetime.now().isoformat()
+            }
+            with open(os.path.join(directory, 'manifest.json'), 'w') as f:
+                json.dump(manifest, f, indent=2)
+        except OSError as e:
+            logger.warning(f"Could not save {name} artifact to {directory}: {e}")
+            return
+        logger.info(f"Saved {name} layers to {directory}")